@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from types import TracebackType
+
+from application import etl_metrics
+from core.config import config
+from domain.news.entities import Article
+from domain.news.protocols import ArticleRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleBatchWriter:
+    """
+    Buffers extracted articles and persists them with
+    `ArticleRepository.save_many`, flushing once the buffer reaches
+    `batch_size` or every `flush_interval_seconds`, whichever comes first.
+    `on_saved` is called with every batch that was stored successfully and
+    `on_failed` with every batch that was not.
+    """
+
+    def __init__(
+        self,
+        repository: ArticleRepository,
+        batch_size: int | None = None,
+        flush_interval_seconds: float | None = None,
+        on_saved: Callable[[list[Article]], None] | None = None,
+        on_failed: Callable[[list[Article]], None] | None = None,
+    ) -> None:
+        self._repository = repository
+        self._batch_size = batch_size or config.etl_write_batch_size
+        self._flush_interval_seconds = (
+            flush_interval_seconds or config.etl_write_flush_interval_seconds
+        )
+        self._on_saved = on_saved
+        self._on_failed = on_failed
+        self._buffer: list[Article] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> ArticleBatchWriter:
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush()
+
+    async def add(self, article: Article) -> None:
+        self._buffer.append(article)
+        if len(self._buffer) >= self._batch_size:
+            await self.flush()
+
+    async def flush(self) -> list[int]:
+        async with self._flush_lock:
+            if not self._buffer:
+                return []
+
+            batch, self._buffer = self._buffer, []
+            try:
+                with etl_metrics.write_seconds.time():
+                    ids = await self._repository.save_many(batch)
+            except Exception as e:
+                etl_metrics.record_error("write", e)
+                logger.exception("Error saving batch of %d articles", len(batch))
+                if self._on_failed is not None:
+                    self._on_failed(batch)
+                return []
+
+            etl_metrics.articles_written_total.inc(len(ids))
+            if self._on_saved is not None:
+                self._on_saved(batch)
+            return ids
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_seconds)
+            await self.flush()
@@ -0,0 +1,18 @@
+from fastapi import FastAPI, Response
+
+from core.config import config
+from core.utils.metrics import MetricsRegistry, metrics_registry
+
+
+def register_metrics_endpoint(
+    app: FastAPI,
+    registry: MetricsRegistry = metrics_registry,
+    path: str = config.metrics_path,
+) -> None:
+    """
+    Serves the metrics of `registry` for Prometheus to scrape.
+    """
+
+    @app.get(path, include_in_schema=False)
+    def metrics() -> Response:
+        return Response(content=registry.render(), media_type=registry.content_type)
@@ -1,10 +1,72 @@
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import List
-from domain.news.protocols import NewsSource, ContentExtractor, ArticleRepository
+from urllib.parse import urlparse
+
+from application import etl_metrics
+from application.article_batch_writer import ArticleBatchWriter
+from application.near_duplicate_index import NearDuplicateIndex
+from core.config import config
+from domain.news.entities import Article, FetchedPage, NewsItem
+from domain.news.protocols import (
+    ArticleRepository,
+    ContentExtractor,
+    NewsSource,
+    StagedContentExtractor,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _EndOfStage:
+    """
+    Queue marker telling a stage worker that its upstream stage is done.
+    """
+
+
+_END_OF_STAGE = _EndOfStage()
+
+
+@dataclass
+class _Discovery:
+    source_link: str
+    items: list[NewsItem]
+
+
+@dataclass
+class _SourceItem:
+    item: NewsItem
+    source_semaphore: asyncio.Semaphore
+
+
+@dataclass
+class _RunStats:
+    new_items: int = 0
+    discovery_errors: list[Exception] = field(default_factory=list)
 
 
 class ETLManager:
     """
     Coordinates the ETL process: Source -> Extractor -> Repository.
+
+    Every run is a pipeline of stages connected by bounded queues:
+
+        discovery -> dedup -> fetch -> parse -> write
+
+    Each stage has its own number of workers. Because the queues are
+    bounded, a slow downstream stage blocks the upstream ones instead of
+    letting discovered items pile up in memory, while network-bound fetching
+    and CPU-bound parsing of different items overlap. Fetch concurrency is
+    also bounded globally, per source and per host so no host gets hammered,
+    without items of a busy host holding back those of idle ones.
+    Extractors that are not `StagedContentExtractor`s extract in the fetch
+    stage. With a `near_duplicate_index`, copies of an already seen story
+    are linked to it before they are written, and canonical articles whose
+    write fails are taken out of the index again. Stage latencies, item counts,
+    errors and queue depths are recorded in `application.etl_metrics`.
     """
 
     def __init__(
@@ -12,37 +74,341 @@ class ETLManager:
         sources: List[NewsSource],
         extractor: ContentExtractor,
         repository: ArticleRepository,
+        max_concurrency: int | None = None,
+        source_concurrency: int | None = None,
+        per_source_concurrency: int | None = None,
+        per_host_concurrency: int | None = None,
+        write_batch_size: int | None = None,
+        write_flush_interval_seconds: float | None = None,
+        near_duplicate_index: NearDuplicateIndex | None = None,
+        dedup_workers: int | None = None,
+        fetch_workers: int | None = None,
+        parse_workers: int | None = None,
+        queue_size: int | None = None,
     ):
         self.sources = sources
         self.extractor = extractor
         self.repository = repository
 
+        self._max_concurrency = max_concurrency or config.etl_max_concurrency
+        self._source_concurrency = source_concurrency or config.etl_source_concurrency
+        self._per_source_concurrency = (
+            per_source_concurrency or config.etl_per_source_concurrency
+        )
+        self._per_host_concurrency = (
+            per_host_concurrency or config.etl_per_host_concurrency
+        )
+        self._write_batch_size = write_batch_size
+        self._write_flush_interval_seconds = write_flush_interval_seconds
+        self._near_duplicate_index = near_duplicate_index
+        self._dedup_workers = dedup_workers or config.etl_dedup_workers
+        self._fetch_workers = fetch_workers or config.etl_fetch_workers
+        self._parse_workers = (
+            parse_workers or config.etl_parse_workers or os.cpu_count() or 1
+        )
+        self._queue_size = queue_size or config.etl_stage_queue_size
+        # The limits are shared by every run, so sources polled independently
+        # (e.g. by the poll scheduler) still respect them together.
+        self._sources_semaphore = asyncio.Semaphore(self._source_concurrency)
+        self._global_semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
     async def run(self):
         """
         Runs the ETL pipeline for all sources.
         """
-        for source in self.sources:
+        await self._run_pipeline(self.sources)
+
+    async def run_source(self, source: NewsSource) -> int:
+        """
+        Runs the ETL pipeline for a single source and returns how many
+        new (not yet stored) items it yielded. Raises the error of the
+        source when its discovery failed, so callers can tell a broken
+        source from an idle one.
+        """
+        stats = await self._run_pipeline([source])
+        if stats.discovery_errors:
+            raise stats.discovery_errors[0]
+
+        return stats.new_items
+
+    async def _run_pipeline(self, sources: list[NewsSource]) -> _RunStats:
+        stats = _RunStats()
+        discovered: asyncio.Queue = asyncio.Queue(self._queue_size)
+        to_fetch: asyncio.Queue = asyncio.Queue(self._queue_size)
+        to_parse: asyncio.Queue = asyncio.Queue(self._queue_size)
+        to_write: asyncio.Queue = asyncio.Queue(self._queue_size)
+
+        # Sources are known up front, so their queue is closed right away.
+        sources_queue: asyncio.Queue = asyncio.Queue()
+        for source in sources:
+            sources_queue.put_nowait(source)
+        for _ in range(self._source_concurrency):
+            sources_queue.put_nowait(_END_OF_STAGE)
+
+        async with ArticleBatchWriter(
+            self.repository,
+            batch_size=self._write_batch_size,
+            flush_interval_seconds=self._write_flush_interval_seconds,
+            on_saved=(
+                self._near_duplicate_index.add
+                if self._near_duplicate_index is not None
+                else None
+            ),
+            on_failed=(
+                self._near_duplicate_index.discard
+                if self._near_duplicate_index is not None
+                else None
+            ),
+        ) as writer:
             try:
-                # 1. Fetch News Items (Links)
-                items = await source.check_for_news()
-
-                for item in items:
-                    # 2. Check if already exists (Optimization)
-                    existing = await self.repository.get_by_url(item.url)
-                    if existing:
-                        continue
-
-                    # 3. Extract Content
-                    try:
-                        article = await self.extractor.extract(item)
-
-                        # 4. Save to Repository
-                        await self.repository.save(article)
-                    except NotImplementedError:
-                        # Skip extraction if not implemented (for now)
-                        print(f"Extraction not implemented for {item.url}")
-                    except Exception as e:
-                        print(f"Error processing {item.url}: {e}")
-
-            except Exception as source_error:
-                print(f"Error collecting from source: {source_error}")
+                async with asyncio.TaskGroup() as group:
+                    group.create_task(
+                        self._run_stage(
+                            "discover",
+                            self._source_concurrency,
+                            sources_queue,
+                            (discovered, self._dedup_workers),
+                            lambda source, output: self._discover(
+                                source, output, stats
+                            ),
+                        )
+                    )
+                    group.create_task(
+                        self._run_stage(
+                            "dedup",
+                            self._dedup_workers,
+                            discovered,
+                            (to_fetch, self._fetch_workers),
+                            lambda discovery, output: self._dedup(
+                                discovery, output, stats
+                            ),
+                        )
+                    )
+                    group.create_task(self._run_fetch_stage(to_fetch, to_parse))
+                    group.create_task(
+                        self._run_stage(
+                            "parse",
+                            self._parse_workers,
+                            to_parse,
+                            (to_write, 1),
+                            self._parse,
+                        )
+                    )
+                    group.create_task(
+                        self._run_stage(
+                            "write",
+                            1,
+                            to_write,
+                            None,
+                            lambda article, _output: writer.add(article),
+                        )
+                    )
+            except ExceptionGroup as errors:
+                # A failing stage cancels the others instead of leaving them
+                # waiting for end markers that will never come.
+                raise errors.exceptions[0] from None
+
+        return stats
+
+    async def _run_stage(
+        self,
+        stage: str,
+        workers: int,
+        input_queue: asyncio.Queue,
+        output: tuple[asyncio.Queue, int] | None,
+        handler: Callable[[object, asyncio.Queue], Awaitable[None]],
+    ) -> None:
+        """
+        Runs `workers` workers that pass every element of `input_queue` to
+        `handler` until they read an end marker, then sends one end marker
+        to each of the downstream workers.
+        """
+        output_queue = output[0] if output is not None else None
+
+        async def worker() -> None:
+            while True:
+                element = await input_queue.get()
+                etl_metrics.queue_depth.set(input_queue.qsize(), stage=stage)
+                if element is _END_OF_STAGE:
+                    return
+
+                await handler(element, output_queue)  # type: ignore[arg-type]
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(workers):
+                    group.create_task(worker())
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0] from None
+
+        if output is not None:
+            output_queue, downstream_workers = output
+            for _ in range(downstream_workers):
+                await output_queue.put(_END_OF_STAGE)
+
+    async def _discover(
+        self,
+        source: NewsSource,
+        output: asyncio.Queue,
+        stats: _RunStats,
+    ) -> None:
+        try:
+            # 1. Fetch News Items (Links)
+            async with self._sources_semaphore:
+                with etl_metrics.source_discovery_seconds.time(
+                    source=source.source_link
+                ):
+                    items = await source.check_for_news()
+        except Exception as source_error:
+            etl_metrics.record_error("discover", source_error)
+            logger.exception("Error collecting from source %s", source.source_link)
+            stats.discovery_errors.append(source_error)
+            return
+
+        etl_metrics.items_discovered_total.inc(len(items), source=source.source_link)
+        await output.put(_Discovery(source.source_link, items))
+
+    async def _dedup(
+        self,
+        discovery: _Discovery,
+        output: asyncio.Queue,
+        stats: _RunStats,
+    ) -> None:
+        try:
+            # 2. Keep only unknown items, checked in one round-trip per source
+            unknown_urls = await self.repository.filter_unknown_urls(
+                [item.url for item in discovery.items]
+            )
+        except Exception as repository_error:
+            etl_metrics.record_error("dedup", repository_error)
+            logger.exception("Error checking known urls of %s", discovery.source_link)
+            return
+
+        source_semaphore = asyncio.Semaphore(self._per_source_concurrency)
+        for item in discovery.items:
+            if item.url in unknown_urls:
+                stats.new_items += 1
+                etl_metrics.items_new_total.inc(source=discovery.source_link)
+                await output.put(_SourceItem(item, source_semaphore))
+
+    async def _run_fetch_stage(
+        self,
+        input_queue: asyncio.Queue,
+        output_queue: asyncio.Queue,
+    ) -> None:
+        """
+        Runs the fetch stage. Items whose source or host has no free slot
+        wait for it in `deferred` tasks, at most `queue_size` of them, so
+        they do not hold back the items of other hosts queued behind them.
+        """
+        deferred_slots = asyncio.Semaphore(self._queue_size)
+        try:
+            async with asyncio.TaskGroup() as deferred:
+                await self._run_stage(
+                    "fetch",
+                    self._fetch_workers,
+                    input_queue,
+                    None,
+                    lambda source_item, _output: self._fetch(
+                        source_item, output_queue, deferred, deferred_slots
+                    ),
+                )
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0] from None
+
+        for _ in range(self._parse_workers):
+            await output_queue.put(_END_OF_STAGE)
+
+    async def _fetch(
+        self,
+        source_item: _SourceItem,
+        output: asyncio.Queue,
+        deferred: asyncio.TaskGroup,
+        deferred_slots: asyncio.Semaphore,
+    ) -> None:
+        host = urlparse(source_item.item.url).hostname or ""
+        if (
+            not source_item.source_semaphore.locked()
+            and not self._get_host_semaphore(host).locked()
+        ):
+            await self._fetch_item(source_item, host, output)
+            return
+
+        await deferred_slots.acquire()
+
+        async def fetch_deferred() -> None:
+            try:
+                await self._fetch_item(source_item, host, output)
+            finally:
+                deferred_slots.release()
+
+        deferred.create_task(fetch_deferred())
+
+    async def _fetch_item(
+        self,
+        source_item: _SourceItem,
+        host: str,
+        output: asyncio.Queue,
+    ) -> None:
+        item = source_item.item
+        # Slots are always taken in the same order (source -> host -> global)
+        # so that workers waiting on a busy host never hold a global slot.
+        async with (
+            source_item.source_semaphore,
+            self._get_host_semaphore(host),
+            self._global_semaphore,
+        ):
+            try:
+                # 3. Download the page (or extract, if it cannot be split)
+                with etl_metrics.fetch_seconds.time(host=host):
+                    if isinstance(self.extractor, StagedContentExtractor):
+                        fetched: FetchedPage | Article = await self.extractor.fetch(
+                            item
+                        )
+                    else:
+                        fetched = await self.extractor.extract(item)
+            except NotImplementedError as e:
+                # Skip extraction if not implemented (for now)
+                etl_metrics.record_error("fetch", e)
+                print(f"Extraction not implemented for {item.url}")
+                return
+            except Exception as e:
+                etl_metrics.record_error("fetch", e)
+                logger.exception("Error processing %s", item.url)
+                return
+
+        await output.put(fetched)
+
+    async def _parse(
+        self,
+        fetched: FetchedPage | Article,
+        output: asyncio.Queue,
+    ) -> None:
+        try:
+            # 4. Parse the page into an article
+            with etl_metrics.parse_seconds.time():
+                if isinstance(fetched, FetchedPage):
+                    assert isinstance(self.extractor, StagedContentExtractor)
+                    article = await self.extractor.parse(fetched)
+                else:
+                    article = fetched
+
+                if self._near_duplicate_index is not None:
+                    article = self._near_duplicate_index.link(article)
+        except Exception as e:
+            etl_metrics.record_error("parse", e)
+            url = fetched.item.url if isinstance(fetched, FetchedPage) else None
+            logger.exception("Error processing %s", url or fetched.source_url)
+            return
+
+        # 5. Queue for a batched save to the Repository
+        await output.put(article)
+
+    def _get_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._per_host_concurrency)
+            self._host_semaphores[host] = semaphore
+
+        return semaphore
@@ -0,0 +1,52 @@
+from core.utils.metrics import metrics_registry
+
+source_discovery_seconds = metrics_registry.histogram(
+    "etl_source_discovery_seconds",
+    "Time spent listing the news items of a source.",
+    ("source",),
+)
+items_discovered_total = metrics_registry.counter(
+    "etl_items_discovered_total",
+    "News items listed by a source.",
+    ("source",),
+)
+items_new_total = metrics_registry.counter(
+    "etl_items_new_total",
+    "Listed news items that were not stored yet.",
+    ("source",),
+)
+fetch_seconds = metrics_registry.histogram(
+    "etl_fetch_seconds",
+    "Time spent downloading an article page.",
+    ("host",),
+)
+parse_seconds = metrics_registry.histogram(
+    "etl_parse_seconds",
+    "Time spent turning a downloaded page into an article.",
+)
+write_seconds = metrics_registry.histogram(
+    "etl_write_seconds",
+    "Time spent saving a batch of articles.",
+)
+articles_written_total = metrics_registry.counter(
+    "etl_articles_written_total",
+    "Articles saved to the repository.",
+)
+errors_total = metrics_registry.counter(
+    "etl_errors_total",
+    "Errors per pipeline stage and error type.",
+    ("stage", "error"),
+)
+queue_depth = metrics_registry.gauge(
+    "etl_queue_depth",
+    "Elements waiting in the input queue of a pipeline stage.",
+    ("stage",),
+)
+
+
+def record_error(stage: str, error: BaseException) -> None:
+    """
+    Counts `error` under its class name, e.g. `HostUnavailableError` or
+    another `core.errors` type.
+    """
+    errors_total.inc(stage=stage, error=type(error).__name__)
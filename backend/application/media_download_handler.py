@@ -1,21 +1,36 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import re
+import weakref
 from pathlib import Path
 from typing import Callable
 from urllib.parse import urlparse
 from uuid import uuid4
 
+import httpx
+
 from core.config import config
 from domain.media.protocols import (
     MediaMuxerProtocol,
+    StreamingMediaMuxerProtocol,
+    StreamingVideoDownloaderProtocol,
     StreamResolverProtocol,
     VideoDownloaderProtocol,
 )
 from domain.media.supported_media_types import SupportedStreamTypes
-from domain.media.value_objects import MediaDownloadableLink, MuxedMedia
+from domain.media.value_objects import (
+    MediaDownloadableLink,
+    MuxedMedia,
+    ResolvedMediaStream,
+)
+from infrastructure.http.client_provider import http_client_provider
 from infrastructure.media.downloaders.video_downloader import VideoDownloader
-from infrastructure.media.muxers.video_muxer import VideoMuxer
+from infrastructure.media.muxers.video_muxer import (
+    STREAMABLE_STREAM_TYPES,
+    VideoMuxer,
+)
 from infrastructure.media.resolvers.dash_mpd_resolver import DashMPDResolver
 from infrastructure.media.resolvers.direct_mp4_resolver import DirectMP4Resolver
 from infrastructure.media.resolvers.hls_m3u8_resolver import HlsM3U8Resolver
@@ -25,6 +40,22 @@ type VideoDownloaderFactory = Callable[
     VideoDownloaderProtocol,
 ]
 
+# One lock per download directory, shared by every handler: two downloads of
+# the same source url would otherwise resume from (and overwrite) the same
+# partial files. Locks nobody holds or waits on are dropped.
+_download_locks: weakref.WeakValueDictionary[Path, asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _get_download_lock(download_path: Path) -> asyncio.Lock:
+    lock = _download_locks.get(download_path)
+    if lock is None:
+        lock = asyncio.Lock()
+        _download_locks[download_path] = lock
+
+    return lock
+
 
 class MediaDownloadHandler:
     def __init__(
@@ -34,14 +65,18 @@ class MediaDownloadHandler:
         download_root: Path | str = config.media_download_root,
         static_media_root: Path | str = config.media_static_root,
         downloader_factory: VideoDownloaderFactory | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self._download_root = Path(download_root)
         self._download_root.mkdir(parents=True, exist_ok=True)
 
+        # Resolvers and downloaders share one pooled client, so manifest and
+        # segment requests to the same CDN reuse keep-alive connections.
+        self._client = client or http_client_provider.get_client()
         self._resolvers = resolvers or [
-            HlsM3U8Resolver(),
-            DashMPDResolver(),
-            DirectMP4Resolver(),
+            HlsM3U8Resolver(client=self._client),
+            DashMPDResolver(client=self._client),
+            DirectMP4Resolver(client=self._client),
         ]
         self._muxer = muxer or VideoMuxer(static_media_root=static_media_root)
         self._downloader_factory = (
@@ -59,16 +94,43 @@ class MediaDownloadHandler:
         resolver = await self._select_resolver(source_url)
         resolved_stream = await resolver.resolve_stream(source_url)
 
-        download_path = self._download_root / uuid4().hex
+        # Retrying a source url downloads into the same directory, so the
+        # downloader resumes from what is already on disk.
+        download_path = self._download_root / self._build_download_key(source_url)
+        async with _get_download_lock(download_path.resolve()):
+            return await self._download_into(download_path, source_url, resolved_stream)
+
+    async def _download_into(
+        self,
+        download_path: Path,
+        source_url: str,
+        resolved_stream: ResolvedMediaStream,
+    ) -> MuxedMedia:
         downloader = self._downloader_factory(
             download_path,
             resolved_stream.links,
             resolved_stream.stream_type,
             resolved_stream.source_url,
         )
-        downloaded_media = await downloader.download_video()
-
         output_file_name = self._build_output_name(source_url)
+
+        # With `media_streaming_mux`, segmented streams go straight from the
+        # network into ffmpeg. They are not journaled, so a failed stream
+        # starts over instead of resuming; hence it is opt-in.
+        if (
+            config.media_streaming_mux
+            and resolved_stream.stream_type in STREAMABLE_STREAM_TYPES
+            and isinstance(downloader, StreamingVideoDownloaderProtocol)
+            and isinstance(self._muxer, StreamingMediaMuxerProtocol)
+        ):
+            return await self._muxer.mux_stream(
+                source_url=resolved_stream.source_url,
+                stream_type=resolved_stream.stream_type,
+                feed=downloader.stream_video,
+                output_file_name=output_file_name,
+            )
+
+        downloaded_media = await downloader.download_video()
         return await self._muxer.mux(
             downloaded_media, output_file_name=output_file_name
         )
@@ -92,8 +154,12 @@ class MediaDownloadHandler:
             chunks_data=chunks_data,
             stream_type=stream_type,
             source_url=source_url,
+            client=self._client,
         )
 
+    def _build_download_key(self, source_url: str) -> str:
+        return hashlib.sha256(source_url.encode("utf-8")).hexdigest()[:32]
+
     def _build_output_name(self, source_url: str) -> str:
         parsed = urlparse(source_url)
         candidate = Path(parsed.path).stem.strip()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from core.config import config
+from core.utils import MinHashLSH, pack_signature, unpack_signature
+from domain.news.entities import Article
+from domain.news.protocols import ArticleRepository
+from domain.news.url_canonicalizer import UrlCanonicalizer
+from infrastructure.extraction.content_signature import get_content_hasher
+from infrastructure.extraction.loader import get_site_url_canonicalizer
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index of the content of every canonical stored article.
+
+    `link` marks an article whose content is at least `threshold` similar to
+    an indexed one as its near-duplicate (`Article.canonical_url`); other
+    articles become canonical themselves and are indexed right away, so
+    copies waiting in the same write batch are linked too. Until `add`
+    confirms that they were stored they are pending, and `discard` takes
+    them out of the index again when their write fails. Lookups only
+    compare against articles sharing an LSH band, so they stay sublinear in
+    the size of the corpus.
+    """
+
+    def __init__(
+        self,
+        repository: ArticleRepository,
+        threshold: float | None = None,
+        bands: int | None = None,
+        warm_batch_size: int | None = None,
+        canonicalizer: UrlCanonicalizer | None = None,
+    ) -> None:
+        self._repository = repository
+        self._threshold = threshold or config.near_duplicate_threshold
+        self._hasher = get_content_hasher()
+        self._lsh = MinHashLSH(
+            num_perm=self._hasher.num_perm,
+            bands=bands or config.near_duplicate_bands,
+        )
+        self._warm_batch_size = warm_batch_size or config.near_duplicate_warm_batch_size
+        self._canonicalizer = canonicalizer or get_site_url_canonicalizer()
+        self._pending_urls: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._lsh)
+
+    async def warm(self) -> None:
+        """
+        Indexes the stored signatures of all canonical articles.
+        """
+        async for rows in self._repository.iter_content_signatures(
+            self._warm_batch_size
+        ):
+            for url, signature in rows:
+                self._lsh.insert(url, unpack_signature(signature))
+
+    def link(self, article: Article) -> Article:
+        """
+        Returns `article` with its content signature and, if it repeats an
+        indexed article, the url of that article as `canonical_url`.
+        Articles without a signature (no words in their content) are never
+        linked.
+        """
+        signature = self._signature(article)
+        if signature is None:
+            return article.model_copy(
+                update={"content_signature": None, "canonical_url": None}
+            )
+
+        url = self._canonicalize(article)
+        matches = [
+            match
+            for match in self._lsh.query(signature, self._threshold)
+            if match != url
+        ]
+
+        canonical_url = str(matches[0]) if matches else None
+        if canonical_url is None and url is not None and url not in self._lsh:
+            self._lsh.insert(url, signature)
+            self._pending_urls.add(url)
+
+        return article.model_copy(
+            update={
+                "content_signature": pack_signature(signature),
+                "canonical_url": canonical_url,
+            }
+        )
+
+    def add(self, articles: list[Article]) -> None:
+        """
+        Confirms the canonical articles of a stored batch.
+        """
+        for article in articles:
+            url = self._canonicalize(article)
+            if url is None:
+                continue
+
+            self._pending_urls.discard(url)
+            if (
+                article.canonical_url is None
+                and article.content_signature
+                and url not in self._lsh
+            ):
+                self._lsh.insert(url, unpack_signature(article.content_signature))
+
+    def discard(self, articles: list[Article]) -> None:
+        """
+        Takes the pending articles of a batch that failed to be stored out of
+        the index.
+        """
+        for article in articles:
+            url = self._canonicalize(article)
+            if url in self._pending_urls:
+                self._pending_urls.remove(url)
+                self._lsh.remove(url)
+
+    def _signature(self, article: Article) -> tuple[int, ...] | None:
+        if article.content_signature:
+            return unpack_signature(article.content_signature)
+
+        return self._hasher.signature(article.content)
+
+    def _canonicalize(self, article: Article) -> str | None:
+        if not article.source_url:
+            return None
+
+        return self._canonicalizer.canonicalize(article.source_url)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from pydantic import BaseModel, TypeAdapter
+
+from application.etl_manager import ETLManager
+from application.etl_metrics import record_error
+from core.config import config
+from domain.news.protocols import NewsSource
+
+logger = logging.getLogger(__name__)
+
+
+class SourcePollState(BaseModel):
+    """
+    Polling state of one source, persisted between restarts.
+    """
+
+    interval_seconds: float
+    next_poll_at: float = 0.0
+    last_new_items: int = 0
+    consecutive_empty_polls: int = 0
+    consecutive_failed_polls: int = 0
+
+
+_STATES_ADAPTER = TypeAdapter(dict[str, SourcePollState])
+
+
+class PollScheduler:
+    """
+    Long-running service that polls every source on its own adaptive interval.
+
+    After each poll the interval of the source is multiplied by
+    `backoff_factor` when it yielded nothing new and divided by it when it
+    yielded at least `busy_threshold` new items, clamped to
+    [`min_interval_seconds`, `max_interval_seconds`]. The next poll is
+    jittered by +/- `jitter_ratio` so sources do not fire in lockstep.
+    A failed poll keeps the interval: a broken source is not an idle one.
+    Per-source state is keyed by `NewsSource.source_link` and kept in a JSON
+    file at `state_path`, so a restart resumes the learned schedule.
+    """
+
+    def __init__(
+        self,
+        etl_manager: ETLManager,
+        sources: list[NewsSource] | None = None,
+        state_path: Path | str | None = None,
+        initial_interval_seconds: float | None = None,
+        min_interval_seconds: float | None = None,
+        max_interval_seconds: float | None = None,
+        backoff_factor: float | None = None,
+        busy_threshold: int | None = None,
+        jitter_ratio: float | None = None,
+        clock: Callable[[], float] = time.time,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._etl_manager = etl_manager
+        self._sources = sources if sources is not None else etl_manager.sources
+        self._state_path = Path(state_path or config.poll_state_path)
+        self._initial_interval_seconds = (
+            initial_interval_seconds or config.poll_initial_interval_seconds
+        )
+        self._min_interval_seconds = (
+            min_interval_seconds or config.poll_min_interval_seconds
+        )
+        self._max_interval_seconds = (
+            max_interval_seconds or config.poll_max_interval_seconds
+        )
+        self._backoff_factor = backoff_factor or config.poll_backoff_factor
+        self._busy_threshold = busy_threshold or config.poll_busy_threshold
+        self._jitter_ratio = (
+            config.poll_jitter_ratio if jitter_ratio is None else jitter_ratio
+        )
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._stopped = asyncio.Event()
+        self._states: dict[str, SourcePollState] = {}
+
+        if self._state_path.exists():
+            try:
+                self._states = _STATES_ADAPTER.validate_json(
+                    self._state_path.read_bytes()
+                )
+            except ValueError as e:
+                print(f"Ignoring unreadable poll state {self._state_path}: {e}")
+
+    def get_state(self, source: NewsSource) -> SourcePollState:
+        state = self._states.get(source.source_link)
+        if state is None:
+            state = SourcePollState(
+                interval_seconds=self._clamp(self._initial_interval_seconds)
+            )
+            self._states[source.source_link] = state
+
+        return state
+
+    async def run(self) -> None:
+        """
+        Polls all sources until `stop` is called.
+        """
+        self._stopped.clear()
+        await asyncio.gather(*(self._poll_loop(source) for source in self._sources))
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def poll(self, source: NewsSource) -> SourcePollState:
+        """
+        Runs the ETL pipeline for `source` once and reschedules it.
+        """
+        try:
+            new_items = await self._etl_manager.run_source(source)
+        except Exception as e:
+            logger.exception("Error polling %s", source.source_link)
+            record_error("poll", e)
+            state = self.record_failed_poll(source)
+        else:
+            state = self.record_poll(source, new_items)
+
+        self.persist()
+        return state
+
+    def record_poll(self, source: NewsSource, new_items: int) -> SourcePollState:
+        state = self.get_state(source)
+        interval = state.interval_seconds
+
+        if new_items == 0:
+            interval *= self._backoff_factor
+            state.consecutive_empty_polls += 1
+        else:
+            if new_items >= self._busy_threshold:
+                interval /= self._backoff_factor
+            state.consecutive_empty_polls = 0
+
+        state.interval_seconds = self._clamp(interval)
+        state.last_new_items = new_items
+        state.consecutive_failed_polls = 0
+        self._schedule_next_poll(state)
+        return state
+
+    def record_failed_poll(self, source: NewsSource) -> SourcePollState:
+        state = self.get_state(source)
+        state.consecutive_failed_polls += 1
+        self._schedule_next_poll(state)
+        return state
+
+    def persist(self) -> None:
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed, so a crash never leaves half a file.
+        temporary_path = self._state_path.with_name(f"{self._state_path.name}.tmp")
+        temporary_path.write_bytes(_STATES_ADAPTER.dump_json(self._states))
+        os.replace(temporary_path, self._state_path)
+
+    async def _poll_loop(self, source: NewsSource) -> None:
+        while not self._stopped.is_set():
+            delay = self.get_state(source).next_poll_at - self._clock()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=delay)
+                    return
+                except TimeoutError:
+                    pass
+
+            await self.poll(source)
+
+    def _schedule_next_poll(self, state: SourcePollState) -> None:
+        jitter = self._rng.uniform(-self._jitter_ratio, self._jitter_ratio)
+        state.next_poll_at = self._clock() + state.interval_seconds * (1 + jitter)
+
+    def _clamp(self, interval: float) -> float:
+        return min(
+            max(interval, self._min_interval_seconds), self._max_interval_seconds
+        )
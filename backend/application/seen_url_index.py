@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+from core.config import config
+from core.utils import BloomFilter
+from domain.news.entities import Article
+from domain.news.protocols import ArticleRepository
+from domain.news.url_canonicalizer import UrlCanonicalizer
+from infrastructure.extraction.loader import get_site_url_canonicalizer
+
+
+class SeenUrlIndex(ArticleRepository):
+    """
+    `ArticleRepository` decorator that keeps a Bloom filter of every stored
+    url in front of `filter_unknown_urls`.
+
+    A url the filter has never seen is certainly new and is answered from
+    memory. Only possible hits are confirmed against the wrapped repository,
+    in a single query, so false positives never drop a new article. Saves go
+    through to the repository and add their urls to the filter. The filter
+    holds canonical urls, so url variants of a stored article are hits.
+    """
+
+    def __init__(
+        self,
+        repository: ArticleRepository,
+        capacity: int | None = None,
+        error_rate: float | None = None,
+        warm_batch_size: int | None = None,
+        canonicalizer: UrlCanonicalizer | None = None,
+    ) -> None:
+        self._repository = repository
+        self._canonicalizer = canonicalizer or get_site_url_canonicalizer()
+        self._filter = BloomFilter(
+            capacity or config.seen_url_index_capacity,
+            error_rate or config.seen_url_index_error_rate,
+        )
+        self._warm_batch_size = warm_batch_size or config.seen_url_index_warm_batch_size
+        self._is_warm = False
+
+    @property
+    def is_warm(self) -> bool:
+        return self._is_warm
+
+    async def warm(self) -> None:
+        """
+        Loads every stored url into the filter. Until this has finished all
+        lookups go straight to the repository.
+        """
+        async for urls in self._repository.iter_urls(self._warm_batch_size):
+            self._filter.update([self._canonicalizer.canonicalize(url) for url in urls])
+
+        self._is_warm = True
+
+    async def save(self, article: Article) -> Article:
+        saved_article = await self._repository.save(article)
+        if article.source_url:
+            self._filter.add(self._canonicalizer.canonicalize(article.source_url))
+
+        return saved_article
+
+    async def save_many(self, articles: list[Article]) -> list[int]:
+        ids = await self._repository.save_many(articles)
+        self._filter.update(
+            [
+                self._canonicalizer.canonicalize(article.source_url)
+                for article in articles
+                if article.source_url
+            ]
+        )
+
+        return ids
+
+    async def get_by_url(self, url: str) -> Article | None:
+        return await self._repository.get_by_url(url)
+
+    async def filter_unknown_urls(self, urls: list[str]) -> set[str]:
+        if not self._is_warm:
+            return await self._repository.filter_unknown_urls(urls)
+
+        maybe_known = [
+            url for url in urls if self._canonicalizer.canonicalize(url) in self._filter
+        ]
+        unknown_urls = set(urls).difference(maybe_known)
+        if maybe_known:
+            unknown_urls |= await self._repository.filter_unknown_urls(maybe_known)
+
+        return unknown_urls
+
+    def iter_urls(self, batch_size: int = 10_000) -> AsyncIterator[list[str]]:
+        return self._repository.iter_urls(batch_size)
+
+    def iter_content_signatures(
+        self, batch_size: int = 10_000
+    ) -> AsyncIterator[list[tuple[str, bytes]]]:
+        return self._repository.iter_content_signatures(batch_size)
@@ -11,6 +11,7 @@ class Config(BaseSettings):
 
     scrapers_info_dir: Path = Path("./sites")
     static_mount_path: str = "/static"
+    metrics_path: str = "/metrics"
     media_static_url_prefix: str = "/static/media"
     static_root: Path = Path("static")
     media_static_root: Path = Path("static/media")
@@ -22,6 +23,42 @@ class Config(BaseSettings):
         "application/vnd.apple.mpegurl,application/x-mpegURL,text/plain"
     )
     media_http_accept_dash: str = "application/dash+xml,application/xml,text/xml"
+    media_download_max_in_flight: int = 16
+    media_download_per_host_in_flight: int = 8
+    media_segment_max_attempts: int = 4
+    media_download_verify_checksums: bool = False
+    media_ranged_download_connections: int = 4
+    media_ranged_download_min_bytes: int = 16 * 1024 * 1024
+    media_streaming_mux: bool = False
+    media_stream_reorder_window: int = 8
+    http_accept_html: str = "text/html,application/xhtml+xml"
+    http_accept_feed: str = (
+        "application/rss+xml,application/atom+xml,application/xml,text/xml"
+    )
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 50
+    http_keepalive_expiry_seconds: float = 60.0
+    http_enable_http2: bool = True
+    http_rate_limit_requests_per_second: float = 2.0
+    http_rate_limit_burst: int = 4
+    http_rate_limit_min_requests_per_second: float = 0.05
+    http_rate_limit_backoff_factor: float = 0.5
+    http_rate_limit_recovery_step: float = 0.1
+    http_max_retry_after_seconds: float = 600.0
+    http_respect_crawl_delay: bool = True
+    http_connect_timeout_seconds: float = 5.0
+    http_retry_max_attempts: int = 3
+    http_retry_base_delay_seconds: float = 0.5
+    http_retry_max_delay_seconds: float = 10.0
+    http_circuit_failure_threshold: int = 5
+    http_circuit_reset_timeout_seconds: float = 60.0
+    feed_cache_path: Path = Path("tmp/feed-cache.json")
+    html_extractor_targeted_parsing: bool = True
+    rss_feed_concurrency: int = 8
+    rss_feed_timeout_seconds: float = 20.0
+    rss_stream_known_run_length: int = 5
+    parse_executor_workers: int | None = None
+    parse_executor_use_processes: bool = True
     ffmpeg_binary: str = "ffmpeg"
     ffmpeg_threads: int | None = None
     ffmpeg_video_codec: str = "libx264"
@@ -30,7 +67,37 @@ class Config(BaseSettings):
     ffmpeg_audio_codec: str = "aac"
     ffmpeg_audio_bitrate: str = "128k"
     ffmpeg_movflags: str = "+faststart"
+    ffmpeg_stream_copy: bool = True
+    ffmpeg_stream_copy_video_codecs: list[str] = ["h264"]
+    ffmpeg_stream_copy_audio_codecs: list[str] = ["aac"]
+    ffmpeg_stream_copy_max_bit_rate: int | None = 8_000_000
+    ffprobe_binary: str = "ffprobe"
     dash_concat_chunk_size_bytes: int = 5 * 2**20
+    etl_max_concurrency: int = 32
+    etl_source_concurrency: int = 8
+    etl_per_source_concurrency: int = 8
+    etl_per_host_concurrency: int = 4
+    etl_dedup_workers: int = 2
+    etl_fetch_workers: int = 64
+    etl_parse_workers: int | None = None
+    etl_stage_queue_size: int = 64
+    etl_write_batch_size: int = 50
+    etl_write_flush_interval_seconds: float = 2.0
+    seen_url_index_capacity: int = 5_000_000
+    seen_url_index_error_rate: float = 0.01
+    seen_url_index_warm_batch_size: int = 10_000
+    near_duplicate_threshold: float = 0.8
+    near_duplicate_num_perm: int = 128
+    near_duplicate_bands: int = 16
+    near_duplicate_shingle_size: int = 5
+    near_duplicate_warm_batch_size: int = 10_000
+    poll_state_path: Path = Path("tmp/poll-state.json")
+    poll_initial_interval_seconds: float = 300.0
+    poll_min_interval_seconds: float = 60.0
+    poll_max_interval_seconds: float = 3600.0
+    poll_backoff_factor: float = 1.5
+    poll_busy_threshold: int = 5
+    poll_jitter_ratio: float = 0.1
     db_user: str = "postgres"
     db_pass: str = "postgres"
     db_host: str = "localhost"
@@ -1,5 +1,6 @@
 from core.errors.article_related import MissingTitleError
 from core.errors.base import ClientError, ErrorPayload, InternalError
+from core.errors.http_related import HostUnavailableError
 from core.errors.media_related import (
     DashManifestMissingAdaptationSetError,
     DashManifestMissingPeriodError,
@@ -23,6 +24,7 @@ __all__ = [
     "ErrorPayload",
     "InternalError",
     "MissingTitleError",
+    "HostUnavailableError",
     "DashManifestParseError",
     "DashManifestMissingPeriodError",
     "DashManifestMissingAdaptationSetError",
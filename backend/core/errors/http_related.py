@@ -0,0 +1,16 @@
+from core.errors.base import ErrorPayload, InternalError
+
+
+class HostUnavailableError(InternalError):
+    def __init__(self, host: str, retry_in_seconds: float) -> None:
+        self.retry_in_seconds = retry_in_seconds
+        super().__init__(
+            internal_payload=ErrorPayload(
+                code="host_unavailable",
+                message="Host is failing, requests to it are paused.",
+                details={
+                    "host": host,
+                    "retry_in_seconds": f"{retry_in_seconds:.1f}",
+                },
+            )
+        )
@@ -1,3 +1,31 @@
+from core.utils.bloom_filter import BloomFilter
 from core.utils.iso import parse_iso_8601_duration
+from core.utils.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    metrics_registry,
+)
+from core.utils.minhash import (
+    MinHasher,
+    MinHashLSH,
+    estimate_similarity,
+    pack_signature,
+    unpack_signature,
+)
 
-__all__ = ["parse_iso_8601_duration"]
+__all__ = [
+    "BloomFilter",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "MinHashLSH",
+    "MinHasher",
+    "estimate_similarity",
+    "metrics_registry",
+    "pack_signature",
+    "parse_iso_8601_duration",
+    "unpack_signature",
+]
@@ -0,0 +1,62 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Space-efficient set membership for strings.
+
+    `in` never misses a value that was added; it may report a value that was
+    not added with probability close to `error_rate` while at most
+    `capacity` values are stored.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size_in_bits = math.ceil(
+            -capacity * math.log(error_rate) / (math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size_in_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.size_in_bits + 7) // 8)
+        self._count = 0
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def update(self, values: list[str]) -> None:
+        for value in values:
+            self.add(value)
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, str):
+            return False
+
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    def __len__(self) -> int:
+        """
+        Number of `add` calls, which may count a value more than once.
+        """
+        return self._count
+
+    def _positions(self, value: str) -> list[int]:
+        # Kirsch-Mitzenmacher: k positions from two halves of one digest.
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+
+        return [
+            (first + index * second) % self.size_in_bits
+            for index in range(self.hash_count)
+        ]
@@ -0,0 +1,155 @@
+import hashlib
+import random
+import re
+from array import array
+from collections import defaultdict
+from collections.abc import Hashable, Sequence
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures of texts over word `shingle_size`-grams.
+
+    The share of equal positions in two signatures estimates the Jaccard
+    similarity of the shingle sets of the two texts.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+
+        generator = random.Random(seed)
+        self._permutations = [
+            (
+                generator.randrange(1, _MERSENNE_PRIME),
+                generator.randrange(0, _MERSENNE_PRIME),
+            )
+            for _ in range(num_perm)
+        ]
+
+    def shingles(self, text: str) -> set[int]:
+        words = _WORD_PATTERN.findall(text.lower())
+        if len(words) < self.shingle_size:
+            grams = [" ".join(words)] if words else []
+        else:
+            grams = [
+                " ".join(words[index : index + self.shingle_size])
+                for index in range(len(words) - self.shingle_size + 1)
+            ]
+
+        return {
+            int.from_bytes(
+                hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(),
+                "little",
+            )
+            for gram in grams
+        }
+
+    def signature(self, text: str) -> tuple[int, ...] | None:
+        """
+        Returns the signature of `text`, or None if it has no words. Texts
+        without shingles have nothing in common, so they get no signature
+        instead of one that matches every other empty text.
+        """
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+
+        return tuple(
+            min(
+                ((a * shingle + b) % _MERSENNE_PRIME) & _MAX_HASH
+                for shingle in shingles
+            )
+            for a, b in self._permutations
+        )
+
+
+def estimate_similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    if len(first) != len(second) or not first:
+        raise ValueError("signatures must be non-empty and of equal length")
+
+    return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+def pack_signature(signature: Sequence[int]) -> bytes:
+    return array("I", signature).tobytes()
+
+
+def unpack_signature(data: bytes) -> tuple[int, ...]:
+    return tuple(array("I", data))
+
+
+class MinHashLSH:
+    """
+    Locality-sensitive hashing index over MinHash signatures.
+
+    Signatures are split in `bands` bands of equal width and every band is a
+    bucket key, so a query only compares against keys that share at least one
+    band instead of scanning the whole index. With b bands of r rows, pairs of
+    similarity s collide with probability 1 - (1 - s^r)^b.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.bands = bands
+        self.rows = num_perm // bands
+        # Bands are bucketed by their hash and signatures kept packed, so an
+        # indexed text costs roughly a kilobyte however long it is.
+        self._buckets: defaultdict[int, list[Hashable]] = defaultdict(list)
+        self._signatures: dict[Hashable, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._signatures
+
+    def insert(self, key: Hashable, signature: Sequence[int]) -> None:
+        self._signatures[key] = pack_signature(signature)
+        for band in self._band_keys(signature):
+            self._buckets[band].append(key)
+
+    def remove(self, key: Hashable) -> None:
+        packed = self._signatures.pop(key, None)
+        if packed is None:
+            return
+
+        for band in self._band_keys(unpack_signature(packed)):
+            bucket = self._buckets[band]
+            bucket.remove(key)
+            if not bucket:
+                del self._buckets[band]
+
+    def query(self, signature: Sequence[int], threshold: float) -> list[Hashable]:
+        """
+        Returns the indexed keys whose estimated similarity to `signature`
+        is at least `threshold`, most similar first.
+        """
+        candidates: set[Hashable] = set()
+        for band in self._band_keys(signature):
+            candidates.update(self._buckets.get(band, ()))
+
+        scored = [
+            (
+                estimate_similarity(signature, unpack_signature(self._signatures[key])),
+                key,
+            )
+            for key in candidates
+        ]
+        return [
+            key
+            for similarity, key in sorted(scored, key=lambda pair: -pair[0])
+            if similarity >= threshold
+        ]
+
+    def _band_keys(self, signature: Sequence[int]) -> list[int]:
+        return [
+            hash((band, tuple(signature[band * self.rows : (band + 1) * self.rows])))
+            for band in range(self.bands)
+        ]
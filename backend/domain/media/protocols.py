@@ -1,6 +1,8 @@
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
+from domain.media.supported_media_types import SupportedStreamTypes
 from domain.media.value_objects import (
     DownloadedMedia,
     MediaDownloadableLink,
@@ -8,6 +10,12 @@ from domain.media.value_objects import (
     ResolvedMediaStream,
 )
 
+# Receives the bytes of a stream, in playback order.
+type MediaSink = Callable[[bytes], Awaitable[None]]
+
+# Writes a whole stream into the given sink.
+type MediaFeed = Callable[[MediaSink], Awaitable[None]]
+
 
 @runtime_checkable
 class StreamResolverProtocol(Protocol):
@@ -41,6 +49,20 @@ class VideoDownloaderProtocol(Protocol):
     async def download_video(self) -> DownloadedMedia: ...
 
 
+@runtime_checkable
+class StreamingVideoDownloaderProtocol(VideoDownloaderProtocol, Protocol):
+    """
+    A video downloader that can also hand the segments over as they arrive,
+    without storing them.
+    """
+
+    async def stream_video(self, write: MediaSink) -> None:
+        """
+        Downloads every segment and passes its bytes to `write`, in order.
+        """
+        ...
+
+
 @runtime_checkable
 class ImageDownloaderProtocol(Protocol):
     """
@@ -82,3 +104,18 @@ class MediaMuxerProtocol(Protocol):
         downloaded_media: DownloadedMedia,
         output_file_name: str | None = None,
     ) -> MuxedMedia: ...
+
+
+@runtime_checkable
+class StreamingMediaMuxerProtocol(MediaMuxerProtocol, Protocol):
+    """
+    A muxer that can also mux a stream fed to it while it is downloaded.
+    """
+
+    async def mux_stream(
+        self,
+        source_url: str,
+        stream_type: SupportedStreamTypes,
+        feed: MediaFeed,
+        output_file_name: str | None = None,
+    ) -> MuxedMedia: ...
@@ -8,6 +8,7 @@ from domain.media.supported_media_types import SupportedStreamTypes
 class MediaDownloadableLink(BaseModel):
     url: str
     size_in_bytes: int | None = None
+    supports_ranges: bool = False
     sequence_number: int = 0
     is_initialization_segment: bool = False
 
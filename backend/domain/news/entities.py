@@ -11,6 +11,15 @@ class NewsItem(BaseModel):
     url: str
 
 
+class FetchedPage(BaseModel):
+    """
+    The raw page of a news item, downloaded but not parsed yet.
+    """
+
+    item: NewsItem
+    content: bytes
+
+
 class Article(BaseModel):
     """
     Represents a fully extracted news article.
@@ -22,3 +31,7 @@ class Article(BaseModel):
     timestamp: str
     author: str
     source_url: str | None = None
+    # MinHash of the content and, for near-duplicates, the url of the
+    # already stored article it repeats. Set at ingest.
+    content_signature: bytes | None = None
+    canonical_url: str | None = None
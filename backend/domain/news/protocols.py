@@ -1,7 +1,8 @@
-from typing import Protocol, List
+from collections.abc import AsyncIterator
+from typing import Protocol, List, runtime_checkable
 
 from .value_objects import ScrapeInformation
-from .entities import NewsItem, Article
+from .entities import NewsItem, Article, FetchedPage
 
 type Host = str
 
@@ -13,6 +14,7 @@ class NewsSource(Protocol):
     """
 
     scraping_informations: list[ScrapeInformation]
+    source_link: str
 
     async def check_for_news(self) -> List[NewsItem]: ...
 
@@ -27,6 +29,18 @@ class ContentExtractor(Protocol):
     async def extract(self, item: NewsItem) -> Article: ...
 
 
+@runtime_checkable
+class StagedContentExtractor(ContentExtractor, Protocol):
+    """
+    Extractor whose I/O-bound download and CPU-bound parsing can run as
+    separate pipeline stages. `extract` is `parse(await fetch(item))`.
+    """
+
+    async def fetch(self, item: NewsItem) -> FetchedPage: ...
+
+    async def parse(self, page: FetchedPage) -> Article: ...
+
+
 class ArticleRepository(Protocol):
     """
     Protocol for persisting articles.
@@ -34,4 +48,34 @@ class ArticleRepository(Protocol):
 
     async def save(self, article: Article) -> Article: ...
 
+    async def save_many(self, articles: list[Article]) -> list[int]:
+        """
+        Upserts a batch of articles (keyed by url) in a single transaction
+        and returns the ids of the written rows.
+        """
+        ...
+
     async def get_by_url(self, url: str) -> Article | None: ...
+
+    async def filter_unknown_urls(self, urls: list[str]) -> set[str]:
+        """
+        Returns the subset of `urls` that is not persisted yet,
+        checked in a single round-trip.
+        """
+        ...
+
+    def iter_urls(self, batch_size: int = 10_000) -> AsyncIterator[list[str]]:
+        """
+        Yields the urls of all persisted articles in batches of at most
+        `batch_size`, without loading the articles themselves.
+        """
+        ...
+
+    def iter_content_signatures(
+        self, batch_size: int = 10_000
+    ) -> AsyncIterator[list[tuple[str, bytes]]]:
+        """
+        Yields (url, packed MinHash signature) of every stored article that
+        is not a near-duplicate of another one, in batches.
+        """
+        ...
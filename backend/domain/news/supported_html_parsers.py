@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SupportedHtmlParsers(str, Enum):
+    LXML = "lxml"
+    HTML_PARSER = "html.parser"
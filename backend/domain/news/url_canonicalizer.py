@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import posixpath
+import re
+import string
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+from domain.news.protocols import Host
+from domain.news.value_objects import Information, UrlRules
+
+# Query parameters that only identify the campaign / click that brought a
+# reader to the page and never change its content.
+TRACKING_QUERY_PARAMS = (
+    "utm_*",
+    "fbclid",
+    "gclid",
+    "dclid",
+    "gbraid",
+    "wbraid",
+    "msclkid",
+    "yclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "_ga",
+    "_gl",
+    "ref_src",
+)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_PATH_SAFE_CHARACTERS = "/:@!$&'()*+,;=-._~"
+_UNRESERVED_CHARACTERS = frozenset(string.ascii_letters + string.digits + "-._~")
+_PERCENT_ESCAPE = re.compile(r"%([0-9A-Fa-f]{2})")
+_DEFAULT_RULES = UrlRules()
+
+
+def _matches_any(name: str, patterns: tuple[str, ...] | list[str]) -> bool:
+    for pattern in patterns:
+        if pattern.endswith("*"):
+            if name.startswith(pattern[:-1]):
+                return True
+        elif name == pattern:
+            return True
+
+    return False
+
+
+def _normalize_percent_escape(match: re.Match[str]) -> str:
+    character = chr(int(match.group(1), 16))
+    if character in _UNRESERVED_CHARACTERS:
+        return character
+
+    return match.group(0).upper()
+
+
+def _normalize_path(path: str, strip_trailing_slash: bool) -> str:
+    # "%7e", "%7E" and "~" end up the same, but reserved characters stay
+    # escaped: "%2F" is data inside a segment, not a "/" between segments.
+    path = _PERCENT_ESCAPE.sub(_normalize_percent_escape, path)
+    path = quote(path, safe=_PATH_SAFE_CHARACTERS + "%")
+    if not path:
+        return "/"
+
+    has_trailing_slash = path.endswith("/")
+    path = posixpath.normpath(path)
+    if path.startswith("//"):
+        path = "/" + path.lstrip("/")
+
+    if path != "/" and has_trailing_slash and not strip_trailing_slash:
+        path += "/"
+
+    return path
+
+
+def canonicalize_url(url: str, rules: UrlRules | None = None) -> str:
+    """
+    Returns the canonical form of `url`, used to store and deduplicate
+    articles. Lowercases scheme and host, drops default ports, fragments and
+    tracking parameters, sorts the query and normalizes the path, then applies
+    the given site `rules`.
+    """
+    rules = rules or _DEFAULT_RULES
+    parts = urlsplit(url.strip())
+    if not parts.scheme or not parts.hostname:
+        return url
+
+    try:
+        port = parts.port
+    except ValueError:
+        # A malformed port (e.g. "80x"): leave the url as it is rather than
+        # failing the page it was found on.
+        return url
+
+    scheme = parts.scheme.lower()
+    if rules.force_https and scheme == "http":
+        scheme = "https"
+
+    host = parts.hostname.lower().rstrip(".")
+    host = rules.host_aliases.get(host, host)
+    netloc = host if port in (None, _DEFAULT_PORTS.get(scheme)) else f"{host}:{port}"
+
+    query_params = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _matches_any(name, TRACKING_QUERY_PARAMS)
+        and not _matches_any(name, rules.drop_query_params)
+        and (
+            rules.keep_query_params is None
+            or _matches_any(name, rules.keep_query_params)
+        )
+    ]
+    query = urlencode(sorted(query_params))
+
+    path = _normalize_path(parts.path, rules.strip_trailing_slash)
+
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+class UrlCanonicalizer:
+    """
+    Canonicalizes urls with the rules of the site they belong to, so sources,
+    the dedup index and the repository all agree on one key per article.
+    """
+
+    def __init__(self, site_rules: dict[Host, UrlRules] | None = None) -> None:
+        self._site_rules: dict[Host, UrlRules] = {}
+        for host, rules in (site_rules or {}).items():
+            self._site_rules[host.lower()] = rules
+            for alias in rules.host_aliases:
+                self._site_rules[alias.lower()] = rules
+
+    @classmethod
+    def from_informations(cls, informations: list[Information]) -> UrlCanonicalizer:
+        return cls({info.get_host(): info.url_rules for info in informations})
+
+    def rules_for(self, url: str) -> UrlRules | None:
+        host = urlsplit(url).hostname
+        if host is None:
+            return None
+
+        return self._site_rules.get(host.lower().rstrip("."))
+
+    def canonicalize(self, url: str) -> str:
+        return canonicalize_url(url, self.rules_for(url))
@@ -1,8 +1,44 @@
 from urllib.parse import urlparse
 from pydantic import BaseModel, Field, ValidationError
 
+from domain.news.supported_html_parsers import SupportedHtmlParsers
+
+
+class UrlRules(BaseModel):
+    """
+    Per-site canonicalization rules, read from "urlRules" in the site JSON.
+    """
+
+    # Exact names, or prefixes when ending with "*" (e.g. "utm_*").
+    drop_query_params: list[str] = Field(alias="dropQueryParams", default=[])
+    # When set, every other query parameter is dropped.
+    keep_query_params: list[str] | None = Field(alias="keepQueryParams", default=None)
+    # e.g. {"m.example.com": "example.com"} for mobile mirrors.
+    host_aliases: dict[str, str] = Field(alias="hostAliases", default={})
+    # Sites serve the same article over both schemes; opt out per site.
+    force_https: bool = Field(alias="forceHttps", default=True)
+    strip_trailing_slash: bool = Field(alias="stripTrailingSlash", default=True)
+
+
+class RateLimitRules(BaseModel):
+    """
+    Per-site politeness settings, read from "rateLimit" in the site JSON.
+    Unset values fall back to the `http_rate_limit_*` settings.
+    """
+
+    requests_per_second: float | None = Field(
+        alias="requestsPerSecond", default=None, gt=0
+    )
+    burst: int | None = Field(default=None, ge=1)
+    respect_crawl_delay: bool = Field(alias="respectCrawlDelay", default=True)
+
 
 class Information(BaseModel):
+    url_rules: UrlRules = Field(alias="urlRules", default_factory=UrlRules)
+    rate_limit: RateLimitRules = Field(
+        alias="rateLimit", default_factory=RateLimitRules
+    )
+
     def get_host(self) -> str:
         url = None
         if hasattr(self, "scraping_url"):
@@ -29,7 +65,11 @@ class ScrapeInformation(Information):
     summary_containers: list[str] = Field(alias="summaryContainers")
     main_article_container: str = Field(alias="mainArticleContainer")
     author_container: str = Field(alias="authorContainer")
+    html_parser: SupportedHtmlParsers = Field(
+        alias="htmlParser", default=SupportedHtmlParsers.LXML
+    )
 
 
 class RSSInformation(Information):
     rss_feed: str = Field(alias="rssFeed")
+    streaming_parse: bool = Field(alias="streamingParse", default=False)
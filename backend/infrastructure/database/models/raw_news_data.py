@@ -15,6 +15,18 @@ class RawNewsData(models.Model):
     url = fields.CharField(max_length=2048, null=True, unique=True)
     # Storing list of video URLs as JSON
     videos = fields.JSONField(default=list)
+    # Packed MinHash signature of raw_text, used by the near-duplicate index
+    content_minhash = fields.BinaryField(null=True)
+    # Set when this row repeats another story (e.g. syndicated wire copy).
+    # Downstream processing only needs rows where canonical is null.
+    canonical: fields.ForeignKeyNullableRelation["RawNewsData"] = (
+        fields.ForeignKeyField(
+            "models.RawNewsData",
+            related_name="duplicates",
+            null=True,
+            on_delete=fields.SET_NULL,
+        )
+    )
     created_at = fields.DatetimeField(auto_now_add=True)
 
     class Meta: # type: ignore
@@ -1,13 +1,28 @@
+from collections.abc import AsyncIterator
+
+from tortoise.transactions import in_transaction
+
 from domain.news.entities import Article
-from domain.news.ports import ArticleRepository
+from domain.news.protocols import ArticleRepository
+from domain.news.url_canonicalizer import UrlCanonicalizer
 from infrastructure.database.models.raw_news_data import RawNewsData
+from infrastructure.extraction.loader import get_site_url_canonicalizer
+
+UPSERT_COLUMNS = ("title", "raw_text", "videos", "content_minhash", "url")
+UPSERT_UPDATED_COLUMNS = ("title", "raw_text", "videos", "content_minhash")
 
 
 class TortoiseArticleRepository(ArticleRepository):
     """
     Tortoise ORM implementation of the ArticleRepository.
+
+    Urls are stored and looked up in their canonical form, so tracking
+    parameters or host/path spelling variants map to the same row.
     """
 
+    def __init__(self, canonicalizer: UrlCanonicalizer | None = None) -> None:
+        self._canonicalizer = canonicalizer or get_site_url_canonicalizer()
+
     async def save(self, article: Article) -> Article:
         # Convert Domain Article to DB Model
         # We try to find existing one by URL if possible, or just create new.
@@ -15,26 +30,101 @@ class TortoiseArticleRepository(ArticleRepository):
         # Assuming we treat URL as unique identifier.
 
         raw_news_data = None
-        if article.source_url:
-            raw_news_data = await RawNewsData.filter(url=article.source_url).first()
+        source_url = self._canonicalize(article.source_url)
+        if source_url:
+            raw_news_data = await RawNewsData.filter(url=source_url).first()
+
+        canonical = None
+        canonical_url = self._canonicalize(article.canonical_url)
+        if canonical_url:
+            canonical = await RawNewsData.filter(url=canonical_url).first()
 
         if raw_news_data:
             raw_news_data.title = article.title
             raw_news_data.raw_text = article.content
             raw_news_data.videos = article.videos
+            raw_news_data.content_minhash = article.content_signature
+            raw_news_data.canonical = canonical  # type: ignore
             await raw_news_data.save()
         else:
             raw_news_data = await RawNewsData.create(
                 title=article.title,
                 raw_text=article.content,
                 videos=article.videos,
-                url=article.source_url,
+                content_minhash=article.content_signature,
+                canonical=canonical,
+                url=source_url,
             )
 
         return article  # In a real app we might return updated entity with ID
 
+    async def save_many(self, articles: list[Article]) -> list[int]:
+        """
+        Writes the whole batch with one `INSERT ... ON CONFLICT (url) DO UPDATE`
+        statement, so concurrent writers of the same url cannot race.
+        Near-duplicates are then linked to their canonical rows, which may be
+        part of the same batch; a canonical row that is not stored (yet)
+        leaves its duplicates unlinked.
+        """
+        if not articles:
+            return []
+
+        # A single upsert statement cannot touch the same row twice,
+        # so only the last article for every url is kept.
+        articles_by_key: dict[str | int, Article] = {}
+        for index, article in enumerate(articles):
+            articles_by_key[self._canonicalize(article.source_url) or index] = article
+
+        videos_field = RawNewsData._meta.fields_map["videos"]
+        async with in_transaction() as connection:
+            query = connection.query_class.into(RawNewsData._meta.basetable).columns(
+                *UPSERT_COLUMNS
+            )
+            for key, article in articles_by_key.items():
+                query = query.insert(
+                    article.title,
+                    article.content,
+                    videos_field.to_db_value(article.videos, None),
+                    article.content_signature,
+                    key if isinstance(key, str) else None,
+                )
+
+            query = query.on_conflict("url")
+            for column in UPSERT_UPDATED_COLUMNS:
+                query = query.do_update(column)
+
+            sql, values = query.returning("id", "url").get_parameterized_sql()
+            rows = await connection.execute_query_dict(sql, values)
+
+            duplicates_by_canonical: dict[str, list[str]] = {}
+            for key, article in articles_by_key.items():
+                canonical_url = self._canonicalize(article.canonical_url)
+                if isinstance(key, str) and canonical_url and canonical_url != key:
+                    duplicates_by_canonical.setdefault(canonical_url, []).append(key)
+
+            if duplicates_by_canonical:
+                canonical_ids = dict(
+                    await RawNewsData.filter(url__in=list(duplicates_by_canonical))
+                    .using_db(connection)
+                    .values_list("url", "id")
+                )
+                for canonical_url, urls in duplicates_by_canonical.items():
+                    canonical_id = canonical_ids.get(canonical_url)
+                    if canonical_id is None:
+                        continue
+
+                    await (
+                        RawNewsData.filter(url__in=urls)
+                        .using_db(connection)
+                        .update(canonical_id=canonical_id)
+                    )
+
+        return [row["id"] for row in rows]
+
     async def get_by_url(self, url: str) -> Article | None:
-        raw_news_data = await RawNewsData.filter(url=url).first()
+        raw_news_data = await RawNewsData.filter(
+            url=self._canonicalizer.canonicalize(url)
+        ).first()
         if raw_news_data:
             return Article(
                 title=raw_news_data.title,
@@ -43,3 +133,67 @@ class TortoiseArticleRepository(ArticleRepository):
                 source_url=raw_news_data.url,
             )
         return None
+
+    async def filter_unknown_urls(self, urls: list[str]) -> set[str]:
+        if not urls:
+            return set()
+
+        canonical_urls = {url: self._canonicalizer.canonicalize(url) for url in urls}
+        known_urls = set(
+            await RawNewsData.filter(url__in=set(canonical_urls.values())).values_list(
+                "url", flat=True
+            )
+        )
+        return {
+            url
+            for url, canonical_url in canonical_urls.items()
+            if canonical_url not in known_urls
+        }
+
+    def _canonicalize(self, url: str | None) -> str | None:
+        return self._canonicalizer.canonicalize(url) if url else url
+
+    async def iter_urls(self, batch_size: int = 10_000) -> AsyncIterator[list[str]]:
+        """
+        Yields every stored url in batches, paginating on the primary key so
+        each page is an index range scan no matter how deep it is.
+        """
+        last_id = 0
+        while True:
+            rows = (
+                await RawNewsData.filter(id__gt=last_id, url__isnull=False)
+                .order_by("id")
+                .limit(batch_size)
+                .values_list("id", "url")
+            )
+            if not rows:
+                return
+
+            last_id = rows[-1][0]
+            yield [url for _, url in rows]
+
+    async def iter_content_signatures(
+        self, batch_size: int = 10_000
+    ) -> AsyncIterator[list[tuple[str, bytes]]]:
+        """
+        Yields (url, packed MinHash) of every canonical row in batches,
+        paginating on the primary key like `iter_urls`.
+        """
+        last_id = 0
+        while True:
+            rows = (
+                await RawNewsData.filter(
+                    id__gt=last_id,
+                    url__isnull=False,
+                    content_minhash__isnull=False,
+                    canonical_id__isnull=True,
+                )
+                .order_by("id")
+                .limit(batch_size)
+                .values_list("id", "url", "content_minhash")
+            )
+            if not rows:
+                return
+
+            last_id = rows[-1][0]
+            yield [(url, bytes(signature)) for _, url, signature in rows]
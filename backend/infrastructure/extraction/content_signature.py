@@ -0,0 +1,22 @@
+from functools import cache
+
+from core.config import config
+from core.utils import MinHasher, pack_signature
+
+
+@cache
+def get_content_hasher() -> MinHasher:
+    """
+    The MinHasher all content signatures are computed with. It is built from
+    config, so signatures from parse workers and from the near-duplicate
+    index always agree.
+    """
+    return MinHasher(
+        num_perm=config.near_duplicate_num_perm,
+        shingle_size=config.near_duplicate_shingle_size,
+    )
+
+
+def compute_content_signature(content: str) -> bytes | None:
+    signature = get_content_hasher().signature(content)
+    return pack_signature(signature) if signature is not None else None
@@ -1,108 +1,87 @@
-from datetime import datetime
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
 import httpx
-from domain.news.entities import NewsItem, Article
-from domain.news.protocols import ContentExtractor, Host
+
+from core.config import config
+from domain.news.entities import Article, FetchedPage, NewsItem
+from domain.news.protocols import Host, StagedContentExtractor
 from domain.news.value_objects import ScrapeInformation
+from infrastructure.extraction.page_parsers import parse_article_page
+from infrastructure.extraction.parse_executor import ParseExecutor, parse_executor
+from infrastructure.extraction.site_plan import SitePlan, compile_site_plan
+from infrastructure.http.client_provider import http_client_provider
+from infrastructure.http.rate_limiter import host_rate_limiter
 
 
-class HtmlExtractor(ContentExtractor):
+class HtmlExtractor(StagedContentExtractor):
     """
     Extracts content from HTML pages.
     """
 
-    def __init__(self, registered_scrapers: list[ScrapeInformation]) -> None:
+    def __init__(
+        self,
+        registered_scrapers: list[ScrapeInformation],
+        client: httpx.AsyncClient | None = None,
+        targeted_parsing: bool | None = None,
+        site_plans: list[SitePlan] | None = None,
+        executor: ParseExecutor | None = None,
+    ) -> None:
+        site_plans = site_plans or [
+            compile_site_plan(info) for info in registered_scrapers
+        ]
+        self._site_plans: dict[Host, SitePlan] = {
+            plan.host: plan for plan in site_plans
+        }
         self.scraping_informations: dict[Host, ScrapeInformation] = {
-            info.get_host(): info for info in registered_scrapers
+            host: plan.info for host, plan in self._site_plans.items()
         }
-        self.client = httpx.AsyncClient(
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; NewsAgent/1.0)",
-                "Accept": "text/html,application/xhtml+xml",
-            },
-            follow_redirects=True,
-            timeout=30.0,
-        )
+        if targeted_parsing is None:
+            targeted_parsing = config.html_extractor_targeted_parsing
 
-    async def extract(self, item: NewsItem) -> Article:
-        relevant_scraping_info = self._get_relevant_scraper(item)
+        # Only the subtrees the selectors need are built, so parse cost
+        # follows the article body rather than ads, comments and scripts.
+        self._targeted_parsing = targeted_parsing
+        self._request_headers = {"Accept": config.http_accept_html}
+        for host, plan in self._site_plans.items():
+            host_rate_limiter.configure(host, plan.info.rate_limit)
 
-        page_response = await self.client.get(item.url)
-        page_data = page_response.content
-
-        soup = BeautifulSoup(page_data, "html.parser")
-        article_text = self._extract_article(relevant_scraping_info, soup)
-
-        # TODO: Decide if we REALLY want to traverse time containers (for now no)
-        timestamp = soup.select_one(relevant_scraping_info.timestamps_conteiners[0])
-        author_container = soup.select_one(relevant_scraping_info.author_container)
-
-        if author_container is None:
-            raise Exception(
-                "There is no available article content for this news"
-            )  # TODO: Create custom error
-
-        videos = None
-        if video_selectors := relevant_scraping_info.video_containers:
-            videos = self._extract_videos_from_page(soup, video_selectors)
-
-        return Article(
-            title=item.title,
-            content=article_text,
-            videos=videos or [],
-            author=author_container.get_text(),
-            timestamp=(
-                timestamp.get_text()
-                if timestamp
-                else datetime.now().strftime("%d/%m/%Y, %H:%M:%S")
-            ),
-            source_url=item.url,
-        )
+        self.client = client or http_client_provider.get_client()
+        self._parse_executor = executor or parse_executor
 
-    def _extract_article(
-        self,
-        relevant_scraping_info: ScrapeInformation,
-        soup: BeautifulSoup,
-    ) -> str:
-        article_container = soup.select_one(
-            relevant_scraping_info.main_article_container
+    async def extract(self, item: NewsItem) -> Article:
+        return await self.parse(await self.fetch(item))
+
+    async def fetch(self, item: NewsItem) -> FetchedPage:
+        # Fails before any request for sites we cannot parse anyway.
+        self._get_relevant_plan(item)
+
+        page_response = await self.client.get(item.url, headers=self._request_headers)
+        return FetchedPage(item=item, content=page_response.content)
+
+    async def parse(self, page: FetchedPage) -> Article:
+        return await self._parse_executor.run(
+            parse_article_page,
+            page.content,
+            self._get_relevant_plan(page.item),
+            page.item,
+            self._targeted_parsing,
         )
 
-        if article_container is None:
-            raise Exception(
-                "There is no available article content for this news"
-            )  # TODO: Create custom error
-
-        return article_container.get_text()
-
-    def _extract_videos_from_page(self, soup, video_selectors: list[str]):
-        videos: list[str] = []
-        for video_selector in video_selectors:
-            videos_containers = soup.select(video_selector)
-
-            for container in videos_containers:
-                video_link = container.get("href")
-                does_video_exist = video_link is not None
-                is_tag_link = isinstance(video_link, str)
-
-                if does_video_exist and is_tag_link:
-                    videos.append(video_link)
-
-        return videos
+    async def close(self) -> None:
+        # Nothing to close: the client is shared or belongs to the caller.
+        return None
 
-    def _get_relevant_scraper(self, item: NewsItem) -> ScrapeInformation:
+    def _get_relevant_plan(self, item: NewsItem) -> SitePlan:
         url_info = urlparse(item.url)
         host = url_info.hostname
 
         assert host is not None, "Url Host is None, that should NEVER be possible"
 
-        relevant_scraping_info = self.scraping_informations.get(host)
+        relevant_site_plan = self._site_plans.get(host)
 
-        if relevant_scraping_info is None:
+        if relevant_site_plan is None:
             raise Exception(
                 "No relevant scraper found for this news website"
             )  # TODO: Create custom errors
 
-        return relevant_scraping_info
+        return relevant_site_plan
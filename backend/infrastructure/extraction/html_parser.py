@@ -0,0 +1,44 @@
+from importlib.util import find_spec
+
+from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+from domain.news.supported_html_parsers import SupportedHtmlParsers
+
+_PARSER_MODULES: dict[SupportedHtmlParsers, str | None] = {
+    SupportedHtmlParsers.LXML: "lxml",
+    SupportedHtmlParsers.HTML_PARSER: None,
+}
+
+
+def is_parser_available(parser: SupportedHtmlParsers) -> bool:
+    module_name = _PARSER_MODULES[parser]
+    return module_name is None or find_spec(module_name) is not None
+
+
+def resolve_parser(parser: SupportedHtmlParsers) -> SupportedHtmlParsers:
+    """
+    Falls back to the pure-python `html.parser` when the requested
+    backend is not installed.
+    """
+    if is_parser_available(parser):
+        return parser
+
+    return SupportedHtmlParsers.HTML_PARSER
+
+
+def parse_html(
+    content: bytes | str,
+    parser: SupportedHtmlParsers = SupportedHtmlParsers.LXML,
+    parse_only: ElementFilter | None = None,
+) -> BeautifulSoup:
+    """
+    Builds a BeautifulSoup tree with the selected backend. Every backend
+    produces the same tree API, so `ScrapeInformation` CSS selectors keep
+    their soupsieve semantics regardless of the parser.
+    """
+    return BeautifulSoup(
+        content,
+        resolve_parser(parser).value,
+        parse_only=parse_only,
+    )
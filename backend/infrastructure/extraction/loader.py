@@ -1,7 +1,11 @@
 import json
+from functools import cache
 from pathlib import Path
 from typing import List, Tuple
+from soupsieve import SelectorSyntaxError
+from domain.news.url_canonicalizer import UrlCanonicalizer
 from domain.news.value_objects import RSSInformation, ScrapeInformation
+from infrastructure.extraction.site_plan import SitePlan, compile_site_plan
 
 
 class NewsLoader:
@@ -45,3 +49,32 @@ class NewsLoader:
                 print(f"Failed to load {file_path}: {e}")
 
         return scrape_infos, rss_infos
+
+    def load_site_plans(self) -> List[SitePlan]:
+        """
+        Loads the scraper configurations and compiles each of them into a
+        `SitePlan` once, so sources and the extractor can share it.
+        """
+        scrape_infos, _ = self.load_scrapers_data()
+
+        site_plans = []
+        for scrape_info in scrape_infos:
+            try:
+                site_plans.append(compile_site_plan(scrape_info))
+            except (SelectorSyntaxError, ValueError) as e:
+                print(
+                    f"Failed to compile selectors for {scrape_info.scraping_url}: {e}"
+                )
+
+        return site_plans
+
+
+@cache
+def get_site_url_canonicalizer() -> UrlCanonicalizer:
+    """
+    Returns the one `UrlCanonicalizer` built from every site configuration,
+    so the repository and the indexes store and look up urls with the same
+    site rules.
+    """
+    scrape_infos, rss_infos = NewsLoader().load_scrapers_data()
+    return UrlCanonicalizer.from_informations([*scrape_infos, *rss_infos])
@@ -0,0 +1,182 @@
+from datetime import datetime
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+from core.errors import MissingTitleError
+from domain.news.entities import Article, NewsItem
+from infrastructure.extraction.content_signature import compute_content_signature
+from infrastructure.extraction.html_parser import parse_html
+from infrastructure.extraction.site_plan import SitePlan
+
+# These functions are the CPU-bound half of scraping. They only take bytes
+# and picklable plans and return plain entities, so `ParseExecutor` can run
+# them in worker processes while the event loop keeps doing I/O.
+
+
+def parse_listing_page(content: bytes, site_plan: SitePlan) -> list[NewsItem]:
+    """
+    Finds the news links of a listing page.
+    """
+    soup = parse_html(content, site_plan.info.html_parser)
+
+    out: list[NewsItem] = []
+    for container in _get_news_containers_elements(soup, site_plan):
+        news_tags = container.find_all(href=True)
+
+        for tag in news_tags:
+            try:
+                url, title = _get_url_and_title_from_tag(tag, site_plan)
+            except MissingTitleError:
+                continue
+            out.append(NewsItem(url=url, title=title))
+
+    return out
+
+
+def parse_article_page(
+    content: bytes,
+    site_plan: SitePlan,
+    item: NewsItem,
+    targeted_parsing: bool = True,
+) -> Article:
+    """
+    Extracts the article behind `item` from its page.
+    """
+    soup = parse_html(
+        content,
+        site_plan.info.html_parser,
+        parse_only=site_plan.article_strainer if targeted_parsing else None,
+    )
+    article_text = _extract_article(site_plan, soup)
+
+    # TODO: Decide if we REALLY want to traverse time containers (for now no)
+    timestamp = (
+        site_plan.timestamp.select_one(soup)
+        if site_plan.timestamp is not None
+        else None
+    )
+    author_container = (
+        site_plan.author.select_one(soup) if site_plan.author is not None else None
+    )
+
+    if author_container is None:
+        raise Exception(
+            "There is no available article content for this news"
+        )  # TODO: Create custom error
+
+    videos = None
+    if site_plan.videos:
+        videos = _extract_videos_from_page(soup, site_plan)
+
+    return Article(
+        title=item.title,
+        content=article_text,
+        videos=videos or [],
+        author=author_container.get_text(),
+        timestamp=(
+            timestamp.get_text()
+            if timestamp
+            else datetime.now().strftime("%d/%m/%Y, %H:%M:%S")
+        ),
+        source_url=item.url,
+        content_signature=compute_content_signature(article_text),
+    )
+
+
+def _extract_article(site_plan: SitePlan, soup: BeautifulSoup) -> str:
+    article_container = (
+        site_plan.main_article.select_one(soup)
+        if site_plan.main_article is not None
+        else None
+    )
+
+    if article_container is None:
+        raise Exception(
+            "There is no available article content for this news"
+        )  # TODO: Create custom error
+
+    return article_container.get_text()
+
+
+def _extract_videos_from_page(soup: BeautifulSoup, site_plan: SitePlan) -> list[str]:
+    videos: list[str] = []
+    for video_selector in site_plan.videos:
+        videos_containers = video_selector.select(soup)
+
+        for container in videos_containers:
+            video_link = container.get("href")
+            does_video_exist = video_link is not None
+            is_tag_link = isinstance(video_link, str)
+
+            if does_video_exist and is_tag_link:
+                videos.append(video_link)
+
+    return videos
+
+
+def _get_url_and_title_from_tag(tag: Tag, site_plan: SitePlan) -> tuple[str, str]:
+    scraper_info = site_plan.info
+
+    def get_relative_link_from(tag: Tag):
+        relative_link = tag["href"]
+        assert isinstance(relative_link, str)
+
+        return urljoin(scraper_info.scraping_url, relative_link)
+
+    def get_title_from(tag: Tag):
+        tag_parent = tag.parent
+
+        if tag_parent is None:
+            text = tag.get_text()
+            if text is None:
+                raise MissingTitleError(
+                    scraping_url=scraper_info.scraping_url,
+                    href=get_relative_link_from(tag),
+                    selectors=scraper_info.titles_containers,
+                )
+
+            title_text = text.strip()
+            if not title_text:
+                raise MissingTitleError(
+                    scraping_url=scraper_info.scraping_url,
+                    href=get_relative_link_from(tag),
+                    selectors=scraper_info.titles_containers,
+                )
+
+            return title_text
+
+        title = (
+            site_plan.titles.select_one(tag_parent)
+            if site_plan.titles is not None
+            else None
+        )
+        if title is None:
+            raise MissingTitleError(
+                scraping_url=scraper_info.scraping_url,
+                href=get_relative_link_from(tag),
+                selectors=scraper_info.titles_containers,
+            )
+
+        title_text = title.get_text(strip=True)
+        if not title_text:
+            raise MissingTitleError(
+                scraping_url=scraper_info.scraping_url,
+                href=get_relative_link_from(tag),
+                selectors=scraper_info.titles_containers,
+            )
+
+        return title_text
+
+    return (get_relative_link_from(tag), get_title_from(tag))
+
+
+def _get_news_containers_elements(
+    soup: BeautifulSoup, site_plan: SitePlan
+) -> list[Tag]:
+    output_tags: list[Tag] = []
+    for distinction in site_plan.article_containers:
+        tags = distinction.select(soup)
+        output_tags.extend(tags)
+
+    return output_tags
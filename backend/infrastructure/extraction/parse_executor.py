@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import ParamSpec, TypeVar
+
+from core.config import config
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class ParseExecutor:
+    """
+    Runs CPU-bound parsing off the event loop.
+
+    By default work goes to a process pool so parsing scales across cores;
+    a thread pool can be used instead (e.g. when the parser releases the GIL
+    or process start-up is too costly). The pool is created on first use.
+    Functions and arguments must be picklable when processes are used.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        use_processes: bool | None = None,
+    ) -> None:
+        self._max_workers = (
+            max_workers or config.parse_executor_workers or os.cpu_count() or 1
+        )
+        self._use_processes = (
+            config.parse_executor_use_processes
+            if use_processes is None
+            else use_processes
+        )
+        self._executor: Executor | None = None
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._use_processes:
+                # "spawn" keeps workers from inheriting the event loop and the
+                # open sockets of the parent.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="parse",
+                )
+
+        return self._executor
+
+
+parse_executor = ParseExecutor()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import soupsieve
+from soupsieve import SoupSieve
+
+from domain.news.value_objects import ScrapeInformation
+from infrastructure.extraction.targeted_parsing import (
+    SelectorStrainer,
+    build_article_strainer,
+)
+
+
+@dataclass(frozen=True)
+class SitePlan:
+    """
+    Everything a source or the extractor needs to scrape one site, compiled
+    once when the site is loaded instead of on every page or anchor.
+    """
+
+    info: ScrapeInformation
+    host: str
+    article_containers: tuple[SoupSieve, ...]
+    titles: SoupSieve | None
+    main_article: SoupSieve | None
+    timestamp: SoupSieve | None
+    author: SoupSieve | None
+    videos: tuple[SoupSieve, ...]
+    article_strainer: SelectorStrainer | None
+
+
+def _compile(selector: str) -> SoupSieve | None:
+    if not selector.strip():
+        return None
+
+    return soupsieve.compile(selector)
+
+
+def compile_site_plan(info: ScrapeInformation) -> SitePlan:
+    article_containers = tuple(
+        compiled
+        for selector in info.article_containers
+        if (compiled := _compile(selector)) is not None
+    )
+    videos = tuple(
+        compiled
+        for selector in info.video_containers or []
+        if (compiled := _compile(selector)) is not None
+    )
+
+    return SitePlan(
+        info=info,
+        host=info.get_host().lower(),
+        article_containers=article_containers,
+        titles=_compile(", ".join(info.titles_containers)),
+        main_article=_compile(info.main_article_container),
+        timestamp=(
+            _compile(info.timestamps_conteiners[0])
+            if info.timestamps_conteiners
+            else None
+        ),
+        author=_compile(info.author_container),
+        videos=videos,
+        article_strainer=build_article_strainer(info),
+    )
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from bs4.filter import ElementFilter
+
+from domain.news.value_objects import ScrapeInformation
+
+_ATTRIBUTE_SELECTOR = re.compile(r"\[[^\]]*\]")
+_COMPOUND_SELECTOR = re.compile(
+    r"^(?P<name>[a-zA-Z][\w-]*|\*)?(?P<qualifiers>(?:[.#][\w-]+)*)$"
+)
+# Sibling combinators and pseudo-classes depend on nodes outside the
+# matched subtree, which a targeted parse throws away.
+_UNSUPPORTED_TOKENS = (":", "+", "~")
+
+
+@dataclass(frozen=True)
+class SimpleSelector:
+    """
+    The tag name / classes / id part of the leftmost compound of a CSS selector.
+    """
+
+    name: str | None
+    classes: frozenset[str]
+    element_id: str | None
+
+    def matches(self, name: str, attrs: dict[str, object] | None) -> bool:
+        if self.name is not None and self.name != name:
+            return False
+
+        attrs = attrs or {}
+        if self.element_id is not None and attrs.get("id") != self.element_id:
+            return False
+
+        if self.classes:
+            raw_classes = attrs.get("class") or ""
+            if isinstance(raw_classes, str):
+                raw_classes = raw_classes.split()
+
+            if not self.classes.issubset(raw_classes):  # type: ignore
+                return False
+
+        return True
+
+
+def compile_simple_selector(selector: str) -> SimpleSelector | None:
+    """
+    Returns a matcher for the root of `selector`, or None when the selector
+    cannot be answered from the subtrees of its root matches.
+    """
+    without_attributes = _ATTRIBUTE_SELECTOR.sub("", selector).strip()
+    if not without_attributes or any(
+        token in without_attributes for token in _UNSUPPORTED_TOKENS
+    ):
+        return None
+
+    leftmost = re.split(r"\s|>", without_attributes, maxsplit=1)[0]
+    match = _COMPOUND_SELECTOR.match(leftmost)
+    if match is None:
+        return None
+
+    name = match.group("name")
+    qualifiers = re.findall(r"[.#][\w-]+", match.group("qualifiers"))
+    classes = frozenset(value[1:] for value in qualifiers if value[0] == ".")
+    ids = [value[1:] for value in qualifiers if value[0] == "#"]
+
+    if name in (None, "*") and not classes and not ids:
+        return None
+
+    return SimpleSelector(
+        name=None if name == "*" else name,
+        classes=classes,
+        element_id=ids[0] if ids else None,
+    )
+
+
+class SelectorStrainer(ElementFilter):
+    """
+    Parse filter that only builds the subtrees rooted at elements matching
+    one of the selectors, like a `SoupStrainer` compiled from CSS.
+    """
+
+    def __init__(self, selectors: list[SimpleSelector]) -> None:
+        self.selectors = selectors
+
+    def allow_tag_creation(
+        self,
+        nsprefix: str | None,
+        name: str,
+        attrs: dict[str, object] | None,  # type: ignore[override]
+    ) -> bool:
+        return any(selector.matches(name, attrs) for selector in self.selectors)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+def build_article_strainer(
+    scraping_info: ScrapeInformation,
+) -> SelectorStrainer | None:
+    """
+    Compiles the selectors `HtmlExtractor` reads into a strainer.
+    Returns None (parse the full page) if any of them cannot be targeted.
+    """
+    selectors = [
+        scraping_info.main_article_container,
+        scraping_info.author_container,
+        *scraping_info.timestamps_conteiners[:1],
+        *(scraping_info.video_containers or []),
+    ]
+
+    compiled: list[SimpleSelector] = []
+    for selector_group in selectors:
+        for selector in selector_group.split(","):
+            if not selector.strip():
+                continue
+
+            simple_selector = compile_simple_selector(selector)
+            if simple_selector is None:
+                return None
+
+            compiled.append(simple_selector)
+
+    if not compiled:
+        return None
+
+    return SelectorStrainer(compiled)
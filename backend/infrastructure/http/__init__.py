@@ -0,0 +1,39 @@
+from infrastructure.http.client_provider import (
+    HttpClientProvider,
+    build_http_client,
+    http_client_provider,
+    is_http2_available,
+)
+from infrastructure.http.rate_limiter import (
+    SKIP_RATE_LIMIT_EXTENSION,
+    HostRateLimiter,
+    RateLimitedTransport,
+    host_rate_limiter,
+    parse_retry_after,
+)
+from infrastructure.http.resilience import (
+    SKIP_RETRIES_EXTENSION,
+    CircuitState,
+    HostCircuitBreaker,
+    ResilientTransport,
+    RetryPolicy,
+    host_circuit_breaker,
+)
+
+__all__ = [
+    "SKIP_RATE_LIMIT_EXTENSION",
+    "SKIP_RETRIES_EXTENSION",
+    "CircuitState",
+    "HostCircuitBreaker",
+    "HostRateLimiter",
+    "HttpClientProvider",
+    "RateLimitedTransport",
+    "ResilientTransport",
+    "RetryPolicy",
+    "build_http_client",
+    "host_circuit_breaker",
+    "host_rate_limiter",
+    "http_client_provider",
+    "is_http2_available",
+    "parse_retry_after",
+]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from importlib.util import find_spec
+
+import httpx
+
+from core.config import config
+from infrastructure.http.rate_limiter import (
+    HostRateLimiter,
+    RateLimitedTransport,
+    host_rate_limiter,
+)
+from infrastructure.http.resilience import (
+    HostCircuitBreaker,
+    ResilientTransport,
+    RetryPolicy,
+    host_circuit_breaker,
+)
+
+
+def is_http2_available() -> bool:
+    """
+    HTTP/2 support in httpx needs the optional `h2` package
+    (`httpx[http2]`). Without it we silently stay on HTTP/1.1.
+    """
+    return config.http_enable_http2 and find_spec("h2") is not None
+
+
+def build_http_client(
+    headers: dict[str, str] | None = None,
+    rate_limiter: HostRateLimiter | None = None,
+    circuit_breaker: HostCircuitBreaker | None = None,
+    retry_policy: RetryPolicy | None = None,
+) -> httpx.AsyncClient:
+    """
+    Builds an `httpx.AsyncClient` with the pool limits, keep-alive and
+    HTTP/2 settings from `core.config`. With a `rate_limiter`, every request
+    waits for its host's turn first. With a `circuit_breaker`, idempotent
+    requests are retried and requests to failing hosts fail fast.
+    """
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=config.http_max_connections,
+            max_keepalive_connections=config.http_max_keepalive_connections,
+            keepalive_expiry=config.http_keepalive_expiry_seconds,
+        ),
+        http2=is_http2_available(),
+    )
+    if rate_limiter is not None:
+        transport = RateLimitedTransport(transport, rate_limiter)
+    if circuit_breaker is not None:
+        transport = ResilientTransport(transport, circuit_breaker, retry_policy)
+
+    return httpx.AsyncClient(
+        headers={"User-Agent": config.media_http_user_agent, **(headers or {})},
+        follow_redirects=config.media_http_follow_redirects,
+        # A dead host fails on connect quickly instead of after the full timeout.
+        timeout=httpx.Timeout(
+            config.media_http_timeout_seconds,
+            connect=config.http_connect_timeout_seconds,
+        ),
+        transport=transport,
+    )
+
+
+class HttpClientProvider:
+    """
+    Hands out one process-wide `httpx.AsyncClient`, so every component
+    reuses the same connection pool, keep-alive connections and TLS sessions.
+    Components pass their own `Accept` headers per request.
+
+    The client goes through `host_rate_limiter` and `host_circuit_breaker`,
+    so sharing the pool keeps the per-host limits, robots.txt crawl delays,
+    retries and circuit breaking.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+
+    def get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = build_http_client(
+                rate_limiter=host_rate_limiter,
+                circuit_breaker=host_circuit_breaker,
+            )
+
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+        self._client = None
+
+
+http_client_provider = HttpClientProvider()
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.robotparser import RobotFileParser
+
+import httpx
+
+from core.config import config
+from domain.news.value_objects import RateLimitRules
+
+THROTTLING_STATUS_CODES = frozenset({429, 503})
+
+# Request extension for bulk downloads (media segments) whose pace is already
+# bounded by their caller; such requests skip the per-host limiter.
+SKIP_RATE_LIMIT_EXTENSION = "skip_rate_limit"
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """
+    Returns the delay in seconds of a `Retry-After` header, given either as
+    a number of seconds or as an HTTP date.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - (time.time() if now is None else now))
+
+
+@dataclass
+class _HostState:
+    target_rate: float
+    rate: float
+    burst: int
+    respect_crawl_delay: bool
+    # Theoretical arrival time of the next request (GCRA).
+    next_at: float = 0.0
+    blocked_until: float = 0.0
+    crawl_delay_known: bool = False
+
+
+class HostRateLimiter:
+    """
+    Token bucket per host, shared by every component fetching news pages.
+
+    A host may take `burst` requests at once and `requests_per_second`
+    sustained. `Crawl-delay` from robots.txt lowers that rate further.
+    Throttling answers (429/503) halve the rate of the host and block it for
+    the `Retry-After` delay; successful answers restore the rate step by step.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        burst: int | None = None,
+        min_requests_per_second: float | None = None,
+        backoff_factor: float | None = None,
+        recovery_step: float | None = None,
+        max_retry_after_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        self._requests_per_second = (
+            requests_per_second or config.http_rate_limit_requests_per_second
+        )
+        self._burst = burst or config.http_rate_limit_burst
+        self._min_requests_per_second = (
+            min_requests_per_second or config.http_rate_limit_min_requests_per_second
+        )
+        self._backoff_factor = backoff_factor or config.http_rate_limit_backoff_factor
+        self._recovery_step = recovery_step or config.http_rate_limit_recovery_step
+        self._max_retry_after_seconds = (
+            max_retry_after_seconds or config.http_max_retry_after_seconds
+        )
+        self._clock = clock
+        self._sleep = sleep
+        self._hosts: dict[str, _HostState] = {}
+
+    def configure(self, host: str, rules: RateLimitRules) -> None:
+        """
+        Applies the rate limit rules of a site to its host.
+        """
+        state = self._get_state(host)
+        state.target_rate = rules.requests_per_second or self._requests_per_second
+        state.rate = min(state.rate, state.target_rate)
+        state.burst = rules.burst or self._burst
+        state.respect_crawl_delay = rules.respect_crawl_delay
+
+    def needs_crawl_delay(self, host: str) -> bool:
+        state = self._get_state(host)
+        return (
+            config.http_respect_crawl_delay
+            and state.respect_crawl_delay
+            and not state.crawl_delay_known
+        )
+
+    def set_crawl_delay(self, host: str, crawl_delay: float | None) -> None:
+        """
+        Caps the rate of `host` to one request per `crawl_delay` seconds.
+        `None` records that the host has no crawl delay.
+        """
+        state = self._get_state(host)
+        state.crawl_delay_known = True
+        if crawl_delay:
+            state.target_rate = min(state.target_rate, 1 / crawl_delay)
+            state.rate = min(state.rate, state.target_rate)
+            state.burst = 1
+            # The robots.txt request itself was the latest request to the host.
+            state.next_at = max(state.next_at, self._clock() + crawl_delay)
+
+    def get_rate(self, host: str) -> float:
+        return self._get_state(host).rate
+
+    async def acquire(self, host: str) -> None:
+        """
+        Waits until `host` may take another request.
+        """
+        state = self._get_state(host)
+        now = self._clock()
+        interval = 1 / state.rate
+
+        # Slots are reserved before sleeping, so concurrent callers queue up
+        # one interval apart instead of waking up together.
+        next_at = max(state.next_at, now)
+        allowed_at = max(
+            next_at - (state.burst - 1) * interval, state.blocked_until, now
+        )
+        state.next_at = max(next_at, allowed_at) + interval
+
+        if allowed_at > now:
+            await self._sleep(allowed_at - now)
+
+    def record_response(
+        self, host: str, status_code: int, retry_after: str | None = None
+    ) -> None:
+        """
+        Adapts the rate of `host` to the status of its latest answer.
+        """
+        state = self._get_state(host)
+        if status_code not in THROTTLING_STATUS_CODES:
+            state.rate = min(
+                state.target_rate, state.rate + state.target_rate * self._recovery_step
+            )
+            return
+
+        state.rate = max(
+            self._min_requests_per_second, state.rate * self._backoff_factor
+        )
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            blocked_until = self._clock() + min(delay, self._max_retry_after_seconds)
+            state.blocked_until = max(state.blocked_until, blocked_until)
+            state.next_at = max(state.next_at, state.blocked_until)
+
+    def _get_state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(
+                target_rate=self._requests_per_second,
+                rate=self._requests_per_second,
+                burst=self._burst,
+                respect_crawl_delay=True,
+            )
+            self._hosts[host] = state
+
+        return state
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that passes every request through a `HostRateLimiter`.
+
+    Before the first request to a host its robots.txt is read once for a
+    `Crawl-delay` (or `Request-rate`) for our user agent.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, rate_limiter: HostRateLimiter
+    ) -> None:
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+        self._robots_lookups: dict[str, asyncio.Task[None]] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.extensions.get(SKIP_RATE_LIMIT_EXTENSION):
+            return await self._transport.handle_async_request(request)
+
+        host = request.url.host
+        if self._rate_limiter.needs_crawl_delay(host):
+            lookup = self._robots_lookups.get(host)
+            if lookup is None:
+                lookup = asyncio.ensure_future(self._read_crawl_delay(request))
+                self._robots_lookups[host] = lookup
+
+            await asyncio.shield(lookup)
+
+        await self._rate_limiter.acquire(host)
+        response = await self._transport.handle_async_request(request)
+        self._rate_limiter.record_response(
+            host, response.status_code, response.headers.get("Retry-After")
+        )
+        return response
+
+    async def aclose(self) -> None:
+        for lookup in self._robots_lookups.values():
+            lookup.cancel()
+
+        await self._transport.aclose()
+
+    async def _read_crawl_delay(self, request: httpx.Request) -> None:
+        host = request.url.host
+        user_agent = request.headers.get("User-Agent", "*")
+        robots_request = httpx.Request(
+            "GET",
+            request.url.copy_with(path="/robots.txt", query=None, fragment=None),
+            headers={"User-Agent": user_agent},
+        )
+
+        crawl_delay = None
+        try:
+            await self._rate_limiter.acquire(host)
+            response = await self._transport.handle_async_request(robots_request)
+            try:
+                content = await response.aread()
+            finally:
+                await response.aclose()
+
+            if response.status_code == 200:
+                robots = RobotFileParser()
+                robots.parse(content.decode("utf-8", "replace").splitlines())
+                crawl_delay = robots.crawl_delay(user_agent)
+                request_rate = robots.request_rate(user_agent)
+                if crawl_delay is None and request_rate and request_rate.requests:
+                    crawl_delay = request_rate.seconds / request_rate.requests
+        except httpx.HTTPError as e:
+            # An unreachable robots.txt means "no crawl delay"; it must not
+            # fail the requests waiting on this lookup.
+            print(f"Failed to read robots.txt of {host}: {e!r}")
+            crawl_delay = None
+        finally:
+            # A lookup that did not finish (e.g. cancelled) is not cached,
+            # so the next request to the host starts a new one.
+            self._robots_lookups.pop(host, None)
+
+        self._rate_limiter.set_crawl_delay(
+            host, float(crawl_delay) if crawl_delay else None
+        )
+
+
+host_rate_limiter = HostRateLimiter()
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+import httpx
+
+from core.config import config
+from core.errors import HostUnavailableError
+from infrastructure.http.rate_limiter import parse_retry_after
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Request extension for callers that retry on their own (media segments);
+# such requests are sent once but still count towards the circuit breaker.
+SKIP_RETRIES_EXTENSION = "skip_retries"
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: the n-th retry waits a random
+    time between 0 and `base_delay_seconds * 2**n`, capped at
+    `max_delay_seconds`, so clients failing together do not retry together.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int | None = None,
+        base_delay_seconds: float | None = None,
+        max_delay_seconds: float | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.max_attempts = max_attempts or config.http_retry_max_attempts
+        self.base_delay_seconds = (
+            base_delay_seconds or config.http_retry_base_delay_seconds
+        )
+        self.max_delay_seconds = (
+            max_delay_seconds or config.http_retry_max_delay_seconds
+        )
+        self._rng = rng or random.Random()
+
+    def get_delay(self, retry: int) -> float:
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2**retry)
+        return self._rng.uniform(0, ceiling)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probe_started_at: float | None = None
+
+
+class HostCircuitBreaker:
+    """
+    Circuit breaker per host.
+
+    After `failure_threshold` consecutive failures (transport errors or 5xx
+    answers) the circuit of the host opens and its requests fail fast with
+    `HostUnavailableError`. Once `reset_timeout_seconds` have passed a single
+    probe request is let through (half-open): its success closes the circuit,
+    its failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int | None = None,
+        reset_timeout_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = (
+            failure_threshold or config.http_circuit_failure_threshold
+        )
+        self._reset_timeout_seconds = (
+            reset_timeout_seconds or config.http_circuit_reset_timeout_seconds
+        )
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+
+    def get_state(self, host: str) -> CircuitState:
+        return self._get_circuit(host).state
+
+    def before_request(self, host: str) -> None:
+        """
+        Raises `HostUnavailableError` unless a request to `host` may go out.
+        """
+        circuit = self._get_circuit(host)
+        if circuit.state is CircuitState.CLOSED:
+            return
+
+        now = self._clock()
+        if circuit.state is CircuitState.OPEN:
+            retry_at = circuit.opened_at + self._reset_timeout_seconds
+            if now < retry_at:
+                raise HostUnavailableError(host, retry_at - now)
+
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probe_started_at = None
+
+        # A probe that never reported back (e.g. it was cancelled) does not
+        # keep the host closed forever.
+        probe_started_at = circuit.probe_started_at
+        if (
+            probe_started_at is not None
+            and now < probe_started_at + self._reset_timeout_seconds
+        ):
+            raise HostUnavailableError(
+                host, probe_started_at + self._reset_timeout_seconds - now
+            )
+
+        circuit.probe_started_at = now
+
+    def record_success(self, host: str) -> None:
+        circuit = self._get_circuit(host)
+        circuit.state = CircuitState.CLOSED
+        circuit.failures = 0
+        circuit.probe_started_at = None
+
+    def record_failure(self, host: str) -> None:
+        circuit = self._get_circuit(host)
+        circuit.failures += 1
+        if (
+            circuit.state is CircuitState.HALF_OPEN
+            or circuit.failures >= self._failure_threshold
+        ):
+            circuit.state = CircuitState.OPEN
+            circuit.opened_at = self._clock()
+            circuit.probe_started_at = None
+
+    def _get_circuit(self, host: str) -> _Circuit:
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = _Circuit()
+            self._circuits[host] = circuit
+
+        return circuit
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that retries idempotent requests failing with transport errors
+    (except read timeouts) or retryable statuses, and fails fast for hosts
+    whose circuit is open.
+
+    Answers asking to retry later than `RetryPolicy.max_delay_seconds`
+    (`Retry-After`) are returned as they are instead of being waited for.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        circuit_breaker: HostCircuitBreaker,
+        retry_policy: RetryPolicy | None = None,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        self._transport = transport
+        self._circuit_breaker = circuit_breaker
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._sleep = sleep
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        attempts = (
+            self._retry_policy.max_attempts
+            if request.method in IDEMPOTENT_METHODS
+            and not request.extensions.get(SKIP_RETRIES_EXTENSION)
+            else 1
+        )
+
+        for retry in range(attempts):
+            is_last_attempt = retry + 1 >= attempts
+            self._circuit_breaker.before_request(host)
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                self._circuit_breaker.record_failure(host)
+                # A read timeout already waited the full timeout; retrying it
+                # would hold the caller for several more before it fails.
+                if is_last_attempt or isinstance(e, httpx.ReadTimeout):
+                    raise
+            else:
+                if response.status_code >= 500:
+                    self._circuit_breaker.record_failure(host)
+                else:
+                    self._circuit_breaker.record_success(host)
+
+                if is_last_attempt or not self._should_retry(response):
+                    return response
+
+                await response.aclose()
+
+            await self._sleep(self._retry_policy.get_delay(retry))
+
+        raise AssertionError("unreachable")
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def _should_retry(self, response: httpx.Response) -> bool:
+        if response.status_code not in RETRYABLE_STATUS_CODES:
+            return False
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return (
+            retry_after is None or retry_after <= self._retry_policy.max_delay_seconds
+        )
+
+
+host_circuit_breaker = HostCircuitBreaker()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+JOURNAL_FILE_NAME = "journal.jsonl"
+
+
+class JournalEntry(BaseModel):
+    url: str
+    file_name: str
+    size_in_bytes: int
+    sha256: str
+
+
+def hash_file(file_path: Path) -> hashlib._Hash:
+    """
+    Returns the SHA-256 state after `file_path`, so a download resumed
+    after it can keep hashing where the file ends.
+    """
+    digest = hashlib.sha256()
+    with file_path.open("rb") as file:
+        while block := file.read(1024 * 1024):
+            digest.update(block)
+
+    return digest
+
+
+class DownloadJournal:
+    """
+    Append-only record of the segments fully downloaded into a directory.
+
+    Every completed segment appends one JSON line, so an interrupted download
+    loses at most the lines being written, and a retried download can skip
+    every segment whose file is still on disk with the recorded size (and,
+    with `verify_checksums`, the recorded SHA-256).
+    """
+
+    def __init__(self, directory: Path | str, verify_checksums: bool = False) -> None:
+        self._path = Path(directory) / JOURNAL_FILE_NAME
+        self._verify_checksums = verify_checksums
+        self._entries: dict[str, JournalEntry] = {}
+
+        if self._path.exists():
+            for line in self._path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = JournalEntry.model_validate_json(line)
+                except ValidationError:
+                    # A line torn by a crash; its segment is downloaded again.
+                    continue
+
+                self._entries[entry.url] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_completed(self, url: str, file_path: Path) -> JournalEntry | None:
+        """
+        Returns the entry of `url` if `file_path` still holds what was
+        downloaded for it.
+        """
+        entry = self._entries.get(url)
+        if entry is None or entry.file_name != file_path.name:
+            return None
+
+        try:
+            if file_path.stat().st_size != entry.size_in_bytes:
+                return None
+        except FileNotFoundError:
+            return None
+
+        if self._verify_checksums and hash_file(file_path).hexdigest() != entry.sha256:
+            return None
+
+        return entry
+
+    def record(self, entry: JournalEntry) -> None:
+        self._entries[entry.url] = entry
+        with self._path.open("a", encoding="utf-8") as journal:
+            journal.write(entry.model_dump_json() + "\n")
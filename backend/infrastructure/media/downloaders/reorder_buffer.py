@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+
+from core.config import config
+
+
+class SegmentReorderBuffer:
+    """
+    Puts segments downloaded out of order back in order.
+
+    `put` accepts the segment with index i only once i is within `capacity`
+    segments of the next one to read, so a few slow segments hold back at
+    most `capacity` finished ones in memory. The next expected segment is
+    always accepted, so the buffer cannot deadlock on it.
+    """
+
+    def __init__(self, capacity: int | None = None) -> None:
+        self._capacity = capacity or config.media_stream_reorder_window
+        self._next_index = 0
+        self._pending: dict[int, bytes] = {}
+        self._condition = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def put(self, index: int, data: bytes) -> None:
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: index < self._next_index + self._capacity
+            )
+            self._pending[index] = data
+            self._condition.notify_all()
+
+    async def get(self) -> bytes:
+        """
+        Returns the next segment in order, waiting for it if needed.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._next_index in self._pending)
+            data = self._pending.pop(self._next_index)
+            self._next_index += 1
+            self._condition.notify_all()
+            return data
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from urllib.parse import urlparse
+
+import httpx
+
+from core.config import config
+from core.errors import HostUnavailableError
+from domain.media.value_objects import MediaDownloadableLink
+from infrastructure.http.resilience import RETRYABLE_STATUS_CODES, RetryPolicy
+
+type SegmentDownload[T] = Callable[[int, MediaDownloadableLink], Awaitable[T]]
+
+
+def is_retryable_error(error: Exception) -> bool:
+    if isinstance(error, HostUnavailableError):
+        return True
+
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+
+    return isinstance(error, httpx.TransportError)
+
+
+class SegmentScheduler:
+    """
+    Downloads the segments of a stream through a bounded window.
+
+    At most `max_in_flight` segments are downloaded at once, and at most
+    `per_host_in_flight` from the same host. Segments are dispatched in
+    order, so the first ones finish first. A segment failing with a
+    transient error is retried with backoff, or once its host's circuit
+    closes again; a segment that still fails cancels the download.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int | None = None,
+        per_host_in_flight: int | None = None,
+        retry_policy: RetryPolicy | None = None,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        self._max_in_flight = max_in_flight or config.media_download_max_in_flight
+        self._per_host_in_flight = (
+            per_host_in_flight or config.media_download_per_host_in_flight
+        )
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_attempts=config.media_segment_max_attempts
+        )
+        self._sleep = sleep
+
+    async def run[T](
+        self,
+        segments: Sequence[MediaDownloadableLink],
+        download: SegmentDownload[T],
+    ) -> list[T]:
+        """
+        Calls `download(index, segment)` for every segment and returns the
+        results in the order of `segments`.
+        """
+        results: list[T | None] = [None] * len(segments)
+        pending = iter(enumerate(segments))
+        host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+        async def worker() -> None:
+            for index, segment in pending:
+                host = urlparse(segment.url).hostname or ""
+                semaphore = host_semaphores.setdefault(
+                    host, asyncio.Semaphore(self._per_host_in_flight)
+                )
+                async with semaphore:
+                    results[index] = await self._download_with_retries(
+                        index, segment, download
+                    )
+
+        workers = min(self._max_in_flight, len(segments))
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(workers):
+                    group.create_task(worker())
+        except ExceptionGroup as errors:
+            # Callers see the failing segment's own error.
+            raise errors.exceptions[0] from None
+
+        return results  # type: ignore[return-value]
+
+    async def _download_with_retries[T](
+        self,
+        index: int,
+        segment: MediaDownloadableLink,
+        download: SegmentDownload[T],
+    ) -> T:
+        for retry in range(self._retry_policy.max_attempts):
+            try:
+                return await download(index, segment)
+            except Exception as e:
+                is_last_attempt = retry + 1 >= self._retry_policy.max_attempts
+                if is_last_attempt or not is_retryable_error(e):
+                    raise
+
+                print(f"Retrying segment {segment.url} after {e!r}")
+                delay = self._retry_policy.get_delay(retry)
+                # An open circuit rejects every request until it half-opens.
+                if isinstance(e, HostUnavailableError):
+                    delay = max(delay, e.retry_in_seconds)
+
+            await self._sleep(delay)
+
+        raise AssertionError("unreachable")
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import os
 from pathlib import Path
-from typing import Awaitable
 from urllib.parse import urlparse
 
 import aiofiles
@@ -10,16 +11,72 @@ import httpx
 from concurrent.futures import ThreadPoolExecutor
 
 from core.config import config
-from domain.media.protocols import VideoDownloaderProtocol
+from domain.media.protocols import MediaSink, StreamingVideoDownloaderProtocol
 from domain.media.supported_media_types import SupportedStreamTypes
 from domain.media.value_objects import (
     DownloadedMedia,
     DownloadedMediaChunk,
     MediaDownloadableLink,
 )
+from infrastructure.http.client_provider import build_http_client
+from infrastructure.http.rate_limiter import SKIP_RATE_LIMIT_EXTENSION
+from infrastructure.http.resilience import SKIP_RETRIES_EXTENSION
+from infrastructure.media.downloaders.download_journal import (
+    DownloadJournal,
+    JournalEntry,
+    hash_file,
+)
+from infrastructure.media.downloaders.reorder_buffer import SegmentReorderBuffer
+from infrastructure.media.downloaders.segment_scheduler import SegmentScheduler
+
+# Segments are paced and retried by the SegmentScheduler, not by the per-host
+# limiter and retries meant for crawling pages.
+_SEGMENT_REQUEST_EXTENSIONS = {
+    SKIP_RATE_LIMIT_EXTENSION: True,
+    SKIP_RETRIES_EXTENSION: True,
+}
+
+
+def _validator_path(part_path: Path) -> Path:
+    return part_path.with_name(f"{part_path.name}.validator")
+
+
+def _resume_validator(response: httpx.Response) -> str | None:
+    """
+    The validator to send as `If-Range` when resuming `response`'s body.
+    `If-Range` only accepts strong ETags, so weak ones fall back to
+    `Last-Modified`.
+    """
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+
+    return response.headers.get("Last-Modified")
+
 
+class _RangesNotSupportedError(Exception):
+    """
+    The server answered a range request with the whole file, or with other
+    bytes than the ones asked for.
+    """
+
+
+class VideoDownloader(StreamingVideoDownloaderProtocol):
+    """
+    Downloads the segments of a stream into `path_to_download`.
+
+    Completed segments are recorded in a `DownloadJournal` in that directory
+    and segments are written to `.part` files first, so downloading into the
+    same directory again skips finished segments and resumes partial ones
+    with HTTP `Range` requests. The ETag or Last-Modified of a partial
+    segment is kept next to it and sent as `If-Range`, so a segment that
+    changed in between is downloaded again from the start. Large files whose server accepts ranges
+    (see `DirectMP4Resolver`) are fetched over several connections at once.
+
+    `stream_video` skips the disk: segments are kept in memory only until
+    every segment before them has been handed over.
+    """
 
-class VideoDownloader(VideoDownloaderProtocol):
     def __init__(
         self,
         path_to_download: Path | str,
@@ -27,37 +84,36 @@ class VideoDownloader(VideoDownloaderProtocol):
         stream_type: SupportedStreamTypes,
         source_url: str,
         client: httpx.AsyncClient | None = None,
+        scheduler: SegmentScheduler | None = None,
     ) -> None:
         self.path_to_download = path_to_download
         self.video_urls = chunks_data
         self._stream_type = stream_type
         self._source_url = source_url
-        self._client = client or httpx.AsyncClient(
-            headers={"User-Agent": config.media_http_user_agent},
-            follow_redirects=config.media_http_follow_redirects,
-            timeout=config.media_http_timeout_seconds,
-        )
+        self._client = client or build_http_client()
         self._is_client_owned = client is None
+        self._scheduler = scheduler or SegmentScheduler()
+        self._journal: DownloadJournal | None = None
 
     async def download_video(self) -> DownloadedMedia:
         download_dir = Path(self.path_to_download)
         download_dir.mkdir(parents=True, exist_ok=True)
+        self._journal = DownloadJournal(
+            download_dir, verify_checksums=config.media_download_verify_checksums
+        )
 
         ordered_urls = self._prepare_ordered_urls()
 
         downloaded_chunks: list[DownloadedMediaChunk] = []
         try:
-            jobs: list[Awaitable[DownloadedMediaChunk]] = []
-            for index, chunk in enumerate(ordered_urls):
-                jobs.append(
-                    self._download_chunk(
-                        chunk=chunk,
-                        chunk_index=index,
-                        download_dir=download_dir,
-                    )
-                )
-
-            downloaded_chunks = await asyncio.gather(*jobs)
+            downloaded_chunks = await self._scheduler.run(
+                ordered_urls,
+                lambda index, chunk: self._download_chunk(
+                    chunk=chunk,
+                    chunk_index=index,
+                    download_dir=download_dir,
+                ),
+            )
         finally:
             if self._is_client_owned:
                 await self._client.aclose()
@@ -68,6 +124,43 @@ class VideoDownloader(VideoDownloaderProtocol):
             chunks=downloaded_chunks,
         )
 
+    async def stream_video(self, write: MediaSink) -> None:
+        ordered_urls = self._prepare_ordered_urls()
+        buffer = SegmentReorderBuffer()
+
+        async def forward_in_order() -> None:
+            for _ in ordered_urls:
+                await write(await buffer.get())
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(
+                    self._scheduler.run(
+                        ordered_urls,
+                        lambda index, chunk: self._fetch_chunk(buffer, index, chunk),
+                    )
+                )
+                group.create_task(forward_in_order())
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0] from None
+        finally:
+            if self._is_client_owned:
+                await self._client.aclose()
+
+    async def _fetch_chunk(
+        self,
+        buffer: SegmentReorderBuffer,
+        chunk_index: int,
+        chunk: MediaDownloadableLink,
+    ) -> None:
+        # The segment is read whole before it is buffered, so a retried
+        # segment never hands over half of its bytes.
+        response = await self._client.get(
+            chunk.url, extensions=_SEGMENT_REQUEST_EXTENSIONS
+        )
+        response.raise_for_status()
+        await buffer.put(chunk_index, response.content)
+
     def _extract_extension(self, url: str) -> str:
         parsed = urlparse(url)
         extension = Path(parsed.path).suffix
@@ -82,26 +175,45 @@ class VideoDownloader(VideoDownloaderProtocol):
         chunk_index: int,
         download_dir: Path,
     ) -> DownloadedMediaChunk:
-        async with self._client.stream("GET", chunk.url) as stream:
-            extension = self._extract_extension(chunk.url)
-            segment_label = "init" if chunk.is_initialization_segment else "chunk"
+        assert self._journal is not None
+        extension = self._extract_extension(chunk.url)
+        segment_label = "init" if chunk.is_initialization_segment else "chunk"
 
-            file_name = f"{chunk_index:05d}_{segment_label}{extension}"
-            file_path = download_dir / file_name
-
-            stream.raise_for_status()
+        file_name = f"{chunk_index:05d}_{segment_label}{extension}"
+        file_path = download_dir / file_name
 
-            async with aiofiles.open(file_path, "wb") as file:
-                async for content in stream.aiter_bytes():
-                    await file.write(content)
+        if self._journal.get_completed(chunk.url, file_path) is None:
+            part_path = file_path.with_name(f"{file_name}.part")
+            sha256 = None
+            if self._should_download_ranges(chunk):
+                try:
+                    sha256 = await self._download_ranges(
+                        chunk.url, chunk.size_in_bytes or 0, part_path
+                    )
+                except _RangesNotSupportedError:
+                    print(f"Ranges not honoured for {chunk.url}, using one stream")
+                    part_path.unlink(missing_ok=True)
 
-            return DownloadedMediaChunk(
-                source_url=chunk.url,
-                file_path=file_path,
-                sequence_number=chunk.sequence_number,
-                is_initialization_segment=chunk.is_initialization_segment,
+            if sha256 is None:
+                sha256 = await self._download_to_part(chunk.url, part_path)
+            os.replace(part_path, file_path)
+            _validator_path(part_path).unlink(missing_ok=True)
+            self._journal.record(
+                JournalEntry(
+                    url=chunk.url,
+                    file_name=file_name,
+                    size_in_bytes=file_path.stat().st_size,
+                    sha256=sha256,
+                )
             )
 
+        return DownloadedMediaChunk(
+            source_url=chunk.url,
+            file_path=file_path,
+            sequence_number=chunk.sequence_number,
+            is_initialization_segment=chunk.is_initialization_segment,
+        )
+
         # response = await self._client.get(chunk.url)
         # response.raise_for_status()
         #
@@ -111,6 +223,138 @@ class VideoDownloader(VideoDownloaderProtocol):
         # file_path = download_dir / file_name
         # file_path.write_bytes(response.content)
 
+    async def _download_to_part(self, url: str, part_path: Path) -> str:
+        """
+        Downloads `url` into `part_path`, continuing after the bytes a
+        previous attempt left there when the server honours `Range`.
+        Returns the SHA-256 of the whole file.
+        """
+        # Bytes without a validator cannot be told apart from a different
+        # version of the file, so they are downloaded again.
+        validator_path = _validator_path(part_path)
+        validator = (
+            validator_path.read_text()
+            if part_path.exists() and validator_path.exists()
+            else None
+        )
+        offset = part_path.stat().st_size if validator else 0
+        headers = (
+            {"Range": f"bytes={offset}-", "If-Range": validator} if offset else None
+        )
+
+        async with self._client.stream(
+            "GET", url, headers=headers, extensions=_SEGMENT_REQUEST_EXTENSIONS
+        ) as stream:
+            is_range_stale = (
+                offset > 0
+                and stream.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE
+            )
+            if not is_range_stale:
+                stream.raise_for_status()
+
+                is_resumed = stream.status_code == httpx.codes.PARTIAL_CONTENT
+                if not is_resumed:
+                    # A 200 also answers an `If-Range` whose validator no
+                    # longer matches; the new body replaces the old bytes.
+                    new_validator = _resume_validator(stream)
+                    if new_validator:
+                        validator_path.write_text(new_validator)
+                    else:
+                        validator_path.unlink(missing_ok=True)
+
+                digest = (
+                    await asyncio.to_thread(hash_file, part_path)
+                    if is_resumed
+                    else hashlib.sha256()
+                )
+                async with aiofiles.open(
+                    part_path, "ab" if is_resumed else "wb"
+                ) as file:
+                    async for content in stream.aiter_bytes():
+                        digest.update(content)
+                        await file.write(content)
+
+                return digest.hexdigest()
+
+        # The partial file does not fit the remote one, start over.
+        part_path.unlink()
+        validator_path.unlink(missing_ok=True)
+        return await self._download_to_part(url, part_path)
+
+    def _should_download_ranges(self, chunk: MediaDownloadableLink) -> bool:
+        return (
+            chunk.supports_ranges
+            and chunk.size_in_bytes is not None
+            and chunk.size_in_bytes >= config.media_ranged_download_min_bytes
+            and config.media_ranged_download_connections > 1
+        )
+
+    async def _download_ranges(self, url: str, size: int, part_path: Path) -> str:
+        """
+        Downloads `url` over several connections, each fetching one byte
+        range straight into its place in a preallocated `part_path`.
+        Returns the SHA-256 of the whole file.
+        """
+        range_size = -(-size // config.media_ranged_download_connections)
+        ranges = [
+            (start, min(start + range_size, size) - 1)
+            for start in range(0, size, range_size)
+        ]
+
+        # Ranges land out of order, so a previous partial file cannot be
+        # continued and is started over.
+        fd = os.open(part_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        # Writes go to one thread, off the event loop. It runs them in order,
+        # so the file is closed only after a write still in flight when a
+        # range failed.
+        writer = ThreadPoolExecutor(max_workers=1)
+        try:
+            os.ftruncate(fd, size)
+            async with asyncio.TaskGroup() as group:
+                for start, end in ranges:
+                    group.create_task(self._download_range(url, fd, start, end, writer))
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0] from None
+        finally:
+            writer.submit(os.close, fd)
+            writer.shutdown(wait=False)
+
+        return (await asyncio.to_thread(hash_file, part_path)).hexdigest()
+
+    async def _download_range(
+        self,
+        url: str,
+        fd: int,
+        start: int,
+        end: int,
+        writer: ThreadPoolExecutor,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        position = start
+        async with self._client.stream(
+            "GET",
+            url,
+            headers={"Range": f"bytes={start}-{end}"},
+            extensions=_SEGMENT_REQUEST_EXTENSIONS,
+        ) as stream:
+            stream.raise_for_status()
+            # e.g. "bytes 100-199/1000"
+            content_range = stream.headers.get("Content-Range", "")
+            range_start = content_range.removeprefix("bytes ").partition("-")[0]
+            if stream.status_code != httpx.codes.PARTIAL_CONTENT or range_start != str(
+                start
+            ):
+                raise _RangesNotSupportedError(url)
+
+            async for content in stream.aiter_bytes():
+                await loop.run_in_executor(writer, os.pwrite, fd, content, position)
+                position += len(content)
+
+        if position != end + 1:
+            raise httpx.RemoteProtocolError(
+                f"Range {start}-{end} of {url} ended at byte {position}"
+            )
+
     def _prepare_ordered_urls(self) -> list[MediaDownloadableLink]:
         if self._is_sorted(self.video_urls):
             return self.video_urls
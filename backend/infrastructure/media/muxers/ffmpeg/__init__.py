@@ -7,6 +7,12 @@ from infrastructure.media.muxers.ffmpeg.ffmpeg_command import (
     BaseFFMpegCommand,
     FFMpegResult,
 )
+from infrastructure.media.muxers.ffmpeg.ffprobe import (
+    MediaProbe,
+    can_stream_copy,
+    probe_media,
+)
+from infrastructure.media.muxers.ffmpeg.piped_stream_command import PipedStreamMux
 
 __all__ = [
     "BaseFFMpegCommand",
@@ -14,4 +20,8 @@ __all__ = [
     "DASHFFMpegConcat",
     "HLSFFMpegConcat",
     "DirectFileCompression",
+    "PipedStreamMux",
+    "MediaProbe",
+    "can_stream_copy",
+    "probe_media",
 ]
@@ -24,8 +24,11 @@ class DASHFFMpegConcat(BaseFFMpegCommand):
         output_path: Path,
         ffmpeg_binary: str | None = None,
         threads_to_use: int | None = None,
+        stream_copy: bool = False,
     ) -> None:
-        super().__init__(chunks, output_path, ffmpeg_binary, threads_to_use)
+        super().__init__(
+            chunks, output_path, ffmpeg_binary, threads_to_use, stream_copy
+        )
         self._files: list[Path] | None = None
 
     async def execute_command(self) -> FFMpegResult:
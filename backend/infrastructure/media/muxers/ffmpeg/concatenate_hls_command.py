@@ -17,8 +17,11 @@ class HLSFFMpegConcat(BaseFFMpegCommand):
         output_path: Path,
         ffmpeg_binary: str | None = None,
         threads_to_use: int | None = None,
+        stream_copy: bool = False,
     ) -> None:
-        super().__init__(chunks, output_path, ffmpeg_binary, threads_to_use)
+        super().__init__(
+            chunks, output_path, ffmpeg_binary, threads_to_use, stream_copy
+        )
 
     async def execute_command(self) -> FFMpegResult:
         concat_file = self._output_path.with_suffix(".concat.txt")
@@ -18,8 +18,11 @@ class DirectFileCompression(BaseFFMpegCommand):
         output_path: Path,
         ffmpeg_binary: str | None = None,
         threads_to_use: int | None = None,
+        stream_copy: bool = False,
     ) -> None:
-        super().__init__(chunks, output_path, ffmpeg_binary, threads_to_use)
+        super().__init__(
+            chunks, output_path, ffmpeg_binary, threads_to_use, stream_copy
+        )
 
     async def execute_command(self) -> FFMpegResult:
         if len(self._chunks) != 1:
@@ -26,10 +26,12 @@ class BaseFFMpegCommand(ABC):
         output_path: Path,
         ffmpeg_binary: str | None = None,
         threads_to_use: int | None = None,
+        stream_copy: bool = False,
     ) -> None:
         self._ffmpeg_binary = ffmpeg_binary or config.ffmpeg_binary
         self._chunks = chunks
         self._output_path = output_path
+        self._stream_copy = stream_copy
         if threads_to_use is not None and threads_to_use > 0:
             self._threads_to_use = threads_to_use
         else:
@@ -85,10 +87,26 @@ class BaseFFMpegCommand(ABC):
         return [
             "-threads",
             str(self._threads_to_use),
-            *self._build_transcode_flags(),
+            *(
+                self._build_stream_copy_flags()
+                if self._stream_copy
+                else self._build_transcode_flags()
+            ),
             str(self._output_path),
         ]
 
+    def _build_stream_copy_flags(self) -> list[str]:
+        # Subtitle and data tracks (e.g. timed ID3 in MPEG-TS) cannot be
+        # copied into an MP4, so only audio and video are kept.
+        return [
+            "-c",
+            "copy",
+            "-sn",
+            "-dn",
+            "-movflags",
+            config.ffmpeg_movflags,
+        ]
+
     def _build_transcode_flags(self) -> list[str]:
         return [
             "-c:v",
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Annotated
+
+from pydantic import BaseModel, BeforeValidator, Field, ValidationError
+
+from core.config import config
+
+
+def _parse_bit_rate(value: object) -> object:
+    # ffprobe reports an unknown bitrate as "N/A".
+    if isinstance(value, str) and not value.isdigit():
+        return None
+
+    return value
+
+
+type BitRate = Annotated[int | None, BeforeValidator(_parse_bit_rate)]
+
+
+class ProbedStream(BaseModel):
+    codec_type: str | None = None
+    codec_name: str | None = None
+    bit_rate: BitRate = None
+
+
+class ProbedFormat(BaseModel):
+    bit_rate: BitRate = None
+
+
+class MediaProbe(BaseModel):
+    streams: list[ProbedStream] = Field(default_factory=list)
+    format: ProbedFormat = Field(default_factory=ProbedFormat)
+
+    @property
+    def video_streams(self) -> list[ProbedStream]:
+        return [stream for stream in self.streams if stream.codec_type == "video"]
+
+    @property
+    def audio_streams(self) -> list[ProbedStream]:
+        return [stream for stream in self.streams if stream.codec_type == "audio"]
+
+    @property
+    def bit_rate(self) -> int | None:
+        """
+        The bitrate of the video, falling back to the whole container's.
+        Streams in MPEG-TS often do not report one.
+        """
+        for stream in self.video_streams:
+            if stream.bit_rate is not None:
+                return stream.bit_rate
+
+        return self.format.bit_rate
+
+
+async def probe_media(
+    input_path: Path, ffprobe_binary: str | None = None
+) -> MediaProbe | None:
+    """
+    Reads the streams of `input_path` with ffprobe. Returns None when the
+    file cannot be probed, so callers fall back to transcoding.
+    """
+    args = [
+        ffprobe_binary or config.ffprobe_binary,
+        "-v",
+        "error",
+        "-show_entries",
+        "stream=codec_type,codec_name,bit_rate:format=bit_rate",
+        "-of",
+        "json",
+        str(input_path),
+    ]
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as e:
+        print(f"Could not run ffprobe: {e!r}")
+        return None
+
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        print(f"ffprobe failed for {input_path}: {stderr.decode(errors='ignore')}")
+        return None
+
+    try:
+        return MediaProbe.model_validate_json(stdout)
+    except ValidationError as e:
+        print(f"Unexpected ffprobe output for {input_path}: {e}")
+        return None
+
+
+def can_stream_copy(probe: MediaProbe | None) -> bool:
+    """
+    Whether the probed media already fits the output profile, so its
+    streams can be copied into the MP4 instead of transcoded.
+    """
+    if probe is None or not probe.video_streams:
+        return False
+
+    video_codecs = config.ffmpeg_stream_copy_video_codecs
+    audio_codecs = config.ffmpeg_stream_copy_audio_codecs
+    if any(stream.codec_name not in video_codecs for stream in probe.video_streams):
+        return False
+
+    if any(stream.codec_name not in audio_codecs for stream in probe.audio_streams):
+        return False
+
+    # An unknown bitrate may well be above the limit, so it does not fit.
+    max_bit_rate = config.ffmpeg_stream_copy_max_bit_rate
+    bit_rate = probe.bit_rate
+    return max_bit_rate is None or (bit_rate is not None and bit_rate <= max_bit_rate)
@@ -0,0 +1,103 @@
+import asyncio
+from asyncio.subprocess import Process
+from pathlib import Path
+
+from core.errors.media_related import FFmpegExecutionError
+from domain.media.protocols import MediaFeed
+from domain.media.supported_media_types import SupportedStreamTypes
+
+from .ffmpeg_command import BaseFFMpegCommand, FFMpegResult
+
+
+class PipedStreamMux(BaseFFMpegCommand):
+    """
+    Muxes a stream written into ffmpeg's stdin while it is being downloaded.
+
+    The segments of HLS (MPEG-TS or fMP4) and DASH (fMP4) streams can be
+    joined by concatenating their bytes, so `feed` writes them in order
+    straight into `pipe:0` and download and transcode overlap.
+
+    The streams are always transcoded: a failed stream copy could not be
+    retried as a transcode, since the segments already fed are gone.
+    """
+
+    def __init__(
+        self,
+        feed: MediaFeed,
+        stream_type: SupportedStreamTypes,
+        output_path: Path,
+        ffmpeg_binary: str | None = None,
+        threads_to_use: int | None = None,
+    ) -> None:
+        super().__init__([], output_path, ffmpeg_binary, threads_to_use)
+        self._feed = feed
+        self.stream_type = stream_type
+        self._ffmpeg_args: list[str] = []
+        self._process: Process | None = None
+        self._stderr_task: asyncio.Task[bytes] | None = None
+
+    async def execute_command(self) -> FFMpegResult:
+        try:
+            await self._feed(self._write)
+        except (BrokenPipeError, ConnectionResetError):
+            # ffmpeg stopped reading; its exit code and stderr tell why.
+            pass
+        except BaseException:
+            if self._process is not None:
+                self._process.kill()
+                await self._process.wait()
+            if self._stderr_task is not None:
+                self._stderr_task.cancel()
+            raise
+
+        process = self._process or await self._start_process()
+        return await self._finish_process(process)
+
+    async def _write(self, data: bytes) -> None:
+        process = self._process or await self._start_process()
+        assert process.stdin is not None, "stdin should always be opened"
+        process.stdin.write(data)
+        await process.stdin.drain()
+
+    async def _start_process(self) -> Process:
+        self._ffmpeg_args = [
+            self._ffmpeg_binary,
+            "-y",
+            "-i",
+            "pipe:0",
+            *self._build_common_output_args(),
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *self._ffmpeg_args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            stdin=asyncio.subprocess.PIPE,
+        )
+        assert process.stderr is not None, "stderr should always be opened"
+
+        # ffmpeg logs while it reads, so stderr is drained meanwhile; a full
+        # stderr pipe would stop it from reading stdin.
+        self._stderr_task = asyncio.create_task(process.stderr.read())
+        self._process = process
+        return process
+
+    async def _finish_process(self, process: Process) -> FFMpegResult:
+        assert process.stdin is not None, "stdin should always be opened"
+        assert self._stderr_task is not None, "stderr is read once started"
+
+        process.stdin.close()
+        try:
+            await process.stdin.wait_closed()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+        return_code = await process.wait()
+        stderr = (await self._stderr_task).decode("utf-8", errors="ignore")
+        if return_code != 0:
+            raise FFmpegExecutionError(
+                command=self._ffmpeg_args,
+                return_code=return_code,
+                stderr=stderr,
+            )
+
+        return FFMpegResult(stderr=stderr, output_path=self._output_path)
@@ -5,8 +5,8 @@ from pathlib import Path
 from uuid import uuid4
 
 from core.config import config
-from core.errors import MediaMuxNoChunksError
-from domain.media.protocols import MediaMuxerProtocol
+from core.errors import FFmpegExecutionError, MediaMuxNoChunksError
+from domain.media.protocols import MediaFeed, StreamingMediaMuxerProtocol
 from domain.media.supported_media_types import SupportedStreamTypes
 from domain.media.value_objects import DownloadedMedia, DownloadedMediaChunk, MuxedMedia
 from infrastructure.media.muxers.ffmpeg.concatenate_dash_command import DASHFFMpegConcat
@@ -15,17 +15,34 @@ from infrastructure.media.muxers.ffmpeg.direct_file_compression_command import (
     DirectFileCompression,
 )
 from infrastructure.media.muxers.ffmpeg.ffmpeg_command import BaseFFMpegCommand
+from infrastructure.media.muxers.ffmpeg.ffprobe import can_stream_copy, probe_media
+from infrastructure.media.muxers.ffmpeg.piped_stream_command import PipedStreamMux
 
+STREAMABLE_STREAM_TYPES = frozenset(
+    {SupportedStreamTypes.HLS, SupportedStreamTypes.DASH}
+)
+
+
+class VideoMuxer(StreamingMediaMuxerProtocol):
+    """
+    Muxes downloaded media into a single MP4 with ffmpeg.
+
+    Media whose codecs and bitrate already fit the output profile (see
+    `can_stream_copy`) is remuxed with `-c copy`, which is far cheaper than
+    a transcode; anything else, or anything ffprobe cannot read, is
+    transcoded. Streams muxed with `mux_stream` are always transcoded.
+    """
 
-class VideoMuxer(MediaMuxerProtocol):
     def __init__(
         self,
         static_media_root: Path | str | None = None,
         ffmpeg_binary: str | None = None,
         ffmpeg_threads: int | None = None,
+        ffprobe_binary: str | None = None,
     ) -> None:
         self._static_media_root = Path(static_media_root or config.media_static_root)
         self._ffmpeg_binary = ffmpeg_binary or config.ffmpeg_binary
+        self._ffprobe_binary = ffprobe_binary or config.ffprobe_binary
         self._configured_threads = ffmpeg_threads
         self._commands_by_stream_type: dict[
             SupportedStreamTypes, type[BaseFFMpegCommand]
@@ -40,26 +57,79 @@ class VideoMuxer(MediaMuxerProtocol):
         downloaded_media: DownloadedMedia,
         output_file_name: str | None = None,
     ) -> MuxedMedia:
-        self._static_media_root.mkdir(parents=True, exist_ok=True)
-
         if not downloaded_media.chunks:
             raise MediaMuxNoChunksError(source_url=downloaded_media.source_url)
 
-        output_stem = output_file_name or uuid4().hex
-        output_path = self._static_media_root / f"{output_stem}.mp4"
+        output_path = self._prepare_output_path(output_file_name)
         sorted_chunks = self._prepare_chunks(downloaded_media.chunks)
+        # The first chunk is the initialization segment when there is one,
+        # which is where fMP4 streams describe their codecs.
+        stream_copy = await self._should_stream_copy(sorted_chunks[0].file_path)
         command = self._build_command(
-            downloaded_media.stream_type, sorted_chunks, output_path
+            downloaded_media.stream_type, sorted_chunks, output_path, stream_copy
+        )
+
+        try:
+            await command.execute_command()
+        except FFmpegExecutionError:
+            if not stream_copy:
+                raise
+
+            print(f"Stream copy of {downloaded_media.source_url} failed, transcoding")
+            command = self._build_command(
+                downloaded_media.stream_type, sorted_chunks, output_path
+            )
+            await command.execute_command()
+
+        return self._build_muxed_media(
+            downloaded_media.source_url, downloaded_media.stream_type, output_path
+        )
+
+    async def mux_stream(
+        self,
+        source_url: str,
+        stream_type: SupportedStreamTypes,
+        feed: MediaFeed,
+        output_file_name: str | None = None,
+    ) -> MuxedMedia:
+        """
+        Muxes a stream while `feed` downloads it. Only stream types whose
+        segments can be concatenated byte by byte are supported; a progressive
+        file may keep its index at the end, out of reach of a pipe.
+        """
+        if stream_type not in STREAMABLE_STREAM_TYPES:
+            raise ValueError(f"Stream type cannot be muxed as a stream: {stream_type}")
+
+        output_path = self._prepare_output_path(output_file_name)
+        command = PipedStreamMux(
+            feed=feed,
+            stream_type=stream_type,
+            output_path=output_path,
+            ffmpeg_binary=self._ffmpeg_binary,
+            threads_to_use=self._resolve_thread_count(),
         )
 
         await command.execute_command()
-        return self._build_muxed_media(downloaded_media, output_path)
+        return self._build_muxed_media(source_url, stream_type, output_path)
+
+    async def _should_stream_copy(self, input_path: Path) -> bool:
+        if not config.ffmpeg_stream_copy:
+            return False
+
+        probe = await probe_media(input_path, self._ffprobe_binary)
+        return can_stream_copy(probe)
+
+    def _prepare_output_path(self, output_file_name: str | None) -> Path:
+        self._static_media_root.mkdir(parents=True, exist_ok=True)
+        output_stem = output_file_name or uuid4().hex
+        return self._static_media_root / f"{output_stem}.mp4"
 
     def _build_command(
         self,
         stream_type: SupportedStreamTypes,
         chunks: list[DownloadedMediaChunk],
         output_path: Path,
+        stream_copy: bool = False,
     ) -> BaseFFMpegCommand:
         command_type = self._commands_by_stream_type.get(stream_type)
         if command_type is None:
@@ -70,17 +140,19 @@ class VideoMuxer(MediaMuxerProtocol):
             output_path=output_path,
             ffmpeg_binary=self._ffmpeg_binary,
             threads_to_use=self._resolve_thread_count(),
+            stream_copy=stream_copy,
         )
 
     def _build_muxed_media(
         self,
-        downloaded_media: DownloadedMedia,
+        source_url: str,
+        stream_type: SupportedStreamTypes,
         output_path: Path,
     ) -> MuxedMedia:
         static_prefix = config.media_static_url_prefix.rstrip("/")
         return MuxedMedia(
-            source_url=downloaded_media.source_url,
-            stream_type=downloaded_media.stream_type,
+            source_url=source_url,
+            stream_type=stream_type,
             output_path=output_path,
             static_url_path=f"{static_prefix}/{output_path.name}",
         )
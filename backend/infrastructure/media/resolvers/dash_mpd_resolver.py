@@ -20,6 +20,7 @@ from core.utils.iso import parse_iso_8601_duration
 from domain.media.protocols import StreamResolverProtocol
 from domain.media.supported_media_types import SupportedStreamTypes
 from domain.media.value_objects import MediaDownloadableLink, ResolvedMediaStream
+from infrastructure.http.client_provider import build_http_client
 from infrastructure.media.resolvers.dash_contexts import (
     DashManifestContext,
     DashSelectionContext,
@@ -30,14 +31,8 @@ class DashMPDResolver(StreamResolverProtocol):
     stream_type: SupportedStreamTypes = SupportedStreamTypes.DASH
 
     def __init__(self, client: httpx.AsyncClient | None = None) -> None:
-        self._client = client or httpx.AsyncClient(
-            headers={
-                "User-Agent": config.media_http_user_agent,
-                "Accept": config.media_http_accept_dash,
-            },
-            follow_redirects=config.media_http_follow_redirects,
-            timeout=config.media_http_timeout_seconds,
-        )
+        self._request_headers = {"Accept": config.media_http_accept_dash}
+        self._client = client or build_http_client(headers=self._request_headers)
         self._is_client_owned = client is None
 
     async def can_resolve(self, stream_url: str) -> bool:
@@ -49,7 +44,7 @@ class DashMPDResolver(StreamResolverProtocol):
             return False
 
         try:
-            response = await self._client.get(stream_url)
+            response = await self._client.get(stream_url, headers=self._request_headers)
             response.raise_for_status()
         except httpx.HTTPError:
             return False
@@ -57,7 +52,9 @@ class DashMPDResolver(StreamResolverProtocol):
         return "<MPD" in response.text
 
     async def resolve_stream(self, video_to_resolve: str) -> ResolvedMediaStream:
-        response = await self._client.get(video_to_resolve)
+        response = await self._client.get(
+            video_to_resolve, headers=self._request_headers
+        )
         response.raise_for_status()
 
         manifest = self._build_manifest_context(video_to_resolve, response.text)
@@ -1,14 +1,21 @@
 from urllib.parse import urlparse
 
-from core.errors import DirectMediaInvalidUrlError
+import httpx
+
+from core.errors import DirectMediaInvalidUrlError, HostUnavailableError
 from domain.media.protocols import StreamResolverProtocol
 from domain.media.supported_media_types import SupportedStreamTypes
 from domain.media.value_objects import MediaDownloadableLink, ResolvedMediaStream
+from infrastructure.http.client_provider import build_http_client
 
 
 class DirectMP4Resolver(StreamResolverProtocol):
     stream_type: SupportedStreamTypes = SupportedStreamTypes.DIRECT
 
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self._client = client or build_http_client()
+        self._is_client_owned = client is None
+
     async def can_resolve(self, stream_url: str) -> bool:
         lowered = stream_url.lower()
         return not lowered.endswith(".m3u8") and not lowered.endswith(".mpd")
@@ -18,6 +25,7 @@ class DirectMP4Resolver(StreamResolverProtocol):
         if not parsed.scheme or not parsed.netloc:
             raise DirectMediaInvalidUrlError(media_url=video_to_resolve)
 
+        size_in_bytes, supports_ranges = await self._probe(video_to_resolve)
         return ResolvedMediaStream(
             source_url=video_to_resolve,
             stream_type=self.stream_type,
@@ -25,8 +33,48 @@ class DirectMP4Resolver(StreamResolverProtocol):
             links=[
                 MediaDownloadableLink(
                     url=video_to_resolve,
+                    size_in_bytes=size_in_bytes,
+                    supports_ranges=supports_ranges,
                     sequence_number=0,
                     is_initialization_segment=False,
                 )
             ],
         )
+
+    async def close(self) -> None:
+        if self._is_client_owned:
+            await self._client.aclose()
+
+    async def _probe(self, url: str) -> tuple[int | None, bool]:
+        """
+        Finds the size of the file and whether its server accepts byte
+        ranges, with a HEAD request or, for servers that do not answer HEAD
+        properly, a request for its first byte. Failures only mean the file
+        is downloaded over one stream.
+        """
+        try:
+            response = await self._client.head(url)
+            if response.is_success:
+                size = response.headers.get("Content-Length")
+                accepts_ranges = response.headers.get("Accept-Ranges", "") == "bytes"
+                if size and size.isdigit() and accepts_ranges:
+                    return int(size), True
+
+            async with self._client.stream(
+                "GET", url, headers={"Range": "bytes=0-0"}
+            ) as response:
+                content_range = response.headers.get("Content-Range", "")
+                total = content_range.rpartition("/")[2]
+                if (
+                    response.status_code == httpx.codes.PARTIAL_CONTENT
+                    and total.isdigit()
+                ):
+                    return int(total), True
+
+                size = response.headers.get("Content-Length")
+                if response.is_success and size and size.isdigit():
+                    return int(size), False
+        except (httpx.HTTPError, HostUnavailableError) as e:
+            print(f"Failed to probe {url}: {e!r}")
+
+        return None, False
@@ -10,20 +10,15 @@ from core.errors import HlsManifestNoMediaSegmentsError, HlsManifestNoVariantsEr
 from domain.media.protocols import StreamResolverProtocol
 from domain.media.supported_media_types import SupportedStreamTypes
 from domain.media.value_objects import MediaDownloadableLink, ResolvedMediaStream
+from infrastructure.http.client_provider import build_http_client
 
 
 class HlsM3U8Resolver(StreamResolverProtocol):
     stream_type: SupportedStreamTypes = SupportedStreamTypes.HLS
 
     def __init__(self, client: httpx.AsyncClient | None = None) -> None:
-        self._client = client or httpx.AsyncClient(
-            headers={
-                "User-Agent": config.media_http_user_agent,
-                "Accept": config.media_http_accept_hls,
-            },
-            follow_redirects=config.media_http_follow_redirects,
-            timeout=config.media_http_timeout_seconds,
-        )
+        self._request_headers = {"Accept": config.media_http_accept_hls}
+        self._client = client or build_http_client(headers=self._request_headers)
         self._is_client_owned = client is None
 
     async def can_resolve(self, stream_url: str) -> bool:
@@ -35,7 +30,7 @@ class HlsM3U8Resolver(StreamResolverProtocol):
             return False
 
         try:
-            response = await self._client.get(stream_url)
+            response = await self._client.get(stream_url, headers=self._request_headers)
             response.raise_for_status()
         except httpx.HTTPError:
             return False
@@ -98,7 +93,7 @@ class HlsM3U8Resolver(StreamResolverProtocol):
         return best_variant[1]
 
     async def _load_playlist(self, playlist_url: str) -> str:
-        response = await self._client.get(playlist_url)
+        response = await self._client.get(playlist_url, headers=self._request_headers)
         response.raise_for_status()
         return response.text
 
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from core.config import config
+from domain.news.entities import NewsItem
+
+
+class FeedCacheEntry(BaseModel):
+    """
+    What we remember about the last successful poll of one listing page or feed.
+    """
+
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+    items: list[NewsItem] = Field(default_factory=list)
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+_ENTRIES_ADAPTER = TypeAdapter(dict[str, FeedCacheEntry])
+
+
+class FeedCache:
+    """
+    HTTP validator cache keyed by `scraping_url` / `rss_feed`.
+
+    When a `path` is given the entries are loaded from and persisted to a
+    JSON file, so validators survive restarts. Without a path the cache only
+    lives in memory. Sources share `shared_feed_cache`, so they
+    never overwrite each other's file.
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self._path = Path(path) if path is not None else None
+        self._entries: dict[str, FeedCacheEntry] | None = None
+        self._persist_lock = asyncio.Lock()
+
+    def get(self, key: str) -> FeedCacheEntry | None:
+        return self._get_entries().get(key)
+
+    def store(self, key: str, entry: FeedCacheEntry) -> None:
+        self._get_entries()[key] = entry
+
+    async def persist(self) -> None:
+        """
+        Writes the entries to `path` in a worker thread.
+        """
+        if self._path is None or self._entries is None:
+            return
+
+        # Entries are replaced, never mutated, so a shallow copy is a
+        # consistent snapshot for the writer thread.
+        entries = dict(self._entries)
+        async with self._persist_lock:
+            await asyncio.to_thread(self._write, self._path, entries)
+
+    def _get_entries(self) -> dict[str, FeedCacheEntry]:
+        # Loaded on first use, so the shared cache costs nothing to import.
+        if self._entries is None:
+            self._entries = {}
+            if self._path is not None and self._path.exists():
+                try:
+                    self._entries = _ENTRIES_ADAPTER.validate_json(
+                        self._path.read_bytes()
+                    )
+                except ValueError as e:
+                    print(f"Ignoring unreadable feed cache {self._path}: {e}")
+
+        return self._entries
+
+    @staticmethod
+    def _write(path: Path, entries: dict[str, FeedCacheEntry]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed, so a crash never leaves half a file.
+        temporary_path = path.with_name(f"{path.name}.tmp")
+        temporary_path.write_bytes(_ENTRIES_ADAPTER.dump_json(entries))
+        os.replace(temporary_path, path)
+
+
+shared_feed_cache = FeedCache(config.feed_cache_path)
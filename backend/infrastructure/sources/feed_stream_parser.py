@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from xml.etree.ElementTree import Element, XMLPullParser
+
+from domain.news.entities import NewsItem
+
+# RSS 0.9x/2.0 and RSS 1.0 (RDF) use <item>, Atom uses <entry>. Namespaces
+# differ between the formats, so elements are matched by local name.
+_ENTRY_TAGS = frozenset({"item", "entry"})
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+class FeedStreamParser:
+    """
+    Incremental RSS/Atom parser.
+
+    Bytes are fed as they arrive from the network and every completed entry
+    is returned right away, so a caller can stop reading a newest-first feed
+    as soon as it reaches entries it has already seen.
+    """
+
+    def __init__(self) -> None:
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._depth = 0
+        self._entry_depth: int | None = None
+
+    def feed(self, chunk: bytes) -> list[NewsItem]:
+        """
+        Consumes `chunk` and returns the entries it completed.
+        Raises `xml.etree.ElementTree.ParseError` on malformed XML.
+        """
+        self._parser.feed(chunk)
+        return self._read_events()
+
+    def close(self) -> list[NewsItem]:
+        self._parser.close()
+        return self._read_events()
+
+    def _read_events(self) -> list[NewsItem]:
+        items: list[NewsItem] = []
+        for event, element in self._parser.read_events():
+            assert isinstance(element, Element)
+
+            if event == "start":
+                self._depth += 1
+                if (
+                    self._entry_depth is None
+                    and _local_name(element.tag) in _ENTRY_TAGS
+                ):
+                    self._entry_depth = self._depth
+                continue
+
+            if self._entry_depth == self._depth:
+                self._entry_depth = None
+                item = _entry_to_news_item(element)
+                if item is not None:
+                    items.append(item)
+                # Entries are not needed once converted; dropping them keeps
+                # memory flat no matter how long the feed is.
+                element.clear()
+
+            self._depth -= 1
+
+        return items
+
+
+def _entry_to_news_item(entry: Element) -> NewsItem | None:
+    title: str | None = None
+    link: str | None = None
+
+    for child in entry:
+        name = _local_name(child.tag)
+        if name == "title" and title is None:
+            title = (child.text or "").strip() or None
+        elif name == "link" and link is None:
+            # Atom puts the URL in href and marks alternates with rel,
+            # RSS puts it in the element text.
+            rel = child.get("rel", "alternate")
+            href = child.get("href")
+            if href is not None:
+                if rel == "alternate":
+                    link = href.strip() or None
+            else:
+                link = (child.text or "").strip() or None
+
+    if link is None or title is None:
+        return None
+
+    return NewsItem(title=title, url=link)
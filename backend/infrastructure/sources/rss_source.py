@@ -1,11 +1,28 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import List
+from xml.etree.ElementTree import ParseError
+
 import feedparser
-import asyncio
+import httpx
 from feedparser import FeedParserDict
 
+from core.config import config
+from core.errors import HostUnavailableError
 from domain.news.entities import NewsItem
 from domain.news.protocols import NewsSource
 from domain.news.value_objects import RSSInformation
+from infrastructure.http.client_provider import http_client_provider
+from infrastructure.http.rate_limiter import host_rate_limiter
+from infrastructure.sources.feed_cache import (
+    FeedCache,
+    FeedCacheEntry,
+    shared_feed_cache,
+)
+from infrastructure.sources.feed_stream_parser import FeedStreamParser
+
+type UnknownUrlsFilter = Callable[[list[str]], Awaitable[set[str]]]
 
 
 class RSSNewsSource(NewsSource):
@@ -13,23 +30,51 @@ class RSSNewsSource(NewsSource):
     RSS-based news source implementation.
     """
 
-    def __init__(self, base_url: str, registered_rss_feeds: list[RSSInformation]):
+    def __init__(
+        self,
+        base_url: str,
+        registered_rss_feeds: list[RSSInformation],
+        feed_cache: FeedCache | None = None,
+        client: httpx.AsyncClient | None = None,
+        max_concurrency: int | None = None,
+        feed_timeout_seconds: float | None = None,
+        unknown_urls_filter: UnknownUrlsFilter | None = None,
+    ):
         self.scraping_informations = []
         self.rss_informations: dict[str, RSSInformation] = {}
         self.source_link = base_url
+        self._feed_cache = feed_cache or shared_feed_cache
+        self._request_headers = {"Accept": config.http_accept_feed}
+        # The shared client is rate-limited per host; only the Accept header
+        # is ours, sent with every request.
+        self.client = client or http_client_provider.get_client()
+        self._max_concurrency = max_concurrency or config.rss_feed_concurrency
+        self._feed_timeout_seconds = (
+            feed_timeout_seconds or config.rss_feed_timeout_seconds
+        )
+        # Same contract as `ArticleRepository.filter_unknown_urls`; lets
+        # streaming feeds stop at entries that are already stored.
+        self._unknown_urls_filter = unknown_urls_filter
 
         for rss in registered_rss_feeds:
             hostname = rss.get_host()
             self.rss_informations.update({hostname: rss})
+            host_rate_limiter.configure(hostname, rss.rate_limit)
 
     async def check_for_news(self) -> List[NewsItem]:
         """
-        Fetches the RSS feeds and returns a list of news items.
+        Fetches the RSS feeds concurrently and returns a list of news items.
         """
-        articles: dict[str, NewsItem] = {}
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        feeds_news = await asyncio.gather(
+            *(
+                self._fetch_feed(rss_info, semaphore)
+                for rss_info in self.rss_informations.values()
+            )
+        )
 
-        for rss_info in self.rss_informations.values():
-            news = await self._fetch_feed(rss_info)
+        articles: dict[str, NewsItem] = {}
+        for news in feeds_news:
             for article in news:
                 if article.url not in articles:
                     articles.update({article.url: article})
@@ -44,15 +89,126 @@ class RSSNewsSource(NewsSource):
                     ):
                         articles.update({article.url: article})
 
+        await self._feed_cache.persist()
         return list(articles.values())
 
-    async def _fetch_feed(self, rss_info: RSSInformation) -> list[NewsItem]:
-        # feedparser is synchronous, so we run it in an executor
-        loop = asyncio.get_event_loop()
-        feed = await loop.run_in_executor(None, feedparser.parse, rss_info.rss_feed)
+    async def close(self):
+        # The client is the shared one or the caller's; it outlives us.
+        return None
+
+    async def _fetch_feed(
+        self,
+        rss_info: RSSInformation,
+        semaphore: asyncio.Semaphore,
+    ) -> list[NewsItem]:
+        cache_entry = self._feed_cache.get(rss_info.rss_feed)
+        conditional_headers = cache_entry.conditional_headers() if cache_entry else {}
+        fallback_items = cache_entry.items if cache_entry else []
+        content: bytes | None = None
+        news: list[NewsItem] = []
+
+        try:
+            async with (
+                semaphore,
+                asyncio.timeout(self._feed_timeout_seconds),
+                self.client.stream(
+                    "GET",
+                    rss_info.rss_feed,
+                    headers={**self._request_headers, **conditional_headers},
+                ) as response,
+            ):
+                if response.status_code == httpx.codes.NOT_MODIFIED and cache_entry:
+                    return cache_entry.items
+
+                if response.status_code != httpx.codes.OK:
+                    print(f"Feed {rss_info.rss_feed} answered {response.status_code}")
+                    return fallback_items
+
+                if rss_info.streaming_parse:
+                    news = await self._stream_feed(response, cache_entry)
+                else:
+                    content = await response.aread()
+        except (httpx.HTTPError, TimeoutError, HostUnavailableError) as e:
+            # A slow or broken feed must not hold back the other feeds.
+            print(f"Failed to fetch feed {rss_info.rss_feed}: {e!r}")
+            return fallback_items
+
+        if content is not None:
+            news = await self._parse_feed(response, content)
+
+        self._feed_cache.store(
+            rss_info.rss_feed,
+            FeedCacheEntry(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                items=news,
+            ),
+        )
+        return news
+
+    async def _parse_feed(
+        self,
+        response: httpx.Response,
+        content: bytes,
+    ) -> list[NewsItem]:
+        # The network I/O is done; feedparser only parses the bytes.
+        loop = asyncio.get_running_loop()
+        feed = await loop.run_in_executor(
+            None,
+            partial(
+                feedparser.parse,
+                content,
+                response_headers=dict(response.headers),
+            ),
+        )
 
         return self._transform_feed_to_news(feed)
 
+    async def _stream_feed(
+        self,
+        response: httpx.Response,
+        cache_entry: FeedCacheEntry | None,
+    ) -> list[NewsItem]:
+        """
+        Parses the feed while it downloads and stops reading once a run of
+        `rss_stream_known_run_length` entries is already known. Feeds are
+        newest-first, so everything after that run has been seen before.
+        """
+        run_length = config.rss_stream_known_run_length
+        cached_urls = {item.url for item in cache_entry.items} if cache_entry else set()
+        parser = FeedStreamParser()
+        received: list[bytes] = []
+        news: list[NewsItem] = []
+        pending: list[NewsItem] = []
+
+        async def is_known_run(batch: list[NewsItem]) -> bool:
+            urls = [item.url for item in batch]
+            if self._unknown_urls_filter is not None:
+                return not await self._unknown_urls_filter(urls)
+
+            return all(url in cached_urls for url in urls)
+
+        chunks = response.aiter_bytes()
+        try:
+            async for chunk in chunks:
+                received.append(chunk)
+                pending.extend(parser.feed(chunk))
+
+                while len(pending) >= run_length:
+                    batch, pending = pending[:run_length], pending[run_length:]
+                    news.extend(batch)
+                    if await is_known_run(batch):
+                        return news
+
+            pending.extend(parser.close())
+        except ParseError:
+            # Not well-formed XML (e.g. HTML entities); feedparser is lenient.
+            received.extend([chunk async for chunk in chunks])
+            return await self._parse_feed(response, b"".join(received))
+
+        news.extend(pending)
+        return news
+
     def _transform_feed_to_news(self, feed: FeedParserDict) -> list[NewsItem]:
         def _process_single_entry(entry: dict | FeedParserDict):
             link = entry.get("link")
@@ -1,12 +1,22 @@
+import hashlib
 from typing import List
 import httpx
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup, Tag
 
-from core.errors import MissingTitleError
+from core.config import config
+from core.errors import HostUnavailableError
 from domain.news.entities import NewsItem
 from domain.news.protocols import NewsSource
 from domain.news.value_objects import ScrapeInformation
+from infrastructure.extraction.page_parsers import parse_listing_page
+from infrastructure.extraction.parse_executor import ParseExecutor, parse_executor
+from infrastructure.extraction.site_plan import SitePlan, compile_site_plan
+from infrastructure.http.client_provider import http_client_provider
+from infrastructure.http.rate_limiter import host_rate_limiter
+from infrastructure.sources.feed_cache import (
+    FeedCache,
+    FeedCacheEntry,
+    shared_feed_cache,
+)
 
 
 class WebScraperSource(NewsSource):
@@ -15,17 +25,27 @@ class WebScraperSource(NewsSource):
     Finds links on a page based on CSS selectors.
     """
 
-    def __init__(self, base_url: str, registered_scrapers: list[ScrapeInformation]):
+    def __init__(
+        self,
+        base_url: str,
+        registered_scrapers: list[ScrapeInformation],
+        client: httpx.AsyncClient | None = None,
+        feed_cache: FeedCache | None = None,
+        site_plans: list[SitePlan] | None = None,
+        executor: ParseExecutor | None = None,
+    ):
         self.scraping_informations: list[ScrapeInformation] = registered_scrapers
+        self._site_plans = site_plans or [
+            compile_site_plan(info) for info in registered_scrapers
+        ]
         self.source_link = base_url
-        self.client = httpx.AsyncClient(
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; NewsAgent/1.0)",
-                "Accept": "text/html,application/xhtml+xml",
-            },
-            follow_redirects=True,
-            timeout=30.0,
-        )
+        self._request_headers = {"Accept": config.http_accept_html}
+        for site_plan in self._site_plans:
+            host_rate_limiter.configure(site_plan.host, site_plan.info.rate_limit)
+
+        self.client = client or http_client_provider.get_client()
+        self._feed_cache = feed_cache or shared_feed_cache
+        self._parse_executor = executor or parse_executor
 
     async def check_for_news(self) -> List[NewsItem]:
         """
@@ -33,8 +53,8 @@ class WebScraperSource(NewsSource):
         """
         articles: dict[str, NewsItem] = {}
 
-        for scraper_info in self.scraping_informations:
-            news = await self._scrape_feed(scraper_info)
+        for site_plan in self._site_plans:
+            news = await self._scrape_feed(site_plan)
             for article in news:
                 if article.url not in articles:
                     articles.update({article.url: article})
@@ -49,95 +69,62 @@ class WebScraperSource(NewsSource):
                     ):
                         articles.update({article.url: article})
 
+        await self._feed_cache.persist()
         return list(articles.values())
 
     async def close(self):
-        await self.client.aclose()
-
-    async def _scrape_feed(self, scraper_info: ScrapeInformation) -> list[NewsItem]:
-        page = await self.client.get(scraper_info.scraping_url)
-        soup = BeautifulSoup(page.content, "html.parser")
-
-        news_containers = self._get_news_containers_elements(soup, scraper_info)
-
-        out: list[NewsItem] = []
-        for container in news_containers:
-            news_tags = container.find_all(href=True)
-
-            for tag in news_tags:
-                try:
-                    url, title = self._get_url_and_title_from_tag(tag, scraper_info)
-                except MissingTitleError:
-                    continue
-                out.append(NewsItem(url=url, title=title))
+        # Nothing to close: the client is shared or belongs to the caller.
+        return None
+
+    async def _scrape_feed(self, site_plan: SitePlan) -> list[NewsItem]:
+        scraper_info = site_plan.info
+        cache_entry = self._feed_cache.get(scraper_info.scraping_url)
+        conditional_headers = cache_entry.conditional_headers() if cache_entry else {}
+
+        try:
+            page = await self.client.get(
+                scraper_info.scraping_url,
+                headers={**self._request_headers, **conditional_headers},
+            )
+        except HostUnavailableError as e:
+            # The host keeps failing, the other sites are still scraped.
+            print(f"Skipping {scraper_info.scraping_url}: {e}")
+            return cache_entry.items if cache_entry else []
+
+        if page.status_code == httpx.codes.NOT_MODIFIED and cache_entry is not None:
+            # Unchanged since the last poll, so there is nothing to parse.
+            return cache_entry.items
+
+        content_hash = hashlib.sha256(page.content).hexdigest()
+        if cache_entry is not None and cache_entry.content_hash == content_hash:
+            # Byte-identical body (the site sent no usable validators), so
+            # the previously extracted links are still valid.
+            self._remember_page(scraper_info, page, content_hash, cache_entry.items)
+            return cache_entry.items
+
+        out = await self._parse_executor.run(
+            parse_listing_page, page.content, site_plan
+        )
 
+        self._remember_page(scraper_info, page, content_hash, out)
         return out
 
-    def _get_url_and_title_from_tag(
-        self,
-        tag: Tag,
-        scraper_info: ScrapeInformation,
-    ) -> tuple[str, str]:
-        def get_relative_link_from(tag: Tag):
-            relative_link = tag["href"]
-            assert isinstance(relative_link, str)
-
-            full_url = urljoin(scraper_info.scraping_url, relative_link)
-            return full_url
-
-        def get_title_from(tag: Tag):
-            title_selectors = ", ".join(scraper_info.titles_containers)
-            tag_parent = tag.parent
-
-            if tag_parent is None:
-                text = tag.get_text()
-                if text is None:
-                    raise MissingTitleError(
-                        scraping_url=scraper_info.scraping_url,
-                        href=get_relative_link_from(tag),
-                        selectors=scraper_info.titles_containers,
-                    )
-
-                title_text = text.strip()
-                if not title_text:
-                    raise MissingTitleError(
-                        scraping_url=scraper_info.scraping_url,
-                        href=get_relative_link_from(tag),
-                        selectors=scraper_info.titles_containers,
-                    )
-
-                return title_text
-
-            title = tag_parent.select_one(title_selectors)
-            if title is None:
-                raise MissingTitleError(
-                    scraping_url=scraper_info.scraping_url,
-                    href=get_relative_link_from(tag),
-                    selectors=scraper_info.titles_containers,
-                )
-
-            title_text = title.get_text(strip=True)
-            if not title_text:
-                raise MissingTitleError(
-                    scraping_url=scraper_info.scraping_url,
-                    href=get_relative_link_from(tag),
-                    selectors=scraper_info.titles_containers,
-                )
-
-            return title_text
-
-        return (get_relative_link_from(tag), get_title_from(tag))
-
-    def _get_news_containers_elements(
+    def _remember_page(
         self,
-        soup: BeautifulSoup,
         scraper_info: ScrapeInformation,
-    ):
-        containers_distinctions = scraper_info.article_containers
-
-        output_tags: list[Tag] = []
-        for distinction in containers_distinctions:
-            tags = soup.select(distinction)
-            output_tags.extend(tags)
-
-        return output_tags
+        page: httpx.Response,
+        content_hash: str,
+        items: list[NewsItem],
+    ) -> None:
+        if page.status_code != httpx.codes.OK:
+            return
+
+        self._feed_cache.store(
+            scraper_info.scraping_url,
+            FeedCacheEntry(
+                etag=page.headers.get("ETag"),
+                last_modified=page.headers.get("Last-Modified"),
+                content_hash=content_hash,
+                items=items,
+            ),
+        )
@@ -0,0 +1,50 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "raw_news_data" ADD "content_minhash" BYTEA;
+        ALTER TABLE "raw_news_data" ADD "canonical_id" INT;
+        ALTER TABLE "raw_news_data" ADD CONSTRAINT "fk_raw_news_raw_news_dbd8e573" FOREIGN KEY ("canonical_id") REFERENCES "raw_news_data" ("id") ON DELETE SET NULL;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "raw_news_data" DROP CONSTRAINT IF EXISTS "fk_raw_news_raw_news_dbd8e573";
+        ALTER TABLE "raw_news_data" DROP COLUMN "content_minhash";
+        ALTER TABLE "raw_news_data" DROP COLUMN "canonical_id";"""
+
+
+MODELS_STATE = (
+    "eJztm/1v2jgYx/+ViJ82qVdRrt2q6XRSaOmNWwsTpXd70RSZxIDVxGa2U4qm/u9nOwl5c4"
+    "BQoNDLL1ux/Tj2xy95vo+dXzWPONBlxyblyHZh7YPxq4aBJ//IZh0ZNTCZxBkygYOBMqqB"
+    "RKEB4xTYXCQPgcugSHIgsymacESwLHwj7Q1ODMYJhQbCDnpAjg9cI6yGGUNKPMNBwyGkEH"
+    "PDgw4CBiM+tSE7lk9xiC0eg/BoUxX6GP30ocXJCPIxpKLa7z9EsqgLPkIW/ZzcW0MEXScF"
+    "CjmyApVu8dlEpbUxv1IFZVsHlk1c38Nx4cmMjwmel0aYy9QRxJACDmX1nPoSHfZdN4Qc0Q"
+    "xaGhcJmpiwceAQ+K4cAGmd4x8lJgiGSTbBcuxEa5jq4Eg+5bfGyen70/Pf352eiyKqJfOU"
+    "909B9+K+B4aKQKdfe1L5gIOghMIYcwsHx/Kpmwd4MQZUTzBjlkEpOpBFGYFbxDJKiGHGk3"
+    "dDND3waLkQj/hY/DypN04XwPvH7F18NHtvZLG3sj9ELKlgqXXCvEaYKRnHTG0KZa8twPNI"
+    "L0UORx7UY01bZqg6oelx9MeeMhZ9cLrYnYWLYQHhfvumdds3bz7LnniM/XQVIrPfkjkNlT"
+    "rLpL55lxmLeSXGv+3+R0P+NL51Oy1FkDA+ouqJcbn+t5psE/A5sTCZWsBJrNsoNQKTGli1"
+    "Y1mltpqkyfINZ09GcCN7TowNwymz1A5UCl3WbC184bAeMD0KpmvAy1hthN0hvOukgzC817"
+    "7q1FLMI7wS7goa4U9wpki2RZMAtqGGWuiMdcS8vInq2r/V+xRNhSg1Hig5KSLXKbUziU6K"
+    "rkEevPXN2wvzslXTr+ENAbwMq9q75bsqvuzupEcop+MA2PdTQB0rNS9lDmkQ7UyNFm+edR"
+    "fDPhH/rEi6B6bPgL3t9b4q6sxetgLpNFiZ5TW8bArAYKS6JVsn25KdnhohlqRZrMRSi6W0"
+    "FptQIgQRg44h6zFkPcZgZghFZIgGC3ZLxddqNVRqa+dqi/meB+gsD68PHwvoJUwORWUt8v"
+    "hbX/opZz9SUm9uzC9vUw7/dbfzV1Q8obwurrvNjIc0FKvLssfQvrfWAKy3rlgvZS20P8uD"
+    "/vu221kKOjLNUL7DovffHWTzI8NFjP/YFvPaH0Mf25K1MfCRyxFmx/KBf9a2MhKSyeKRyE"
+    "I/SmtXWUF2JEQ+4ugBWmSCJLcyc15nW814/YzHcATW5ayzrTjrOVdRs1cUNcvJ8GIhlItF"
+    "a14qzdDy6lMPuoDrV1L+rORgxOVTXg1uVs8E8YoCQTMPZixRNPMASmlJkzzqMRAeEuqpUV"
+    "yqZBYaVgJm5wJG/Z8jV3xOFJVf66X3ArHb1PlQ4+xsheMhUarwdEjlpV9zwvEqfdqWtNmM"
+    "+7D1eZgCeXbSWAGkKFUIUuWlQYoWMz4llI8Rhkzz0rhyCShY0RrbDNehNN6Wq1A/rm/FL7"
+    "vs3jWvW8bnXuuifdsONcfcFVCZMkkkoCB61muZ15UbVrlhL+qG7dEZyVb9sGQwXuOJZWL1"
+    "xb6YDIc/L8IsakhEhkVJMIFOcD1nCgfybbM8xrxqHZWTtnMnTU4QDh81G3hxpCJpU0Uo9B"
+    "EKjrhbyvudGxwK0R24bSVd3+d4vTu/v5BWD/XT81XkgyhWrB9UZhrgA3IgKRV4jy2qePv6"
+    "8XbxeA4xtzyEx4CNNd4RwoDOCnzjvHFmLAYzHrhceyeKF4BuhuzmoAXnZrtj9r7q99mmhn"
+    "Xza79lViLk9YqQ1MACTDCygVvuNlvW7H90FXDBhbY5FU3so+ydrOfdFNqfa1nZmZK6LHTb"
+    "6hudu+vrRfeyYryOP3FFTfy5SvhQ0ZYTw7n4QTG06BLbKz7LKREWMCFF9rim++onyDla+N"
+    "FPXGZZFKC4Z5VG37lGf4CUaS8TFEuhhMlh6smtnKfIpVECYlj8MAGe1Osrfa9UX/C5Uj33"
+    "tVIgTcoIyoTJSynKrUmajWnHErH3zUedn/4Dt+/ZCw=="
+)
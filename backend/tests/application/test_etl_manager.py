@@ -0,0 +1,359 @@
+import asyncio
+
+import pytest
+
+from application import etl_metrics
+from application.etl_manager import ETLManager
+from application.near_duplicate_index import NearDuplicateIndex
+from core.errors import HostUnavailableError
+from domain.news.entities import Article, FetchedPage, NewsItem
+
+pytestmark = pytest.mark.anyio
+
+
+class _SourceStub:
+    def __init__(self, items: list[NewsItem], delay: float = 0.0) -> None:
+        self.scraping_informations = []
+        self.source_link = items[0].url if items else "https://example.com"
+        self._items = items
+        self._delay = delay
+
+    async def check_for_news(self) -> list[NewsItem]:
+        await asyncio.sleep(self._delay)
+        return self._items
+
+
+class _ExtractorStub:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.scraping_informations = {}
+        self._delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.in_flight_by_host: dict[str, int] = {}
+        self.max_in_flight_by_host: dict[str, int] = {}
+
+    async def extract(self, item: NewsItem) -> Article:
+        host = item.url.split("/")[2]
+        self.in_flight += 1
+        self.in_flight_by_host[host] = self.in_flight_by_host.get(host, 0) + 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.max_in_flight_by_host[host] = max(
+            self.max_in_flight_by_host.get(host, 0),
+            self.in_flight_by_host[host],
+        )
+
+        await asyncio.sleep(self._delay)
+
+        self.in_flight -= 1
+        self.in_flight_by_host[host] -= 1
+        return Article(
+            title=item.title,
+            content="content",
+            timestamp="now",
+            author="author",
+            source_url=item.url,
+        )
+
+
+class _RepositoryStub:
+    def __init__(self, known_urls: set[str] | None = None) -> None:
+        self.known_urls = known_urls or set()
+        self.saved: list[Article] = []
+        self.lookups = 0
+        self.batches: list[int] = []
+
+    async def save(self, article: Article) -> Article:
+        self.saved.append(article)
+        return article
+
+    async def save_many(self, articles: list[Article]) -> list[int]:
+        self.batches.append(len(articles))
+        self.saved.extend(articles)
+        return list(range(len(articles)))
+
+    async def get_by_url(self, url: str) -> Article | None:
+        if url not in self.known_urls:
+            return None
+
+        return Article(title="t", content="c", timestamp="t", author="a")
+
+    async def filter_unknown_urls(self, urls: list[str]) -> set[str]:
+        self.lookups += 1
+        return set(urls) - self.known_urls
+
+
+def _items(host: str, count: int) -> list[NewsItem]:
+    return [
+        NewsItem(title=f"{host} {index}", url=f"https://{host}/news/{index}")
+        for index in range(count)
+    ]
+
+
+async def test_etl_manager_skips_known_urls_and_saves_new_articles() -> None:
+    items = _items("example.com", 3)
+    repository = _RepositoryStub(known_urls={items[0].url})
+    manager = ETLManager(
+        sources=[_SourceStub(items)],
+        extractor=_ExtractorStub(),
+        repository=repository,
+    )
+
+    await manager.run()
+
+    assert sorted(article.source_url or "" for article in repository.saved) == [
+        items[1].url,
+        items[2].url,
+    ]
+    assert repository.lookups == 1
+
+
+async def test_etl_manager_respects_global_and_per_host_limits() -> None:
+    extractor = _ExtractorStub(delay=0.01)
+    repository = _RepositoryStub()
+    manager = ETLManager(
+        sources=[
+            _SourceStub(_items("a.example", 10)),
+            _SourceStub(_items("b.example", 10)),
+            _SourceStub(_items("c.example", 10)),
+        ],
+        extractor=extractor,
+        repository=repository,
+        max_concurrency=5,
+        per_source_concurrency=4,
+        per_host_concurrency=2,
+    )
+
+    await manager.run()
+
+    assert len(repository.saved) == 30
+    assert extractor.max_in_flight <= 5
+    assert max(extractor.max_in_flight_by_host.values()) <= 2
+
+
+async def test_etl_manager_polls_sources_concurrently() -> None:
+    sources = [
+        _SourceStub(_items(f"s{index}.example", 1), delay=0.1) for index in range(5)
+    ]
+    manager = ETLManager(
+        sources=sources,
+        extractor=_ExtractorStub(),
+        repository=_RepositoryStub(),
+        source_concurrency=5,
+    )
+
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    await manager.run()
+
+    assert loop.time() - started_at < 0.3
+
+
+async def test_etl_manager_saves_articles_in_batches() -> None:
+    repository = _RepositoryStub()
+    manager = ETLManager(
+        sources=[_SourceStub(_items("example.com", 5))],
+        extractor=_ExtractorStub(),
+        repository=repository,
+        write_batch_size=2,
+    )
+
+    await manager.run()
+
+    assert len(repository.saved) == 5
+    assert sorted(repository.batches) == [1, 2, 2]
+
+
+async def test_etl_manager_run_source_returns_new_item_count() -> None:
+    items = _items("example.com", 3)
+    repository = _RepositoryStub(known_urls={items[0].url})
+    source = _SourceStub(items)
+    manager = ETLManager(
+        sources=[source],
+        extractor=_ExtractorStub(),
+        repository=repository,
+    )
+
+    new_items = await manager.run_source(source)
+
+    assert new_items == 2
+    assert len(repository.saved) == 2
+
+
+class _FailingRepositoryStub(_RepositoryStub):
+    async def save_many(self, articles: list[Article]) -> list[int]:
+        raise ConnectionError("database is down")
+
+
+async def test_etl_manager_indexes_only_written_articles() -> None:
+    failing_index = NearDuplicateIndex(_FailingRepositoryStub())  # type: ignore[arg-type]
+    await ETLManager(
+        sources=[_SourceStub(_items("example.com", 2))],
+        extractor=_ExtractorStub(),
+        repository=_FailingRepositoryStub(),
+        near_duplicate_index=failing_index,
+    ).run()
+
+    index = NearDuplicateIndex(_RepositoryStub())  # type: ignore[arg-type]
+    await ETLManager(
+        sources=[_SourceStub(_items("example.com", 2))],
+        extractor=_ExtractorStub(),
+        repository=_RepositoryStub(),
+        near_duplicate_index=index,
+    ).run()
+
+    assert len(failing_index) == 0
+    assert len(index) > 0
+
+
+class _SlowHostExtractorStub(_ExtractorStub):
+    def __init__(self, slow_host: str) -> None:
+        super().__init__()
+        self.started: list[str] = []
+        self._slow_host = slow_host
+
+    async def extract(self, item: NewsItem) -> Article:
+        self.started.append(item.url)
+        if self._slow_host in item.url:
+            await asyncio.sleep(0.02)
+
+        return await super().extract(item)
+
+
+async def test_etl_manager_busy_hosts_do_not_block_other_hosts() -> None:
+    extractor = _SlowHostExtractorStub("slow.example")
+    repository = _RepositoryStub()
+    fast_item = _items("fast.example", 1)[0]
+    manager = ETLManager(
+        sources=[_SourceStub(_items("slow.example", 6) + [fast_item])],
+        extractor=extractor,
+        repository=repository,
+        per_host_concurrency=1,
+        fetch_workers=2,
+    )
+
+    await manager.run()
+
+    assert len(repository.saved) == 7
+    assert extractor.started.index(fast_item.url) <= 2
+
+
+async def test_etl_manager_failing_stage_cancels_the_others() -> None:
+    class _BrokenSource(_SourceStub):
+        async def check_for_news(self) -> list[NewsItem]:
+            return None  # type: ignore[return-value]
+
+    manager = ETLManager(
+        sources=[_BrokenSource([])],
+        extractor=_ExtractorStub(),
+        repository=_RepositoryStub(),
+    )
+
+    tasks_before = asyncio.all_tasks()
+    with pytest.raises(TypeError):
+        await manager.run()
+
+    assert asyncio.all_tasks() == tasks_before
+
+
+class _StagedExtractorStub(_ExtractorStub):
+    def __init__(self) -> None:
+        super().__init__()
+        self.fetched: list[str] = []
+        self.parsed: list[str] = []
+
+    async def fetch(self, item: NewsItem) -> FetchedPage:
+        self.fetched.append(item.url)
+        return FetchedPage(item=item, content=item.title.encode())
+
+    async def parse(self, page: FetchedPage) -> Article:
+        self.parsed.append(page.item.url)
+        return await self.extract(page.item)
+
+
+class _SlowRepositoryStub(_RepositoryStub):
+    async def save_many(self, articles: list[Article]) -> list[int]:
+        await asyncio.sleep(0.01)
+        return await super().save_many(articles)
+
+
+async def test_etl_manager_runs_fetch_and_parse_as_separate_stages() -> None:
+    items = _items("example.com", 4)
+    extractor = _StagedExtractorStub()
+    repository = _RepositoryStub()
+    manager = ETLManager(
+        sources=[_SourceStub(items)],
+        extractor=extractor,
+        repository=repository,
+    )
+
+    await manager.run()
+
+    assert sorted(extractor.fetched) == sorted(item.url for item in items)
+    assert sorted(extractor.parsed) == sorted(item.url for item in items)
+    assert len(repository.saved) == 4
+
+
+async def test_etl_manager_backpressure_bounds_items_in_flight() -> None:
+    extractor = _StagedExtractorStub()
+    repository = _SlowRepositoryStub()
+    manager = ETLManager(
+        sources=[_SourceStub(_items("example.com", 40))],
+        extractor=extractor,
+        repository=repository,
+        write_batch_size=1,
+        fetch_workers=2,
+        parse_workers=2,
+        queue_size=2,
+    )
+
+    max_in_flight = 0
+
+    async def watch() -> None:
+        nonlocal max_in_flight
+        while len(repository.saved) < 40:
+            max_in_flight = max(
+                max_in_flight, len(extractor.fetched) - len(repository.saved)
+            )
+            await asyncio.sleep(0)
+
+    await asyncio.gather(manager.run(), watch())
+
+    assert len(repository.saved) == 40
+    # Queues of 2 plus 2 fetch, 2 parse and 1 write worker.
+    assert max_in_flight <= 2 * 2 + 2 + 2 + 1
+
+
+class _FailingExtractorStub(_ExtractorStub):
+    async def extract(self, item: NewsItem) -> Article:
+        if item.url.endswith("/0"):
+            raise HostUnavailableError("metrics.example", 30)
+
+        return await super().extract(item)
+
+
+async def test_etl_manager_records_stage_metrics() -> None:
+    items = _items("metrics.example", 3)
+    source = _SourceStub(items)
+    repository = _RepositoryStub(known_urls={items[1].url})
+    errors_before = etl_metrics.errors_total.get(
+        stage="fetch", error="HostUnavailableError"
+    )
+    written_before = etl_metrics.articles_written_total.get()
+    manager = ETLManager(
+        sources=[source],
+        extractor=_FailingExtractorStub(),
+        repository=repository,
+    )
+
+    await manager.run()
+
+    assert etl_metrics.items_discovered_total.get(source=source.source_link) == 3
+    assert etl_metrics.items_new_total.get(source=source.source_link) == 2
+    assert etl_metrics.source_discovery_seconds.get_count(source=source.source_link)
+    assert etl_metrics.fetch_seconds.get_count(host="metrics.example") == 2
+    assert (
+        etl_metrics.errors_total.get(stage="fetch", error="HostUnavailableError")
+        == errors_before + 1
+    )
+    assert etl_metrics.articles_written_total.get() == written_before + 1
+    assert etl_metrics.queue_depth.get(stage="write") == 0
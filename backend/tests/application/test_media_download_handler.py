@@ -1,3 +1,4 @@
+import asyncio
 import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -8,6 +9,7 @@ from fastapi.testclient import TestClient
 
 from application.endpoints.static_files import mount_static_files
 from application.media_download_handler import MediaDownloadHandler
+from core.config import config
 from domain.media.supported_media_types import SupportedStreamTypes
 from domain.media.value_objects import (
     DownloadedMedia,
@@ -21,8 +23,10 @@ pytestmark = pytest.mark.anyio
 
 
 class _ResolverStub:
-    def __init__(self) -> None:
-        self.stream_type = SupportedStreamTypes.DIRECT
+    def __init__(
+        self, stream_type: SupportedStreamTypes = SupportedStreamTypes.DIRECT
+    ) -> None:
+        self.stream_type = stream_type
 
     async def can_resolve(self, stream_url: str) -> bool:
         return stream_url.endswith(".mp4")
@@ -30,7 +34,7 @@ class _ResolverStub:
     async def resolve_stream(self, video_to_resolve: str) -> ResolvedMediaStream:
         return ResolvedMediaStream(
             source_url=video_to_resolve,
-            stream_type=SupportedStreamTypes.DIRECT,
+            stream_type=self.stream_type,
             is_chunked=False,
             links=[
                 MediaDownloadableLink(
@@ -113,6 +117,130 @@ async def test_media_download_handler_orchestrates_pipeline(tmp_path) -> None:
     assert result.static_url_path == "/static/media/final.mp4"
 
 
+class _StreamingDownloaderStub(_DownloaderStub):
+    async def stream_video(self, write) -> None:
+        for segment in (b"seg-0", b"seg-1"):
+            await write(segment)
+
+
+class _StreamingMuxerStub(_MuxerStub):
+    def __init__(self, output_path: Path) -> None:
+        super().__init__(output_path)
+        self.streamed = b""
+
+    async def mux_stream(
+        self,
+        source_url: str,
+        stream_type: SupportedStreamTypes,
+        feed,
+        output_file_name: str | None = None,
+    ) -> MuxedMedia:
+        del output_file_name
+
+        async def write(data: bytes) -> None:
+            self.streamed += data
+
+        await feed(write)
+        return MuxedMedia(
+            source_url=source_url,
+            stream_type=stream_type,
+            output_path=self._output_path,
+            static_url_path=f"/static/media/{self._output_path.name}",
+        )
+
+
+async def test_media_download_handler_streams_segmented_media(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(config, "media_streaming_mux", True)
+    chunk_file = tmp_path / "unused.ts"
+    muxer = _StreamingMuxerStub(output_path=tmp_path / "final.mp4")
+    handler = MediaDownloadHandler(
+        resolvers=[_ResolverStub(stream_type=SupportedStreamTypes.HLS)],
+        muxer=muxer,
+        download_root=tmp_path / "downloads",
+        static_media_root=tmp_path / "static" / "media",
+        downloader_factory=lambda _path, _links, _type, source_url: (
+            _StreamingDownloaderStub(source_url=source_url, chunk_file=chunk_file)
+        ),
+    )
+
+    result = await handler.download_single("https://example.com/sample.mp4")
+
+    assert muxer.streamed == b"seg-0seg-1"
+    assert result.stream_type == SupportedStreamTypes.HLS
+    assert not chunk_file.exists()
+
+
+async def test_media_download_handler_downloads_segmented_media_by_default(
+    tmp_path,
+) -> None:
+    chunk_file = tmp_path / "downloaded.ts"
+    muxer = _StreamingMuxerStub(output_path=tmp_path / "final.mp4")
+    handler = MediaDownloadHandler(
+        resolvers=[_ResolverStub(stream_type=SupportedStreamTypes.HLS)],
+        muxer=muxer,
+        download_root=tmp_path / "downloads",
+        static_media_root=tmp_path / "static" / "media",
+        downloader_factory=lambda _path, _links, _type, source_url: (
+            _StreamingDownloaderStub(source_url=source_url, chunk_file=chunk_file)
+        ),
+    )
+
+    await handler.download_single("https://example.com/sample.mp4")
+
+    assert muxer.streamed == b""
+
+
+class _SlowDownloaderStub(_DownloaderStub):
+    def __init__(
+        self, source_url: str, chunk_file: Path, events: list[tuple[str, str]]
+    ) -> None:
+        super().__init__(source_url=source_url, chunk_file=chunk_file)
+        self._events = events
+
+    async def download_video(self) -> DownloadedMedia:
+        self._events.append(("start", self._source_url))
+        await asyncio.sleep(0.01)
+        self._events.append(("end", self._source_url))
+        return await super().download_video()
+
+
+async def test_media_download_handler_serializes_downloads_of_one_url(
+    tmp_path,
+) -> None:
+    events: list[tuple[str, str]] = []
+
+    def build_handler() -> MediaDownloadHandler:
+        return MediaDownloadHandler(
+            resolvers=[_ResolverStub()],
+            muxer=_MuxerStub(output_path=tmp_path / "final.mp4"),
+            download_root=tmp_path / "downloads",
+            static_media_root=tmp_path / "static" / "media",
+            downloader_factory=lambda path, _links, _type, source_url: (
+                _SlowDownloaderStub(
+                    source_url=source_url,
+                    chunk_file=path / "downloaded.mp4",
+                    events=events,
+                )
+            ),
+        )
+
+    await asyncio.gather(
+        build_handler().download_single("https://example.com/a.mp4"),
+        build_handler().download_single("https://example.com/b.mp4"),
+        build_handler().download_single("https://example.com/a.mp4"),
+    )
+
+    # Handlers share the lock: the second a.mp4 download starts only after
+    # the first one ended, while b.mp4 runs alongside them.
+    a_events = [event for event, url in events if url.endswith("a.mp4")]
+    assert a_events == ["start", "end", "start", "end"]
+    assert events.index(("start", "https://example.com/b.mp4")) < events.index(
+        ("end", "https://example.com/a.mp4")
+    )
+
+
 def test_mount_static_files_exposes_static_directory(tmp_path) -> None:
     app = FastAPI()
     static_root = tmp_path / "static"
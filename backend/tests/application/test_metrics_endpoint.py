@@ -0,0 +1,20 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from application.endpoints.metrics import register_metrics_endpoint
+from core.utils.metrics import MetricsRegistry
+
+
+def test_metrics_endpoint_serves_registry_in_prometheus_format() -> None:
+    registry = MetricsRegistry()
+    registry.counter("etl_items_new_total", "New items.", ("source",)).inc(
+        source="https://example.com"
+    )
+    app = FastAPI()
+    register_metrics_endpoint(app, registry=registry)
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'etl_items_new_total{source="https://example.com"} 1.0' in response.text
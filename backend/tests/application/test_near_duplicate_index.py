@@ -0,0 +1,96 @@
+import pytest
+
+from application.near_duplicate_index import NearDuplicateIndex
+from domain.news.entities import Article
+from infrastructure.extraction.content_signature import compute_content_signature
+
+pytestmark = pytest.mark.anyio
+
+STORY = (
+    "Parliament approved the budget for next year after a twelve hour debate, "
+    "with the ruling coalition backing higher spending on roads, schools and "
+    "hospitals while the opposition warned about the growing deficit"
+)
+
+
+class _RepositoryStub:
+    def __init__(self, signatures: list[tuple[str, bytes]]) -> None:
+        self._signatures = signatures
+
+    async def iter_content_signatures(self, batch_size: int = 10_000):
+        for start in range(0, len(self._signatures), batch_size):
+            yield self._signatures[start : start + batch_size]
+
+
+def _article(url: str, content: str) -> Article:
+    return Article(
+        title="t", content=content, timestamp="t", author="a", source_url=url
+    )
+
+
+async def test_near_duplicate_index_links_copies_to_first_article() -> None:
+    index = NearDuplicateIndex(_RepositoryStub([]))  # type: ignore[arg-type]
+
+    original = index.link(_article("https://a.example/budget", STORY))
+    index.add([original])
+    copy = index.link(_article("https://b.example/budget", STORY + " (BTA)"))
+    unrelated = index.link(
+        _article("https://c.example/weather", "Sunny weather expected all week")
+    )
+    index.add([copy, unrelated])
+
+    assert original.canonical_url is None
+    assert copy.canonical_url == "https://a.example/budget"
+    assert unrelated.canonical_url is None
+    assert copy.content_signature is not None
+    assert len(index) == 2
+
+
+async def test_near_duplicate_index_warms_from_stored_signatures() -> None:
+    repository = _RepositoryStub(
+        [("https://a.example/budget", compute_content_signature(STORY))]
+    )
+    index = NearDuplicateIndex(repository, warm_batch_size=1)  # type: ignore[arg-type]
+    await index.warm()
+
+    copy = index.link(_article("https://b.example/budget", STORY))
+    again = index.link(_article("https://a.example/budget", STORY))
+
+    assert copy.canonical_url == "https://a.example/budget"
+    assert again.canonical_url is None
+
+
+async def test_near_duplicate_index_links_copies_before_they_are_stored() -> None:
+    index = NearDuplicateIndex(_RepositoryStub([]))  # type: ignore[arg-type]
+
+    original = index.link(_article("https://a.example/budget", STORY))
+    copy = index.link(_article("https://b.example/budget", STORY))
+
+    assert original.canonical_url is None
+    assert copy.canonical_url == "https://a.example/budget"
+
+
+async def test_near_duplicate_index_discards_articles_whose_write_failed() -> None:
+    index = NearDuplicateIndex(_RepositoryStub([]))  # type: ignore[arg-type]
+
+    stored = index.link(_article("https://a.example/budget", STORY))
+    index.add([stored])
+    failed = index.link(_article("https://c.example/weather", "Sunny weather all week"))
+    index.discard([stored, failed])
+
+    again = index.link(_article("https://d.example/weather", "Sunny weather all week"))
+
+    assert len(index) == 2
+    assert again.canonical_url is None
+
+
+async def test_near_duplicate_index_never_links_articles_without_words() -> None:
+    index = NearDuplicateIndex(_RepositoryStub([]))  # type: ignore[arg-type]
+
+    video = index.link(_article("https://a.example/video", ""))
+    index.add([video])
+    other_video = index.link(_article("https://b.example/video", " "))
+
+    assert video.content_signature is None
+    assert other_video.canonical_url is None
+    assert len(index) == 0
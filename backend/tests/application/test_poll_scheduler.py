@@ -0,0 +1,160 @@
+import asyncio
+import random
+
+import pytest
+
+from application.etl_manager import ETLManager
+from application.poll_scheduler import PollScheduler
+
+pytestmark = pytest.mark.anyio
+
+
+class _SourceStub:
+    def __init__(self, source_link: str) -> None:
+        self.scraping_informations = []
+        self.source_link = source_link
+
+    async def check_for_news(self):
+        return []
+
+
+class _ETLManagerStub:
+    def __init__(
+        self, sources: list[_SourceStub], results: list[int | Exception]
+    ) -> None:
+        self.sources = sources
+        self._results = results
+        self.polled: list[str] = []
+
+    async def run_source(self, source: _SourceStub) -> int:
+        self.polled.append(source.source_link)
+        result = self._results.pop(0) if self._results else 0
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+
+def _scheduler(manager: _ETLManagerStub, tmp_path, now: list[float], **kwargs):
+    return PollScheduler(
+        manager,  # type: ignore[arg-type]
+        state_path=tmp_path / "poll-state.json",
+        initial_interval_seconds=100,
+        min_interval_seconds=25,
+        max_interval_seconds=400,
+        backoff_factor=2,
+        busy_threshold=5,
+        clock=lambda: now[0],
+        rng=random.Random(0),
+        **kwargs,
+    )
+
+
+async def test_poll_scheduler_backs_off_idle_and_tightens_busy_sources(
+    tmp_path,
+) -> None:
+    source = _SourceStub("https://example.com")
+    manager = _ETLManagerStub([source], results=[0, 0, 0, 10, 10, 10, 10])
+    scheduler = _scheduler(manager, tmp_path, [0.0], jitter_ratio=0)
+
+    intervals = [(await scheduler.poll(source)).interval_seconds for _ in range(7)]
+
+    assert intervals == [200, 400, 400, 200, 100, 50, 25]
+
+
+async def test_poll_scheduler_keeps_the_interval_of_failing_sources(
+    tmp_path,
+) -> None:
+    source = _SourceStub("https://example.com")
+    manager = _ETLManagerStub(
+        [source], results=[RuntimeError("down"), RuntimeError("down"), 0]
+    )
+    scheduler = _scheduler(manager, tmp_path, [0.0], jitter_ratio=0)
+
+    failed = await scheduler.poll(source)
+    assert (failed.interval_seconds, failed.next_poll_at) == (100, 100)
+    assert failed.consecutive_empty_polls == 0
+
+    assert (await scheduler.poll(source)).consecutive_failed_polls == 2
+
+    recovered = await scheduler.poll(source)
+    assert recovered.interval_seconds == 200
+    assert recovered.consecutive_failed_polls == 0
+
+
+class _FailingSourceStub(_SourceStub):
+    async def check_for_news(self):
+        raise ConnectionError("source is down")
+
+
+async def test_poll_scheduler_sees_discovery_failures_of_the_etl_manager(
+    tmp_path,
+) -> None:
+    source = _FailingSourceStub("https://example.com")
+    manager = ETLManager(
+        sources=[source],  # type: ignore[list-item]
+        extractor=None,  # type: ignore[arg-type]
+        repository=None,  # type: ignore[arg-type]
+    )
+    scheduler = _scheduler(manager, tmp_path, [0.0], jitter_ratio=0)  # type: ignore[arg-type]
+
+    states = [await scheduler.poll(source) for _ in range(2)]
+
+    assert [state.interval_seconds for state in states] == [100, 100]
+    assert states[-1].consecutive_failed_polls == 2
+    assert states[-1].consecutive_empty_polls == 0
+
+
+async def test_poll_scheduler_jitters_next_poll(tmp_path) -> None:
+    source = _SourceStub("https://example.com")
+    manager = _ETLManagerStub([source], results=[1])
+    scheduler = _scheduler(manager, tmp_path, [1000.0], jitter_ratio=0.1)
+
+    state = await scheduler.poll(source)
+
+    assert state.interval_seconds == 100
+    assert 1090 <= state.next_poll_at <= 1110
+    assert state.next_poll_at != 1100
+
+
+async def test_poll_scheduler_restores_state_after_restart(tmp_path) -> None:
+    source = _SourceStub("https://example.com")
+    now = [0.0]
+    scheduler = _scheduler(_ETLManagerStub([source], [0]), tmp_path, now)
+    await scheduler.poll(source)
+
+    restarted = _scheduler(_ETLManagerStub([source], []), tmp_path, now)
+
+    assert restarted.get_state(source).interval_seconds == 200
+    assert restarted.get_state(source).consecutive_empty_polls == 1
+
+
+async def test_poll_scheduler_replaces_the_state_file_atomically(
+    tmp_path, monkeypatch
+) -> None:
+    source = _SourceStub("https://example.com")
+    scheduler = _scheduler(_ETLManagerStub([source], [0]), tmp_path, [0.0])
+    await scheduler.poll(source)
+    state_before = (tmp_path / "poll-state.json").read_bytes()
+
+    def crash(*_args: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("application.poll_scheduler.os.replace", crash)
+    with pytest.raises(OSError):
+        await scheduler.poll(source)
+
+    assert (tmp_path / "poll-state.json").read_bytes() == state_before
+
+
+async def test_poll_scheduler_runs_due_sources_until_stopped(tmp_path) -> None:
+    sources = [_SourceStub("https://a.example"), _SourceStub("https://b.example")]
+    manager = _ETLManagerStub(sources, results=[])
+    scheduler = _scheduler(manager, tmp_path, [0.0])
+
+    task = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.05)
+    scheduler.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert sorted(manager.polled) == ["https://a.example", "https://b.example"]
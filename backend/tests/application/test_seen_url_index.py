@@ -0,0 +1,84 @@
+import pytest
+
+from application.seen_url_index import SeenUrlIndex
+from domain.news.entities import Article
+
+pytestmark = pytest.mark.anyio
+
+
+class _RepositoryStub:
+    def __init__(self, known_urls: set[str]) -> None:
+        self.known_urls = set(known_urls)
+        self.lookups: list[list[str]] = []
+
+    async def save(self, article: Article) -> Article:
+        self.known_urls.add(article.source_url or "")
+        return article
+
+    async def save_many(self, articles: list[Article]) -> list[int]:
+        self.known_urls.update(article.source_url or "" for article in articles)
+        return list(range(len(articles)))
+
+    async def get_by_url(self, url: str) -> Article | None:
+        return None
+
+    async def filter_unknown_urls(self, urls: list[str]) -> set[str]:
+        self.lookups.append(urls)
+        return set(urls) - self.known_urls
+
+    async def iter_urls(self, batch_size: int = 10_000):
+        urls = sorted(self.known_urls)
+        for start in range(0, len(urls), batch_size):
+            yield urls[start : start + batch_size]
+
+
+def _article(url: str) -> Article:
+    return Article(title="t", content="c", timestamp="t", author="a", source_url=url)
+
+
+async def test_seen_url_index_answers_new_urls_without_the_repository() -> None:
+    repository = _RepositoryStub({f"https://example.com/{i}" for i in range(10)})
+    index = SeenUrlIndex(repository, capacity=100, warm_batch_size=3)
+    await index.warm()
+
+    unknown = await index.filter_unknown_urls(
+        ["https://example.com/new-1", "https://example.com/new-2"]
+    )
+
+    assert unknown == {"https://example.com/new-1", "https://example.com/new-2"}
+    assert repository.lookups == []
+
+
+async def test_seen_url_index_confirms_possible_hits_in_one_query() -> None:
+    repository = _RepositoryStub({"https://example.com/known"})
+    index = SeenUrlIndex(repository, capacity=100)
+    await index.warm()
+
+    unknown = await index.filter_unknown_urls(
+        ["https://example.com/known", "https://example.com/new"]
+    )
+
+    assert unknown == {"https://example.com/new"}
+    assert repository.lookups == [["https://example.com/known"]]
+
+
+async def test_seen_url_index_learns_saved_urls() -> None:
+    repository = _RepositoryStub(set())
+    index = SeenUrlIndex(repository, capacity=100)
+    await index.warm()
+
+    await index.save_many([_article("https://example.com/saved")])
+    unknown = await index.filter_unknown_urls(["https://example.com/saved"])
+
+    assert unknown == set()
+    assert repository.lookups == [["https://example.com/saved"]]
+
+
+async def test_seen_url_index_defers_to_repository_until_warm() -> None:
+    repository = _RepositoryStub({"https://example.com/known"})
+    index = SeenUrlIndex(repository, capacity=100)
+
+    unknown = await index.filter_unknown_urls(["https://example.com/new"])
+
+    assert unknown == {"https://example.com/new"}
+    assert repository.lookups == [["https://example.com/new"]]
@@ -0,0 +1,17 @@
+import pytest
+
+from infrastructure.http.client_provider import http_client_provider
+from infrastructure.sources.feed_cache import shared_feed_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_shared_http_client(monkeypatch) -> None:
+    # Components default to the shared client and tests patch its methods,
+    # so every test gets its own.
+    monkeypatch.setattr(http_client_provider, "_client", None)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_shared_feed_cache(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(shared_feed_cache, "_path", tmp_path / "feed-cache.json")
+    monkeypatch.setattr(shared_feed_cache, "_entries", None)
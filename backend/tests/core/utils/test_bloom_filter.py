@@ -0,0 +1,34 @@
+import pytest
+
+from core.utils import BloomFilter
+
+
+def test_bloom_filter_never_misses_added_values() -> None:
+    bloom_filter = BloomFilter(capacity=1_000, error_rate=0.01)
+    urls = [f"https://example.com/news/{index}" for index in range(1_000)]
+
+    bloom_filter.update(urls)
+
+    assert all(url in bloom_filter for url in urls)
+    assert len(bloom_filter) == 1_000
+
+
+def test_bloom_filter_false_positive_rate_stays_near_target() -> None:
+    bloom_filter = BloomFilter(capacity=5_000, error_rate=0.01)
+    bloom_filter.update(
+        [f"https://example.com/known/{index}" for index in range(5_000)]
+    )
+
+    false_positives = sum(
+        f"https://example.com/new/{index}" in bloom_filter for index in range(10_000)
+    )
+
+    assert false_positives / 10_000 < 0.02
+
+
+@pytest.mark.parametrize(("capacity", "error_rate"), [(0, 0.01), (10, 0), (10, 1)])
+def test_bloom_filter_rejects_invalid_parameters(
+    capacity: int, error_rate: float
+) -> None:
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=capacity, error_rate=error_rate)
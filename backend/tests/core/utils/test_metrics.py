@@ -0,0 +1,51 @@
+import pytest
+
+from core.utils.metrics import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests made.", ("host",))
+    depth = registry.gauge("queue_depth", "Queued elements.")
+
+    requests.inc(host="a.example")
+    requests.inc(2, host='b"example')
+    depth.set(3)
+
+    assert registry.render() == (
+        "# HELP requests_total Requests made.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{host="a.example"} 1.0\n'
+        'requests_total{host="b\\"example"} 2.0\n'
+        "# HELP queue_depth Queued elements.\n"
+        "# TYPE queue_depth gauge\n"
+        "queue_depth 3.0\n"
+    )
+
+
+def test_histogram_counts_observations_in_cumulative_buckets() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        latency.observe(value)
+    with latency.time():
+        pass
+
+    assert latency.get_count() == 5
+    rendered = registry.render()
+    assert 'latency_seconds_bucket{le="0.1"} 3\n' in rendered
+    assert 'latency_seconds_bucket{le="1.0"} 4\n' in rendered
+    assert 'latency_seconds_bucket{le="+Inf"} 5\n' in rendered
+    assert "latency_seconds_count 5\n" in rendered
+
+
+def test_registry_returns_existing_metric_and_validates_labels() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("errors_total", "Errors.", ("stage",))
+
+    assert registry.counter("errors_total", "Errors.", ("stage",)) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("errors_total", "Errors.", ("stage",))
+    with pytest.raises(ValueError):
+        counter.inc(host="a.example")
@@ -0,0 +1,66 @@
+import pytest
+
+from core.utils import (
+    MinHasher,
+    MinHashLSH,
+    estimate_similarity,
+    pack_signature,
+    unpack_signature,
+)
+
+STORY = (
+    "The central bank kept its key interest rate unchanged on Thursday, citing "
+    "slowing inflation and a stable labour market, and said it would review "
+    "the decision again at its next meeting in March"
+)
+
+
+def test_minhash_similarity_tracks_text_overlap() -> None:
+    hasher = MinHasher(num_perm=128, shingle_size=3)
+    syndicated = STORY + ", the agency reported."
+    unrelated = "Heavy snow closed mountain roads and several schools across the north"
+
+    original = hasher.signature(STORY)
+
+    assert estimate_similarity(original, hasher.signature(STORY)) == 1.0
+    assert estimate_similarity(original, hasher.signature(syndicated)) > 0.7
+    assert estimate_similarity(original, hasher.signature(unrelated)) < 0.2
+
+
+def test_texts_without_words_have_no_signature() -> None:
+    assert MinHasher(num_perm=16).signature(" -- ") is None
+
+
+def test_lsh_forgets_removed_keys() -> None:
+    hasher = MinHasher(num_perm=16, shingle_size=3)
+    lsh = MinHashLSH(num_perm=16, bands=4)
+    lsh.insert("story", hasher.signature(STORY))
+
+    lsh.remove("story")
+    lsh.remove("missing")
+
+    assert "story" not in lsh
+    assert lsh.query(hasher.signature(STORY), threshold=0.5) == []
+
+
+def test_signatures_survive_packing() -> None:
+    signature = MinHasher(num_perm=16).signature(STORY)
+
+    assert unpack_signature(pack_signature(signature)) == signature
+
+
+def test_lsh_only_returns_similar_keys() -> None:
+    hasher = MinHasher(num_perm=128, shingle_size=3)
+    lsh = MinHashLSH(num_perm=128, bands=16)
+    lsh.insert("story", hasher.signature(STORY))
+    lsh.insert("other", hasher.signature("Completely different words about sport"))
+
+    matches = lsh.query(hasher.signature(STORY.upper() + "!"), threshold=0.8)
+
+    assert matches == ["story"]
+    assert len(lsh) == 2
+
+
+def test_lsh_rejects_uneven_bands() -> None:
+    with pytest.raises(ValueError):
+        MinHashLSH(num_perm=128, bands=10)
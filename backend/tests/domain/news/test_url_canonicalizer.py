@@ -0,0 +1,93 @@
+import pytest
+
+from domain.news.url_canonicalizer import UrlCanonicalizer, canonicalize_url
+from domain.news.value_objects import ScrapeInformation, UrlRules
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "https://example.com/news/1",
+        "HTTPS://Example.COM:443/news/1",
+        "https://example.com/news/1/",
+        "https://example.com/news/1?utm_source=fb&utm_medium=social",
+        "https://example.com/news/1?fbclid=abc#comments",
+        "https://example.com/news/./1",
+        "https://example.com//news/1",
+    ],
+)
+def test_canonicalize_url_collapses_common_variants(variant: str) -> None:
+    assert canonicalize_url(variant) == "https://example.com/news/1"
+
+
+def test_canonicalize_url_sorts_and_keeps_content_params() -> None:
+    assert (
+        canonicalize_url("http://example.com/search?q=a+b&page=2&gclid=x")
+        == "https://example.com/search?page=2&q=a+b"
+    )
+
+
+def test_canonicalize_url_normalizes_percent_encoding() -> None:
+    assert canonicalize_url("https://example.com/%7euser/%d0%b1") == (
+        "https://example.com/~user/%D0%B1"
+    )
+
+
+def test_canonicalize_url_keeps_reserved_characters_escaped() -> None:
+    assert canonicalize_url("https://example.com/a%2fb/c%20d/е") == (
+        "https://example.com/a%2Fb/c%20d/%D0%B5"
+    )
+
+
+def test_canonicalize_url_leaves_urls_with_malformed_ports_unchanged() -> None:
+    assert canonicalize_url("http://example.com:80x/a/") == (
+        "http://example.com:80x/a/"
+    )
+
+
+def test_canonicalize_url_keeps_the_scheme_when_sites_opt_out() -> None:
+    rules = UrlRules(forceHttps=False)
+
+    assert canonicalize_url("http://example.com/a", rules) == "http://example.com/a"
+
+
+def test_canonicalize_url_applies_site_rules() -> None:
+    rules = UrlRules(
+        dropQueryParams=["ref*"],
+        hostAliases={"m.example.com": "example.com"},
+        forceHttps=True,
+        stripTrailingSlash=False,
+    )
+
+    assert (
+        canonicalize_url("http://m.example.com/news/1/?referrer=x&id=3", rules)
+        == "https://example.com/news/1/?id=3"
+    )
+
+
+def test_canonicalize_url_keeps_only_allowed_params() -> None:
+    rules = UrlRules(keepQueryParams=["id"])
+
+    assert (
+        canonicalize_url("https://example.com/article.php?session=1&id=7", rules)
+        == "https://example.com/article.php?id=7"
+    )
+
+
+def test_url_canonicalizer_picks_rules_by_host_and_alias() -> None:
+    info = ScrapeInformation(
+        scrapingUrl="https://example.com/",
+        articleContainers=[".article"],
+        titlesContainers=[".title"],
+        timestampsConteiners=[".timestamp"],
+        summaryContainers=[".summary"],
+        mainArticleContainer=".article-content",
+        authorContainer=".author",
+        urlRules={"hostAliases": {"m.example.com": "example.com"}, "forceHttps": True},
+    )
+    canonicalizer = UrlCanonicalizer.from_informations([info])
+
+    assert canonicalizer.canonicalize("http://m.example.com/a?utm_id=1") == (
+        "https://example.com/a"
+    )
+    assert canonicalizer.canonicalize("http://other.com/a/") == "https://other.com/a"
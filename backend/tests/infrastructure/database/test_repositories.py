@@ -0,0 +1,166 @@
+import pytest
+from tortoise import Tortoise
+
+from domain.news.entities import Article
+from infrastructure.database.models.raw_news_data import RawNewsData
+from infrastructure.database.repositories import TortoiseArticleRepository
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def database():
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": ["infrastructure.database.models"]},
+    )
+    await Tortoise.generate_schemas()
+    yield
+    await Tortoise.close_connections()
+
+
+async def test_filter_unknown_urls_returns_only_missing_urls(database) -> None:
+    await RawNewsData.create(
+        title="Known",
+        raw_text="text",
+        videos=[],
+        url="https://example.com/known",
+    )
+    repository = TortoiseArticleRepository()
+
+    unknown_urls = await repository.filter_unknown_urls(
+        ["https://example.com/known", "https://example.com/new"]
+    )
+
+    assert unknown_urls == {"https://example.com/new"}
+
+
+async def test_filter_unknown_urls_handles_empty_input(database) -> None:
+    repository = TortoiseArticleRepository()
+
+    assert await repository.filter_unknown_urls([]) == set()
+
+
+def _article(url: str, title: str) -> Article:
+    return Article(
+        title=title,
+        content=f"{title} content",
+        videos=[f"{url}/video.mp4"],
+        timestamp="now",
+        author="author",
+        source_url=url,
+    )
+
+
+async def test_save_many_upserts_articles_by_url(database) -> None:
+    existing = await RawNewsData.create(
+        title="Old title",
+        raw_text="old",
+        videos=[],
+        url="https://example.com/1",
+    )
+    repository = TortoiseArticleRepository()
+
+    ids = await repository.save_many(
+        [
+            _article("https://example.com/1", "Updated title"),
+            _article("https://example.com/2", "New title"),
+            _article("https://example.com/2", "Newer title"),
+        ]
+    )
+
+    assert len(ids) == 2
+    assert existing.id in ids
+    assert await RawNewsData.all().count() == 2
+
+    updated = await RawNewsData.get(url="https://example.com/1")
+    assert updated.title == "Updated title"
+    assert updated.videos == ["https://example.com/1/video.mp4"]
+
+    inserted = await RawNewsData.get(url="https://example.com/2")
+    assert inserted.title == "Newer title"
+    assert inserted.id in ids
+
+
+async def test_save_many_handles_empty_batch(database) -> None:
+    repository = TortoiseArticleRepository()
+
+    assert await repository.save_many([]) == []
+
+
+async def test_iter_urls_pages_through_all_urls(database) -> None:
+    for index in range(5):
+        await RawNewsData.create(
+            title=f"News {index}",
+            raw_text="text",
+            videos=[],
+            url=f"https://example.com/{index}",
+        )
+    repository = TortoiseArticleRepository()
+
+    batches = [batch async for batch in repository.iter_urls(batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sorted(url for batch in batches for url in batch) == [
+        f"https://example.com/{index}" for index in range(5)
+    ]
+
+
+async def test_repository_stores_and_matches_canonical_urls(database) -> None:
+    repository = TortoiseArticleRepository()
+
+    await repository.save_many(
+        [
+            Article(
+                title="Story",
+                content="text",
+                timestamp="t",
+                author="a",
+                source_url="https://Example.com/story/?utm_source=rss",
+            )
+        ]
+    )
+    unknown_urls = await repository.filter_unknown_urls(
+        ["https://example.com/story?fbclid=1", "https://example.com/other"]
+    )
+
+    assert await RawNewsData.all().values_list("url", flat=True) == [
+        "https://example.com/story"
+    ]
+    assert unknown_urls == {"https://example.com/other"}
+
+
+async def test_save_many_links_near_duplicates_to_canonical_rows(database) -> None:
+    repository = TortoiseArticleRepository()
+
+    await repository.save_many(
+        [
+            Article(
+                title="Original",
+                content="text",
+                timestamp="t",
+                author="a",
+                source_url="https://a.example/story",
+                content_signature=b"\x01\x00\x00\x00",
+            ),
+            Article(
+                title="Copy",
+                content="text",
+                timestamp="t",
+                author="a",
+                source_url="https://b.example/story",
+                content_signature=b"\x01\x00\x00\x00",
+                canonical_url="https://a.example/story",
+            ),
+        ]
+    )
+
+    original = await RawNewsData.get(url="https://a.example/story")
+    copy = await RawNewsData.get(url="https://b.example/story")
+    signatures = [
+        batch async for batch in repository.iter_content_signatures(batch_size=10)
+    ]
+
+    assert copy.canonical_id == original.id  # type: ignore[attr-defined]
+    assert original.canonical_id is None  # type: ignore[attr-defined]
+    assert signatures == [[("https://a.example/story", b"\x01\x00\x00\x00")]]
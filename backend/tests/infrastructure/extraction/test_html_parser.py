@@ -0,0 +1,52 @@
+import pytest
+
+from domain.news.supported_html_parsers import SupportedHtmlParsers
+from domain.news.value_objects import ScrapeInformation
+from infrastructure.extraction.html_parser import parse_html, resolve_parser
+
+HTML = b"""
+<html>
+<body>
+    <div class="news"><a class="title" href="/a">First</a></div>
+    <div class="news"><a class="title" href="/b">Second</a></div>
+    <div class="author"><span class="name">Jane</span></div>
+</body>
+</html>
+"""
+
+
+@pytest.mark.parametrize("parser", list(SupportedHtmlParsers))
+def test_parsers_share_css_selector_semantics(parser: SupportedHtmlParsers) -> None:
+    soup = parse_html(HTML, parser)
+
+    titles = [tag.get_text() for tag in soup.select(".news a.title")]
+    author = soup.select_one(".author > .name")
+
+    assert titles == ["First", "Second"]
+    assert author is not None
+    assert author.get_text() == "Jane"
+
+
+def test_resolve_parser_falls_back_to_html_parser_when_missing(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "infrastructure.extraction.html_parser.find_spec", lambda _name: None
+    )
+
+    resolved = resolve_parser(SupportedHtmlParsers.LXML)
+
+    assert resolved == SupportedHtmlParsers.HTML_PARSER
+
+
+def test_scrape_information_reads_parser_from_site_json() -> None:
+    scraper_info = ScrapeInformation(
+        scrapingUrl="https://example.com/",
+        articleContainers=[".news"],
+        titlesContainers=[".title"],
+        timestampsConteiners=["time"],
+        summaryContainers=[".summary"],
+        mainArticleContainer=".article",
+        authorContainer=".author",
+        htmlParser="html.parser",
+    )
+
+    assert scraper_info.html_parser == SupportedHtmlParsers.HTML_PARSER
@@ -0,0 +1,10 @@
+from infrastructure.extraction.loader import NewsLoader, get_site_url_canonicalizer
+
+
+def test_site_url_canonicalizer_is_shared_and_knows_every_site() -> None:
+    canonicalizer = get_site_url_canonicalizer()
+    scrape_infos, rss_infos = NewsLoader().load_scrapers_data()
+
+    assert canonicalizer is get_site_url_canonicalizer()
+    for info in [*scrape_infos, *rss_infos]:
+        assert canonicalizer.rules_for(f"https://{info.get_host()}/a") is not None
@@ -0,0 +1,89 @@
+import pytest
+
+from domain.news.entities import NewsItem
+from domain.news.value_objects import ScrapeInformation
+from infrastructure.extraction.html_extractor import HtmlExtractor
+from infrastructure.extraction.page_parsers import parse_listing_page
+from infrastructure.extraction.parse_executor import ParseExecutor
+from infrastructure.extraction.site_plan import compile_site_plan
+
+pytestmark = pytest.mark.anyio
+
+LISTING = b"""
+<div class="article"><a href="/one"><span class="title">One</span></a></div>
+<div class="article"><a href="/two"><span class="other">Two</span></a></div>
+"""
+
+ARTICLE = b"""
+<article class="article-content"><p>Body</p></article>
+<div class="author">Jane</div>
+"""
+
+
+def _scraper_info() -> ScrapeInformation:
+    return ScrapeInformation(
+        scrapingUrl="https://example.com/",
+        articleContainers=[".article"],
+        titlesContainers=[".title"],
+        timestampsConteiners=[".timestamp"],
+        summaryContainers=[".summary"],
+        mainArticleContainer=".article-content",
+        authorContainer=".author",
+    )
+
+
+@pytest.mark.parametrize("use_processes", [True, False])
+async def test_parse_executor_parses_listing_off_the_loop(use_processes: bool) -> None:
+    executor = ParseExecutor(max_workers=1, use_processes=use_processes)
+    try:
+        items = await executor.run(
+            parse_listing_page, LISTING, compile_site_plan(_scraper_info())
+        )
+    finally:
+        executor.shutdown()
+
+    assert items == [NewsItem(url="https://example.com/one", title="One")]
+
+
+async def test_extractor_parses_article_in_given_executor() -> None:
+    executor = ParseExecutor(max_workers=1, use_processes=True)
+    extractor = HtmlExtractor([_scraper_info()], executor=executor)
+
+    class _Response:
+        content = ARTICLE
+
+    async def fake_get(*args, **kwargs):
+        return _Response()
+
+    extractor.client.get = fake_get  # type: ignore[method-assign]
+
+    try:
+        article = await extractor.extract(
+            NewsItem(url="https://example.com/one", title="One")
+        )
+    finally:
+        executor.shutdown()
+        await extractor.close()
+
+    assert article.content == "Body"
+    assert article.author == "Jane"
+    assert article.source_url == "https://example.com/one"
+
+
+def test_parse_listing_page_keeps_links_as_published() -> None:
+    listing = b"""
+    <div class="article"><a href="/one/"><span class="title">One</span></a></div>
+    <div class="article">
+        <a href="http://example.com:80x/"><span class="title">Two</span></a>
+    </div>
+    """
+    scraper_info = _scraper_info().model_copy(
+        update={"scraping_url": "http://example.com/"}
+    )
+
+    items = parse_listing_page(listing, compile_site_plan(scraper_info))
+
+    assert items == [
+        NewsItem(url="http://example.com/one/", title="One"),
+        NewsItem(url="http://example.com:80x/", title="Two"),
+    ]
@@ -0,0 +1,88 @@
+import pytest
+
+from domain.news.entities import NewsItem
+from domain.news.value_objects import ScrapeInformation
+from infrastructure.extraction.html_extractor import HtmlExtractor
+from infrastructure.extraction.loader import NewsLoader
+from infrastructure.extraction.site_plan import compile_site_plan
+from infrastructure.sources.web_scraper_source import WebScraperSource
+
+pytestmark = pytest.mark.anyio
+
+
+def _scraper_info(**overrides: object) -> ScrapeInformation:
+    data: dict[str, object] = {
+        "scrapingUrl": "https://Example.com/news",
+        "articleContainers": [".news", ""],
+        "titlesContainers": [".title", "h2"],
+        "timestampsConteiners": ["time.news-time"],
+        "summaryContainers": [".summary"],
+        "mainArticleContainer": ".news-article-item",
+        "authorContainer": "",
+        "videoContainers": ["a.video"],
+    }
+    data.update(overrides)
+    return ScrapeInformation(**data)  # type: ignore[arg-type]
+
+
+def test_compile_site_plan_normalizes_host_and_skips_empty_selectors() -> None:
+    plan = compile_site_plan(_scraper_info())
+
+    assert plan.host == "example.com"
+    assert len(plan.article_containers) == 1
+    assert plan.titles is not None
+    assert plan.titles.pattern == ".title, h2"
+    assert plan.author is None
+    assert len(plan.videos) == 1
+
+
+def test_sources_and_extractor_reuse_given_plans(monkeypatch) -> None:
+    calls: list[ScrapeInformation] = []
+
+    def fake_compile(info: ScrapeInformation):
+        calls.append(info)
+        return compile_site_plan(info)
+
+    monkeypatch.setattr(
+        "infrastructure.sources.web_scraper_source.compile_site_plan", fake_compile
+    )
+    monkeypatch.setattr(
+        "infrastructure.extraction.html_extractor.compile_site_plan", fake_compile
+    )
+
+    info = _scraper_info()
+    plans = [compile_site_plan(info)]
+
+    source = WebScraperSource("https://example.com", [info], site_plans=plans)
+    extractor = HtmlExtractor([info], site_plans=plans)
+
+    assert calls == []
+    assert source._site_plans == plans
+    assert extractor._site_plans["example.com"] is plans[0]
+
+
+async def test_extractor_without_author_selector_raises() -> None:
+    extractor = HtmlExtractor([_scraper_info()])
+
+    class _Response:
+        content = b"<article class='news-article-item'>Body</article>"
+
+    async def fake_get(*args, **kwargs):
+        return _Response()
+
+    extractor.client.get = fake_get  # type: ignore[method-assign]
+
+    with pytest.raises(Exception, match="no available article content"):
+        await extractor.extract(NewsItem(url="https://example.com/a", title="A"))
+
+    await extractor.close()
+
+
+def test_loader_compiles_plans_once_per_site(tmp_path) -> None:
+    (tmp_path / "example.json").write_text(
+        _scraper_info().model_dump_json(by_alias=True)
+    )
+
+    plans = NewsLoader(sites_dir=str(tmp_path)).load_site_plans()
+
+    assert [plan.host for plan in plans] == ["example.com"]
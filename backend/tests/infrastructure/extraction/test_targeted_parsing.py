@@ -0,0 +1,74 @@
+from domain.news.supported_html_parsers import SupportedHtmlParsers
+from domain.news.value_objects import ScrapeInformation
+from infrastructure.extraction.html_parser import parse_html
+from infrastructure.extraction.targeted_parsing import (
+    build_article_strainer,
+    compile_simple_selector,
+)
+
+HTML = b"""
+<html>
+<head><script>var tracking = 1;</script></head>
+<body>
+    <div class="ads"><p>Buy now</p></div>
+    <article class="news-article-item main">
+        <p>Article body</p>
+    </article>
+    <div class="author"><span class="name">Jane</span></div>
+    <time class="news-time">05/02/2026</time>
+    <section id="comments"><p>Comment</p></section>
+</body>
+</html>
+"""
+
+
+def _scraper_info(**overrides: object) -> ScrapeInformation:
+    data: dict[str, object] = {
+        "scrapingUrl": "https://example.com/",
+        "articleContainers": [".news"],
+        "titlesContainers": [".title"],
+        "timestampsConteiners": ["time.news-time"],
+        "summaryContainers": [".summary"],
+        "mainArticleContainer": ".news-article-item",
+        "authorContainer": ".author > .name",
+    }
+    data.update(overrides)
+    return ScrapeInformation(**data)  # type: ignore[arg-type]
+
+
+def test_compile_simple_selector_reads_leftmost_compound() -> None:
+    selector = compile_simple_selector("div.author.main#top > span.name")
+
+    assert selector is not None
+    assert selector.name == "div"
+    assert selector.classes == frozenset({"author", "main"})
+    assert selector.element_id == "top"
+
+
+def test_compile_simple_selector_rejects_context_dependent_selectors() -> None:
+    assert compile_simple_selector("li:first-child a") is None
+    assert compile_simple_selector("h1 + p") is None
+    assert compile_simple_selector("[itemprop='author']") is None
+    assert compile_simple_selector("*") is None
+
+
+def test_strained_parse_keeps_only_selected_subtrees() -> None:
+    strainer = build_article_strainer(_scraper_info())
+
+    soup = parse_html(HTML, SupportedHtmlParsers.LXML, parse_only=strainer)
+
+    article = soup.select_one(".news-article-item")
+    author = soup.select_one(".author > .name")
+    timestamp = soup.select_one("time.news-time")
+    assert article is not None and "Article body" in article.get_text()
+    assert author is not None and author.get_text() == "Jane"
+    assert timestamp is not None and timestamp.get_text() == "05/02/2026"
+    assert "Buy now" not in soup.get_text()
+    assert "Comment" not in soup.get_text()
+    assert soup.find("script") is None
+
+
+def test_build_article_strainer_falls_back_for_unsupported_selectors() -> None:
+    scraper_info = _scraper_info(mainArticleContainer="main > p:nth-of-type(2)")
+
+    assert build_article_strainer(scraper_info) is None
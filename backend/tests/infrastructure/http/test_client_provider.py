@@ -0,0 +1,31 @@
+import pytest
+
+from core.config import config
+from infrastructure.http.client_provider import HttpClientProvider, build_http_client
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_provider_reuses_one_client_until_closed() -> None:
+    provider = HttpClientProvider()
+
+    first = provider.get_client()
+    second = provider.get_client()
+
+    assert first is second
+
+    await provider.aclose()
+    third = provider.get_client()
+
+    assert first.is_closed
+    assert third is not first
+    await provider.aclose()
+
+
+async def test_build_http_client_applies_configured_headers() -> None:
+    client = build_http_client(headers={"Accept": "text/html"})
+
+    assert client.headers["User-Agent"] == config.media_http_user_agent
+    assert client.headers["Accept"] == "text/html"
+    assert client.follow_redirects is config.media_http_follow_redirects
+    await client.aclose()
@@ -0,0 +1,169 @@
+import httpx
+import pytest
+
+from domain.news.value_objects import RateLimitRules
+from infrastructure.http.rate_limiter import (
+    SKIP_RATE_LIMIT_EXTENSION,
+    HostRateLimiter,
+    RateLimitedTransport,
+    parse_retry_after,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: _FakeClock, **kwargs) -> HostRateLimiter:
+    return HostRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+async def test_acquire_allows_burst_then_spaces_requests() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, requests_per_second=2, burst=2)
+
+    for _ in range(4):
+        await limiter.acquire("example.com")
+
+    assert clock.sleeps == [0.5, 0.5]
+
+    # Other hosts have their own bucket.
+    await limiter.acquire("other.example.com")
+    assert len(clock.sleeps) == 2
+
+
+async def test_configure_applies_site_rules() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, requests_per_second=10, burst=5)
+
+    limiter.configure("example.com", RateLimitRules(requestsPerSecond=1, burst=1))
+    await limiter.acquire("example.com")
+    await limiter.acquire("example.com")
+
+    assert clock.sleeps == [1.0]
+
+
+async def test_throttling_backs_off_honours_retry_after_and_recovers() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(
+        clock,
+        requests_per_second=4,
+        burst=1,
+        backoff_factor=0.5,
+        recovery_step=0.25,
+    )
+
+    limiter.record_response("example.com", 429, retry_after="30")
+    assert limiter.get_rate("example.com") == 2
+
+    await limiter.acquire("example.com")
+    assert clock.sleeps == [30.0]
+
+    limiter.record_response("example.com", 503)
+    assert limiter.get_rate("example.com") == 1
+
+    for _ in range(5):
+        limiter.record_response("example.com", 200)
+    assert limiter.get_rate("example.com") == 4
+
+
+def test_parse_retry_after_reads_seconds_and_http_dates() -> None:
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412450) == 30
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+async def test_transport_reads_crawl_delay_once_and_records_responses() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, requests_per_second=10, burst=10)
+    requested_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_paths.append(request.url.path)
+        if request.url.path == "/robots.txt":
+            return httpx.Response(200, text="User-agent: *\nCrawl-delay: 2\n")
+        if request.url.path == "/busy":
+            return httpx.Response(429, headers={"Retry-After": "60"})
+        return httpx.Response(200, text="ok")
+
+    transport = RateLimitedTransport(httpx.MockTransport(handler), limiter)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("https://example.com/a")
+        await client.get("https://example.com/b")
+        await client.get("https://example.com/busy")
+        await client.get("https://example.com/c")
+
+    assert requested_paths == ["/robots.txt", "/a", "/b", "/busy", "/c"]
+    # Halved by the 429, then one recovery step of the 0.5 target.
+    assert limiter.get_rate("example.com") == pytest.approx(0.3)
+    assert clock.sleeps == pytest.approx([2.0, 2.0, 2.0, 60.0])
+
+
+async def test_transport_skips_robots_when_site_opts_out() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock)
+    limiter.configure("example.com", RateLimitRules(respectCrawlDelay=False))
+    requested_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_paths.append(request.url.path)
+        return httpx.Response(200)
+
+    transport = RateLimitedTransport(httpx.MockTransport(handler), limiter)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("https://example.com/a")
+
+    assert requested_paths == ["/a"]
+
+
+async def test_transport_treats_failed_robots_lookups_as_no_crawl_delay() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock)
+    requested_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/robots.txt":
+            raise httpx.ConnectError("robots.txt unreachable", request=request)
+        requested_paths.append(request.url.path)
+        return httpx.Response(200)
+
+    transport = RateLimitedTransport(httpx.MockTransport(handler), limiter)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("https://example.com/a")
+        await client.get("https://example.com/b")
+
+    assert requested_paths == ["/a", "/b"]
+    assert not limiter.needs_crawl_delay("example.com")
+
+
+async def test_transport_lets_bulk_downloads_skip_the_limiter() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, requests_per_second=1, burst=1)
+    requested_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_paths.append(request.url.path)
+        return httpx.Response(200)
+
+    transport = RateLimitedTransport(httpx.MockTransport(handler), limiter)
+    async with httpx.AsyncClient(transport=transport) as client:
+        for index in range(3):
+            await client.get(
+                f"https://cdn.example/{index}.ts",
+                extensions={SKIP_RATE_LIMIT_EXTENSION: True},
+            )
+
+    assert requested_paths == ["/0.ts", "/1.ts", "/2.ts"]
+    assert clock.sleeps == []
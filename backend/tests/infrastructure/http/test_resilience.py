@@ -0,0 +1,185 @@
+import random
+
+import httpx
+import pytest
+
+from core.errors import HostUnavailableError
+from infrastructure.http.resilience import (
+    SKIP_RETRIES_EXTENSION,
+    CircuitState,
+    HostCircuitBreaker,
+    ResilientTransport,
+    RetryPolicy,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _client(
+    handler, breaker: HostCircuitBreaker, clock: _FakeClock, max_attempts: int = 3
+) -> httpx.AsyncClient:
+    transport = ResilientTransport(
+        httpx.MockTransport(handler),
+        breaker,
+        RetryPolicy(
+            max_attempts=max_attempts,
+            base_delay_seconds=1,
+            max_delay_seconds=4,
+            rng=random.Random(0),
+        ),
+        sleep=clock.sleep,
+    )
+    return httpx.AsyncClient(transport=transport)
+
+
+def test_retry_delays_grow_exponentially_within_the_cap() -> None:
+    policy = RetryPolicy(
+        base_delay_seconds=1, max_delay_seconds=4, rng=random.Random(0)
+    )
+
+    for retry, ceiling in enumerate([1, 2, 4, 4, 4]):
+        assert 0 <= policy.get_delay(retry) <= ceiling
+
+
+async def test_get_is_retried_until_it_succeeds() -> None:
+    clock = _FakeClock()
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ConnectTimeout("timed out", request=request)
+        if calls == 2:
+            return httpx.Response(502)
+        return httpx.Response(200, text="ok")
+
+    async with _client(handler, HostCircuitBreaker(clock=clock), clock) as client:
+        response = await client.get("https://example.com/a")
+
+    assert response.status_code == 200
+    assert calls == 3
+    assert len(clock.sleeps) == 2
+
+
+async def test_non_idempotent_and_long_retry_after_are_not_retried() -> None:
+    clock = _FakeClock()
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "POST":
+            return httpx.Response(503)
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    async with _client(handler, HostCircuitBreaker(clock=clock), clock) as client:
+        assert (await client.post("https://example.com/a")).status_code == 503
+        assert (await client.get("https://example.com/b")).status_code == 429
+
+    assert calls == ["POST", "GET"]
+    assert clock.sleeps == []
+
+
+async def test_read_timeouts_are_not_retried() -> None:
+    clock = _FakeClock()
+    breaker = HostCircuitBreaker(failure_threshold=1, clock=clock)
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.ReadTimeout("slow", request=request)
+
+    async with _client(handler, breaker, clock) as client:
+        with pytest.raises(httpx.ReadTimeout):
+            await client.get("https://example.com/a")
+
+    assert calls == 1
+    assert clock.sleeps == []
+    assert breaker.get_state("example.com") is CircuitState.OPEN
+
+
+async def test_requests_retried_by_their_caller_are_sent_once() -> None:
+    clock = _FakeClock()
+    breaker = HostCircuitBreaker(failure_threshold=1, clock=clock)
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    async with _client(handler, breaker, clock) as client:
+        response = await client.get(
+            "https://example.com/a", extensions={SKIP_RETRIES_EXTENSION: True}
+        )
+
+    assert response.status_code == 503
+    assert calls == 1
+    assert breaker.get_state("example.com") is CircuitState.OPEN
+
+
+async def test_circuit_opens_fails_fast_and_closes_after_probe() -> None:
+    clock = _FakeClock()
+    breaker = HostCircuitBreaker(
+        failure_threshold=2, reset_timeout_seconds=30, clock=clock
+    )
+    host_is_down = True
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if host_is_down:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    async with _client(handler, breaker, clock, max_attempts=5) as client:
+        with pytest.raises(HostUnavailableError):
+            await client.get("https://example.com/a")
+
+        assert calls == 2
+        assert breaker.get_state("example.com") is CircuitState.OPEN
+
+        # Other hosts are not affected.
+        assert breaker.get_state("other.example.com") is CircuitState.CLOSED
+
+        clock.now += 30
+        host_is_down = False
+        response = await client.get("https://example.com/b")
+
+    assert response.status_code == 200
+    assert breaker.get_state("example.com") is CircuitState.CLOSED
+
+
+def test_half_open_allows_one_probe_and_reopens_on_failure() -> None:
+    clock = _FakeClock()
+    breaker = HostCircuitBreaker(
+        failure_threshold=1, reset_timeout_seconds=10, clock=clock
+    )
+
+    breaker.record_failure("example.com")
+    with pytest.raises(HostUnavailableError):
+        breaker.before_request("example.com")
+
+    clock.now += 10
+    breaker.before_request("example.com")
+    assert breaker.get_state("example.com") is CircuitState.HALF_OPEN
+    with pytest.raises(HostUnavailableError):
+        breaker.before_request("example.com")
+
+    breaker.record_failure("example.com")
+    assert breaker.get_state("example.com") is CircuitState.OPEN
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from infrastructure.media.downloaders.reorder_buffer import SegmentReorderBuffer
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_reorder_buffer_returns_segments_in_order() -> None:
+    buffer = SegmentReorderBuffer(capacity=4)
+
+    for index in (2, 0, 3, 1):
+        await buffer.put(index, f"segment-{index}".encode())
+
+    assert [await buffer.get() for _ in range(4)] == [
+        b"segment-0",
+        b"segment-1",
+        b"segment-2",
+        b"segment-3",
+    ]
+    assert len(buffer) == 0
+
+
+async def test_reorder_buffer_holds_back_segments_outside_the_window() -> None:
+    buffer = SegmentReorderBuffer(capacity=2)
+    await buffer.put(1, b"b")
+
+    blocked_put = asyncio.create_task(buffer.put(2, b"c"))
+    await asyncio.sleep(0)
+    assert not blocked_put.done()
+
+    # The next expected segment is always accepted.
+    await buffer.put(0, b"a")
+    assert await buffer.get() == b"a"
+
+    await asyncio.wait_for(blocked_put, timeout=1)
+    assert [await buffer.get(), await buffer.get()] == [b"b", b"c"]
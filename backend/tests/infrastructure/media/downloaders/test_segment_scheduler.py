@@ -0,0 +1,113 @@
+import asyncio
+
+import httpx
+import pytest
+
+from core.errors import HostUnavailableError
+from domain.media.value_objects import MediaDownloadableLink
+from infrastructure.http.resilience import RetryPolicy
+from infrastructure.media.downloaders.segment_scheduler import SegmentScheduler
+
+pytestmark = pytest.mark.anyio
+
+
+async def _no_sleep(_seconds: float) -> None:
+    return None
+
+
+def _segments(count: int, hosts: tuple[str, ...] = ("cdn.example",)) -> list:
+    return [
+        MediaDownloadableLink(
+            url=f"https://{hosts[index % len(hosts)]}/{index}.ts",
+            sequence_number=index,
+        )
+        for index in range(count)
+    ]
+
+
+async def test_scheduler_bounds_in_flight_and_dispatches_in_order() -> None:
+    scheduler = SegmentScheduler(max_in_flight=4, per_host_in_flight=3)
+    in_flight: dict[str, int] = {}
+    max_in_flight: dict[str, int] = {}
+    started: list[int] = []
+
+    async def download(index: int, segment: MediaDownloadableLink) -> int:
+        host = segment.url.split("/")[2]
+        started.append(index)
+        in_flight[host] = in_flight.get(host, 0) + 1
+        in_flight["*"] = in_flight.get("*", 0) + 1
+        for key in (host, "*"):
+            max_in_flight[key] = max(max_in_flight.get(key, 0), in_flight[key])
+
+        await asyncio.sleep(0.001)
+
+        in_flight[host] -= 1
+        in_flight["*"] -= 1
+        return index
+
+    segments = _segments(40, hosts=("a.example", "b.example"))
+    results = await scheduler.run(segments, download)
+
+    assert results == list(range(40))
+    assert started[:4] == [0, 1, 2, 3]
+    assert max_in_flight["*"] <= 4
+    assert max_in_flight["a.example"] <= 3
+    assert max_in_flight["b.example"] <= 3
+
+
+async def test_scheduler_retries_transient_failures() -> None:
+    scheduler = SegmentScheduler(
+        retry_policy=RetryPolicy(max_attempts=3), sleep=_no_sleep
+    )
+    attempts: dict[int, int] = {}
+
+    async def download(index: int, segment: MediaDownloadableLink) -> int:
+        attempts[index] = attempts.get(index, 0) + 1
+        if index == 1 and attempts[index] < 3:
+            raise httpx.ReadTimeout("slow", request=httpx.Request("GET", segment.url))
+        return index
+
+    assert await scheduler.run(_segments(3), download) == [0, 1, 2]
+    assert attempts == {0: 1, 1: 3, 2: 1}
+
+
+async def test_scheduler_raises_permanent_failures_without_retrying() -> None:
+    scheduler = SegmentScheduler(
+        retry_policy=RetryPolicy(max_attempts=3), sleep=_no_sleep
+    )
+    attempts = 0
+
+    async def download(index: int, segment: MediaDownloadableLink) -> int:
+        nonlocal attempts
+        attempts += 1
+        request = httpx.Request("GET", segment.url)
+        raise httpx.HTTPStatusError(
+            "missing", request=request, response=httpx.Response(404, request=request)
+        )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await scheduler.run(_segments(1), download)
+
+    assert attempts == 1
+
+
+async def test_scheduler_waits_for_open_circuits_before_retrying() -> None:
+    sleeps: list[float] = []
+
+    async def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    scheduler = SegmentScheduler(
+        retry_policy=RetryPolicy(max_attempts=2, max_delay_seconds=1), sleep=sleep
+    )
+    attempts = 0
+
+    async def download(index: int, segment: MediaDownloadableLink) -> int:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise HostUnavailableError("cdn.example", 30)
+        return index
+
+    assert await scheduler.run(_segments(1), download) == [0]
+    assert sleeps == [30]
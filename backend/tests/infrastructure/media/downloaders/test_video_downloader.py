@@ -1,10 +1,21 @@
+import asyncio
+import hashlib
+
 import pytest
 import httpx
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from core.config import config
 from domain.media.supported_media_types import SupportedStreamTypes
 from domain.media.value_objects import MediaDownloadableLink
+from infrastructure.http.resilience import (
+    HostCircuitBreaker,
+    ResilientTransport,
+    RetryPolicy,
+)
+from infrastructure.media.downloaders.download_journal import DownloadJournal
+from infrastructure.media.downloaders.segment_scheduler import SegmentScheduler
 from infrastructure.media.downloaders.video_downloader import VideoDownloader
 from infrastructure.media.resolvers.dash_mpd_resolver import DashMPDResolver
 
@@ -108,6 +119,314 @@ async def test_video_downloader_skips_sort_when_links_already_sorted(
     await client.aclose()
 
 
+def _ranged_handler(
+    payloads: dict[str, bytes], requests: list[httpx.Request], etag: str = '"v1"'
+):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        payload = payloads[str(request.url)]
+        headers = {"ETag": etag}
+        range_header = request.headers.get("Range")
+        if range_header is None or request.headers.get("If-Range") != etag:
+            return httpx.Response(status_code=200, content=payload, headers=headers)
+
+        start = int(range_header.removeprefix("bytes=").removesuffix("-"))
+        if start >= len(payload):
+            return httpx.Response(status_code=416, headers=headers)
+
+        return httpx.Response(status_code=206, content=payload[start:], headers=headers)
+
+    return handler
+
+
+def _downloader(tmp_path, urls: list[str], client) -> VideoDownloader:
+    return VideoDownloader(
+        path_to_download=tmp_path,
+        chunks_data=[
+            MediaDownloadableLink(url=url, sequence_number=index)
+            for index, url in enumerate(urls)
+        ],
+        stream_type=SupportedStreamTypes.HLS,
+        source_url="https://example.com/master.m3u8",
+        client=client,
+    )
+
+
+async def test_video_downloader_retries_segments_only_in_the_scheduler(
+    tmp_path,
+) -> None:
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code=503)
+
+    async def no_sleep(_seconds: float) -> None:
+        return None
+
+    client = httpx.AsyncClient(
+        transport=ResilientTransport(
+            httpx.MockTransport(handler),
+            HostCircuitBreaker(failure_threshold=100),
+            RetryPolicy(max_attempts=3),
+            sleep=no_sleep,
+        )
+    )
+    downloader = VideoDownloader(
+        path_to_download=tmp_path,
+        chunks_data=[
+            MediaDownloadableLink(url="https://example.com/0.ts", sequence_number=0)
+        ],
+        stream_type=SupportedStreamTypes.HLS,
+        source_url="https://example.com/master.m3u8",
+        client=client,
+        scheduler=SegmentScheduler(
+            retry_policy=RetryPolicy(max_attempts=4), sleep=no_sleep
+        ),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await downloader.download_video()
+
+    assert len(requests) == 4
+    await client.aclose()
+
+
+async def test_video_downloader_skips_segments_recorded_in_journal(tmp_path) -> None:
+    payloads = {
+        "https://example.com/chunk-0.ts": b"chunk-0",
+        "https://example.com/chunk-1.ts": b"chunk-1",
+    }
+    requests: list[httpx.Request] = []
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_ranged_handler(payloads, requests))
+    )
+
+    await _downloader(tmp_path, list(payloads), client).download_video()
+    (tmp_path / "00001_chunk.ts").write_bytes(b"torn")
+    downloaded_media = await _downloader(
+        tmp_path, list(payloads), client
+    ).download_video()
+
+    assert [str(request.url) for request in requests] == [
+        "https://example.com/chunk-0.ts",
+        "https://example.com/chunk-1.ts",
+        "https://example.com/chunk-1.ts",
+    ]
+    assert downloaded_media.chunks[1].file_path.read_bytes() == b"chunk-1"
+    assert len(DownloadJournal(tmp_path)) == 2
+    await client.aclose()
+
+
+async def test_video_downloader_resumes_partial_segments_with_range(tmp_path) -> None:
+    url = "https://example.com/chunk-0.ts"
+    payload = b"0123456789"
+    requests: list[httpx.Request] = []
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_ranged_handler({url: payload}, requests))
+    )
+    (tmp_path / "00000_chunk.ts.part").write_bytes(payload[:4])
+    (tmp_path / "00000_chunk.ts.part.validator").write_text('"v1"')
+
+    downloaded_media = await _downloader(tmp_path, [url], client).download_video()
+
+    file_path = downloaded_media.chunks[0].file_path
+    assert file_path.read_bytes() == payload
+    assert requests[0].headers["Range"] == "bytes=4-"
+    assert requests[0].headers["If-Range"] == '"v1"'
+    assert not (tmp_path / "00000_chunk.ts.part").exists()
+    assert not (tmp_path / "00000_chunk.ts.part.validator").exists()
+    entry = DownloadJournal(tmp_path, verify_checksums=True).get_completed(
+        url, file_path
+    )
+    assert entry is not None
+    assert entry.sha256 == hashlib.sha256(payload).hexdigest()
+    await client.aclose()
+
+
+async def test_video_downloader_restarts_partial_segments_that_do_not_fit(
+    tmp_path,
+) -> None:
+    url = "https://example.com/chunk-0.ts"
+    requests: list[httpx.Request] = []
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_ranged_handler({url: b"new"}, requests))
+    )
+    (tmp_path / "00000_chunk.ts.part").write_bytes(b"stale-bytes")
+    (tmp_path / "00000_chunk.ts.part.validator").write_text('"v1"')
+
+    downloaded_media = await _downloader(tmp_path, [url], client).download_video()
+
+    assert downloaded_media.chunks[0].file_path.read_bytes() == b"new"
+    assert [request.headers.get("Range") for request in requests] == [
+        "bytes=11-",
+        None,
+    ]
+    await client.aclose()
+
+
+async def test_video_downloader_restarts_partial_segments_that_changed(
+    tmp_path,
+) -> None:
+    url = "https://example.com/chunk-0.ts"
+    requests: list[httpx.Request] = []
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            _ranged_handler({url: b"0123456789"}, requests, etag='"v2"')
+        )
+    )
+    (tmp_path / "00000_chunk.ts.part").write_bytes(b"abcd")
+    (tmp_path / "00000_chunk.ts.part.validator").write_text('"v1"')
+
+    downloaded_media = await _downloader(tmp_path, [url], client).download_video()
+
+    assert downloaded_media.chunks[0].file_path.read_bytes() == b"0123456789"
+    assert [request.headers.get("If-Range") for request in requests] == ['"v1"']
+    await client.aclose()
+
+
+async def test_video_downloader_restarts_partial_segments_without_validator(
+    tmp_path,
+) -> None:
+    url = "https://example.com/chunk-0.ts"
+    requests: list[httpx.Request] = []
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_ranged_handler({url: b"0123456789"}, requests))
+    )
+    (tmp_path / "00000_chunk.ts.part").write_bytes(b"abcd")
+
+    downloaded_media = await _downloader(tmp_path, [url], client).download_video()
+
+    assert downloaded_media.chunks[0].file_path.read_bytes() == b"0123456789"
+    assert [request.headers.get("Range") for request in requests] == [None]
+    await client.aclose()
+
+
+async def test_video_downloader_fetches_large_files_in_parallel_ranges(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(config, "media_ranged_download_connections", 3)
+    monkeypatch.setattr(config, "media_ranged_download_min_bytes", 10)
+    url = "https://example.com/video.mp4"
+    payload = bytes(range(256)) * 4
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        start, end = request.headers["Range"].removeprefix("bytes=").split("-")
+        return httpx.Response(
+            status_code=206,
+            content=payload[int(start) : int(end) + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(payload)}"},
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    downloader = VideoDownloader(
+        path_to_download=tmp_path,
+        chunks_data=[
+            MediaDownloadableLink(
+                url=url, size_in_bytes=len(payload), supports_ranges=True
+            )
+        ],
+        stream_type=SupportedStreamTypes.DIRECT,
+        source_url=url,
+        client=client,
+    )
+
+    downloaded_media = await downloader.download_video()
+
+    assert downloaded_media.chunks[0].file_path.read_bytes() == payload
+    assert sorted(request.headers["Range"] for request in requests) == [
+        "bytes=0-341",
+        "bytes=342-683",
+        "bytes=684-1023",
+    ]
+    await client.aclose()
+
+
+async def test_video_downloader_falls_back_when_ranges_are_ignored(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(config, "media_ranged_download_min_bytes", 1)
+    url = "https://example.com/video.mp4"
+    client = _build_client({url: b"whole file"})
+    downloader = VideoDownloader(
+        path_to_download=tmp_path,
+        chunks_data=[
+            MediaDownloadableLink(url=url, size_in_bytes=10, supports_ranges=True)
+        ],
+        stream_type=SupportedStreamTypes.DIRECT,
+        source_url=url,
+        client=client,
+    )
+
+    downloaded_media = await downloader.download_video()
+
+    assert downloaded_media.chunks[0].file_path.read_bytes() == b"whole file"
+    await client.aclose()
+
+
+async def test_video_downloader_falls_back_when_ranges_start_elsewhere(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(config, "media_ranged_download_connections", 2)
+    monkeypatch.setattr(config, "media_ranged_download_min_bytes", 1)
+    url = "https://example.com/video.mp4"
+    payload = b"0123456789"
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if "Range" not in request.headers:
+            return httpx.Response(status_code=200, content=payload)
+
+        # Every range is answered from the start of the file.
+        start, end = request.headers["Range"].removeprefix("bytes=").split("-")
+        return httpx.Response(
+            status_code=206,
+            content=payload[: int(end) + 1 - int(start)],
+            headers={"Content-Range": f"bytes 0-{int(end) - int(start)}/10"},
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    downloader = VideoDownloader(
+        path_to_download=tmp_path,
+        chunks_data=[
+            MediaDownloadableLink(url=url, size_in_bytes=10, supports_ranges=True)
+        ],
+        stream_type=SupportedStreamTypes.DIRECT,
+        source_url=url,
+        client=client,
+    )
+
+    downloaded_media = await downloader.download_video()
+
+    assert downloaded_media.chunks[0].file_path.read_bytes() == payload
+    await client.aclose()
+
+
+async def test_video_downloader_streams_segments_in_order_without_disk(
+    tmp_path,
+) -> None:
+    urls = [f"https://example.com/{index}.ts" for index in range(6)]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        index = urls.index(str(request.url))
+        # Earlier segments answer last, so they finish out of order.
+        await asyncio.sleep(0.001 * (len(urls) - index))
+        return httpx.Response(status_code=200, content=f"<{index}>".encode())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    written: list[bytes] = []
+
+    async def write(data: bytes) -> None:
+        written.append(data)
+
+    await _downloader(tmp_path, urls, client).stream_video(write)
+
+    assert written == [f"<{index}>".encode() for index in range(6)]
+    assert list(tmp_path.iterdir()) == []
+    await client.aclose()
+
+
 @pytest.mark.skip()
 async def test_downloading_real_world_video() -> None:
     video_url = "https://media09.vbox7.com/sl/mi1WT9ID2u4XwTQEu-ygRA/1771192800/7d/7d4b25d085/7d4b25d085.mpd"
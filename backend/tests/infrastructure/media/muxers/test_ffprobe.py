@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from core.config import config
+from infrastructure.media.muxers.ffmpeg.ffprobe import (
+    MediaProbe,
+    ProbedFormat,
+    ProbedStream,
+    can_stream_copy,
+    probe_media,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class _ProcessStub:
+    def __init__(self, stdout: bytes, returncode: int = 0) -> None:
+        self.returncode = returncode
+        self._stdout = stdout
+
+    async def communicate(self) -> tuple[bytes, bytes]:
+        return self._stdout, b""
+
+
+def _probe(
+    video_codec: str = "h264", audio_codec: str = "aac", bit_rate: int | None = None
+) -> MediaProbe:
+    return MediaProbe(
+        streams=[
+            ProbedStream(codec_type="video", codec_name=video_codec),
+            ProbedStream(codec_type="audio", codec_name=audio_codec),
+            ProbedStream(codec_type="data", codec_name="timed_id3"),
+        ],
+        format=ProbedFormat(bit_rate=bit_rate),
+    )
+
+
+async def test_probe_media_reads_ffprobe_json(tmp_path, monkeypatch) -> None:
+    output = {
+        "programs": [],
+        "streams": [
+            {"codec_type": "video", "codec_name": "h264", "bit_rate": "N/A"},
+            {"codec_type": "audio", "codec_name": "aac", "bit_rate": "128000"},
+        ],
+        "format": {"bit_rate": "2400000"},
+    }
+
+    async def fake_subprocess_exec(*_args: str, **_kwargs: object) -> _ProcessStub:
+        return _ProcessStub(json.dumps(output).encode())
+
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.ffmpeg.ffprobe.asyncio.create_subprocess_exec",
+        fake_subprocess_exec,
+    )
+
+    probe = await probe_media(tmp_path / "segment.ts")
+
+    assert probe is not None
+    assert [stream.codec_name for stream in probe.video_streams] == ["h264"]
+    assert probe.bit_rate == 2_400_000
+
+
+async def test_probe_media_returns_none_when_ffprobe_fails(
+    tmp_path, monkeypatch
+) -> None:
+    async def fake_subprocess_exec(*_args: str, **_kwargs: object) -> _ProcessStub:
+        return _ProcessStub(b"", returncode=1)
+
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.ffmpeg.ffprobe.asyncio.create_subprocess_exec",
+        fake_subprocess_exec,
+    )
+
+    assert await probe_media(tmp_path / "segment.ts") is None
+
+
+def test_can_stream_copy_accepts_only_the_output_profile(monkeypatch) -> None:
+    monkeypatch.setattr(config, "ffmpeg_stream_copy_max_bit_rate", 5_000_000)
+
+    assert can_stream_copy(_probe(bit_rate=4_000_000))
+    assert not can_stream_copy(_probe(bit_rate=6_000_000))
+    assert not can_stream_copy(_probe(video_codec="hevc"))
+    assert not can_stream_copy(_probe(audio_codec="ac3"))
+    assert not can_stream_copy(MediaProbe())
+    assert not can_stream_copy(None)
+
+
+def test_can_stream_copy_rejects_unknown_bitrates_under_a_limit(monkeypatch) -> None:
+    monkeypatch.setattr(config, "ffmpeg_stream_copy_max_bit_rate", 5_000_000)
+    assert not can_stream_copy(_probe())
+
+    monkeypatch.setattr(config, "ffmpeg_stream_copy_max_bit_rate", None)
+    assert can_stream_copy(_probe())
@@ -5,11 +5,32 @@ import pytest
 
 from domain.media.supported_media_types import SupportedStreamTypes
 from domain.media.value_objects import DownloadedMedia, DownloadedMediaChunk
+from infrastructure.media.muxers.ffmpeg.ffprobe import MediaProbe, ProbedStream
 from infrastructure.media.muxers.video_muxer import VideoMuxer
 
 pytestmark = pytest.mark.anyio
 
 
+@pytest.fixture(autouse=True)
+def _probe_nothing(monkeypatch) -> None:
+    # ffprobe is not run in tests; without a probe the muxer transcodes.
+    async def probe_media(*_args: object) -> None:
+        return None
+
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.video_muxer.probe_media", probe_media
+    )
+
+
+def _compatible_probe() -> MediaProbe:
+    return MediaProbe(
+        streams=[
+            ProbedStream(codec_type="video", codec_name="h264", bit_rate=2_000_000),
+            ProbedStream(codec_type="audio", codec_name="aac"),
+        ]
+    )
+
+
 class _ProcessStub:
     def __init__(self, returncode: int = 0) -> None:
         self.returncode = returncode
@@ -104,3 +125,234 @@ async def test_video_muxer_uses_concat_for_multiple_chunks(
 
     assert "-f" in captured_args
     assert "concat" in captured_args
+
+
+class _StreamWriterStub:
+    def __init__(self) -> None:
+        self.data = b""
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    async def drain(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        return None
+
+
+class _StreamReaderStub:
+    async def read(self) -> bytes:
+        return b"ffmpeg log"
+
+
+class _PipedProcessStub:
+    def __init__(self, returncode: int = 0) -> None:
+        self.returncode = returncode
+        self.stdin = _StreamWriterStub()
+        self.stderr = _StreamReaderStub()
+        self.killed = False
+
+    async def wait(self) -> int:
+        return self.returncode
+
+    def kill(self) -> None:
+        self.killed = True
+
+
+async def test_video_muxer_pipes_streamed_segments_into_ffmpeg(
+    tmp_path, monkeypatch
+) -> None:
+    process = _PipedProcessStub()
+    captured_args: list[str] = []
+
+    async def fake_subprocess_exec(*args: str, **_kwargs: object):
+        captured_args.extend(list(args))
+        return process
+
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.ffmpeg.piped_stream_command.asyncio.create_subprocess_exec",
+        fake_subprocess_exec,
+    )
+
+    async def feed(write) -> None:
+        for segment in (b"init", b"-seg1", b"-seg2"):
+            await write(segment)
+
+    muxer = VideoMuxer(static_media_root=tmp_path / "static" / "media")
+    muxed_media = await muxer.mux_stream(
+        source_url="https://example.com/manifest.mpd",
+        stream_type=SupportedStreamTypes.DASH,
+        feed=feed,
+        output_file_name="streamed",
+    )
+
+    assert captured_args[captured_args.index("-i") + 1] == "pipe:0"
+    assert process.stdin.data == b"init-seg1-seg2"
+    assert process.stdin.closed
+    assert muxed_media.static_url_path == "/static/media/streamed.mp4"
+
+
+async def test_video_muxer_kills_ffmpeg_when_the_stream_fails(
+    tmp_path, monkeypatch
+) -> None:
+    process = _PipedProcessStub()
+
+    async def fake_subprocess_exec(*_args: str, **_kwargs: object):
+        return process
+
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.ffmpeg.piped_stream_command.asyncio.create_subprocess_exec",
+        fake_subprocess_exec,
+    )
+
+    async def feed(write) -> None:
+        await write(b"init")
+        raise ConnectionError("segment lost")
+
+    muxer = VideoMuxer(static_media_root=tmp_path / "static" / "media")
+    with pytest.raises(ConnectionError):
+        await muxer.mux_stream(
+            source_url="https://example.com/master.m3u8",
+            stream_type=SupportedStreamTypes.HLS,
+            feed=feed,
+        )
+
+    assert process.killed
+
+
+async def test_video_muxer_copies_streams_that_fit_the_output_profile(
+    tmp_path, monkeypatch
+) -> None:
+    input_chunk = tmp_path / "input.mp4"
+    input_chunk.write_bytes(b"video-data")
+    probed_paths: list[Path] = []
+
+    async def probe_media(input_path: Path, *_args: object) -> MediaProbe:
+        probed_paths.append(input_path)
+        return _compatible_probe()
+
+    captured_args: list[str] = []
+
+    async def fake_subprocess_exec(*args: str, **_kwargs: object) -> _ProcessStub:
+        captured_args.extend(list(args))
+        return _ProcessStub()
+
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.video_muxer.probe_media", probe_media
+    )
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.ffmpeg.ffmpeg_command.asyncio.create_subprocess_exec",
+        fake_subprocess_exec,
+    )
+
+    muxer = VideoMuxer(static_media_root=tmp_path / "static" / "media")
+    await muxer.mux(
+        DownloadedMedia(
+            source_url="https://example.com/video.mp4",
+            stream_type=SupportedStreamTypes.DIRECT,
+            chunks=[
+                DownloadedMediaChunk(
+                    source_url="https://example.com/video.mp4",
+                    file_path=input_chunk,
+                    sequence_number=1,
+                )
+            ],
+        ),
+        output_file_name="copied",
+    )
+
+    assert probed_paths == [input_chunk]
+    assert captured_args[captured_args.index("-c") + 1] == "copy"
+    assert "-crf" not in captured_args
+    assert "+faststart" in captured_args
+
+
+async def test_video_muxer_transcodes_when_stream_copy_fails(
+    tmp_path, monkeypatch
+) -> None:
+    input_chunk = tmp_path / "input.mp4"
+    input_chunk.write_bytes(b"video-data")
+
+    async def probe_media(*_args: object) -> MediaProbe:
+        return _compatible_probe()
+
+    commands: list[list[str]] = []
+
+    async def fake_subprocess_exec(*args: str, **_kwargs: object) -> _ProcessStub:
+        commands.append(list(args))
+        return _ProcessStub(returncode=1 if "copy" in args else 0)
+
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.video_muxer.probe_media", probe_media
+    )
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.ffmpeg.ffmpeg_command.asyncio.create_subprocess_exec",
+        fake_subprocess_exec,
+    )
+
+    muxer = VideoMuxer(static_media_root=tmp_path / "static" / "media")
+    await muxer.mux(
+        DownloadedMedia(
+            source_url="https://example.com/video.mp4",
+            stream_type=SupportedStreamTypes.DIRECT,
+            chunks=[
+                DownloadedMediaChunk(
+                    source_url="https://example.com/video.mp4",
+                    file_path=input_chunk,
+                    sequence_number=1,
+                )
+            ],
+        )
+    )
+
+    assert len(commands) == 2
+    assert "copy" in commands[0]
+    assert "-crf" in commands[1]
+
+
+async def test_video_muxer_transcodes_streamed_segments(tmp_path, monkeypatch) -> None:
+    probed_paths: list[Path] = []
+
+    async def probe_media(input_path: Path, *_args: object) -> MediaProbe:
+        probed_paths.append(input_path)
+        return _compatible_probe()
+
+    process = _PipedProcessStub()
+    captured_args: list[str] = []
+
+    async def fake_subprocess_exec(*args: str, **_kwargs: object):
+        captured_args.extend(list(args))
+        return process
+
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.video_muxer.probe_media", probe_media
+    )
+    monkeypatch.setattr(
+        "infrastructure.media.muxers.ffmpeg.piped_stream_command.asyncio.create_subprocess_exec",
+        fake_subprocess_exec,
+    )
+
+    async def feed(write) -> None:
+        await write(b"first")
+        await write(b"-second")
+
+    muxer = VideoMuxer(static_media_root=tmp_path / "static" / "media")
+    await muxer.mux_stream(
+        source_url="https://example.com/master.m3u8",
+        stream_type=SupportedStreamTypes.HLS,
+        feed=feed,
+        output_file_name="streamed",
+    )
+
+    # A failed stream copy could not fall back to a transcode of the
+    # segments already fed, so streams are never copied.
+    assert probed_paths == []
+    assert "copy" not in captured_args
+    assert "-crf" in captured_args
+    assert process.stdin.data == b"first-second"
+    assert list((tmp_path / "static" / "media").iterdir()) == []
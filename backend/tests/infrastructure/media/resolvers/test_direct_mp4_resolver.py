@@ -1,6 +1,7 @@
+import httpx
 import pytest
 
-from core.errors import DirectMediaInvalidUrlError
+from core.errors import DirectMediaInvalidUrlError, HostUnavailableError
 from domain.media.supported_media_types import SupportedStreamTypes
 from infrastructure.media.resolvers.direct_mp4_resolver import DirectMP4Resolver
 
@@ -38,3 +39,43 @@ async def test_direct_resolver_raises_custom_error_for_invalid_url() -> None:
 
     with pytest.raises(DirectMediaInvalidUrlError):
         await resolver.resolve_stream("not-a-valid-url")
+
+
+async def test_direct_resolver_probes_size_and_range_support() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/head.mp4":
+            return httpx.Response(
+                200, headers={"Content-Length": "2048", "Accept-Ranges": "bytes"}
+            )
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        if request.url.path == "/ranged.mp4":
+            return httpx.Response(
+                206, headers={"Content-Range": "bytes 0-0/4096"}, content=b"x"
+            )
+        return httpx.Response(200, content=b"whole file")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    resolver = DirectMP4Resolver(client=client)
+
+    head = (await resolver.resolve_stream("https://example.com/head.mp4")).links[0]
+    ranged = (await resolver.resolve_stream("https://example.com/ranged.mp4")).links[0]
+    plain = (await resolver.resolve_stream("https://example.com/plain.mp4")).links[0]
+
+    assert (head.size_in_bytes, head.supports_ranges) == (2048, True)
+    assert (ranged.size_in_bytes, ranged.supports_ranges) == (4096, True)
+    assert (plain.size_in_bytes, plain.supports_ranges) == (10, False)
+    await client.aclose()
+
+
+async def test_direct_resolver_resolves_without_probe_when_host_is_paused() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise HostUnavailableError(request.url.host, 30)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    resolver = DirectMP4Resolver(client=client)
+
+    link = (await resolver.resolve_stream("https://example.com/video.mp4")).links[0]
+
+    assert (link.size_in_bytes, link.supports_ranges) == (None, False)
+    await client.aclose()
@@ -0,0 +1,55 @@
+from xml.etree.ElementTree import ParseError
+
+import pytest
+
+from infrastructure.sources.feed_stream_parser import FeedStreamParser
+
+RSS = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel>
+<title>Channel title</title>
+<link>https://example.com/</link>
+<item><title>One</title><link>https://example.com/1</link></item>
+<item><title>Two</title><link>https://example.com/2</link></item>
+<item><link>https://example.com/untitled</link></item>
+</channel></rss>
+"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Feed title</title>
+<link href="https://example.com/"/>
+<entry>
+    <title>One</title>
+    <link rel="self" href="https://example.com/1.atom"/>
+    <link href="https://example.com/1"/>
+</entry>
+</feed>
+"""
+
+
+def test_stream_parser_yields_rss_items_as_they_complete() -> None:
+    parser = FeedStreamParser()
+    split_at = RSS.index(b"<item><title>Two")
+
+    first = parser.feed(RSS[:split_at])
+    rest = parser.feed(RSS[split_at:]) + parser.close()
+
+    assert [item.url for item in first] == ["https://example.com/1"]
+    assert [item.url for item in rest] == ["https://example.com/2"]
+
+
+def test_stream_parser_reads_atom_alternate_links() -> None:
+    parser = FeedStreamParser()
+
+    items = parser.feed(ATOM) + parser.close()
+
+    assert [(item.title, item.url) for item in items] == [
+        ("One", "https://example.com/1")
+    ]
+
+
+def test_stream_parser_raises_on_malformed_xml() -> None:
+    parser = FeedStreamParser()
+
+    with pytest.raises(ParseError, match="undefined entity"):
+        parser.feed(b"<rss><channel><item><title>&nbsp;</title></item>")
@@ -1,7 +1,10 @@
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 from domain.news.value_objects import ScrapeInformation
+from infrastructure.http.client_provider import http_client_provider
+from infrastructure.sources.feed_cache import FeedCache, FeedCacheEntry
 from infrastructure.sources.web_scraper_source import WebScraperSource
 
 pytestmark = pytest.mark.anyio
@@ -37,6 +40,8 @@ async def test_web_scraper_skips_items_with_missing_title():
     )
 
     mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = httpx.Headers()
     mock_response.content = html.encode("utf-8")
     source.client.get = AsyncMock(return_value=mock_response)
 
@@ -45,3 +50,105 @@ async def test_web_scraper_skips_items_with_missing_title():
     assert len(items) == 1
     assert items[0].title == "Valid Title"
     assert items[0].url == "https://example.com/valid"
+
+
+def _scraper_info() -> ScrapeInformation:
+    return ScrapeInformation(
+        scrapingUrl="https://example.com/",
+        articleContainers=[".article"],
+        titlesContainers=[".title"],
+        timestampsConteiners=[".timestamp"],
+        summaryContainers=[".summary"],
+        mainArticleContainer=".article-content",
+        authorContainer=".author",
+    )
+
+
+async def test_web_scraper_reuses_cached_items_on_not_modified(tmp_path):
+    html = """
+    <div class="article"><a href="/one"><span class="title">One</span></a></div>
+    """
+    received_headers: list[httpx.Headers] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        received_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+
+        return httpx.Response(200, text=html, headers={"ETag": '"v1"'})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    cache_path = tmp_path / "feed-cache.json"
+    source = WebScraperSource(
+        base_url="https://example.com/",
+        registered_scrapers=[_scraper_info()],
+        client=client,
+        feed_cache=FeedCache(cache_path),
+    )
+
+    first = await source.check_for_news()
+
+    restarted_source = WebScraperSource(
+        base_url="https://example.com/",
+        registered_scrapers=[_scraper_info()],
+        client=client,
+        feed_cache=FeedCache(cache_path),
+    )
+    second = await restarted_source.check_for_news()
+
+    assert "If-None-Match" not in received_headers[0]
+    assert received_headers[1]["If-None-Match"] == '"v1"'
+    assert [item.url for item in first] == ["https://example.com/one"]
+    assert second == first
+    await client.aclose()
+
+
+async def test_web_scraper_skips_parsing_for_identical_body(monkeypatch):
+    html = """
+    <div class="article"><a href="/one"><span class="title">One</span></a></div>
+    """
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=html)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    source = WebScraperSource(
+        base_url="https://example.com/",
+        registered_scrapers=[_scraper_info()],
+        client=client,
+    )
+
+    first = await source.check_for_news()
+
+    def _fail_if_parsed(*_args, **_kwargs):
+        raise AssertionError("unchanged page should not be parsed again")
+
+    monkeypatch.setattr(
+        "infrastructure.sources.web_scraper_source.parse_listing_page",
+        _fail_if_parsed,
+    )
+    second = await source.check_for_news()
+
+    assert second == first
+    await client.aclose()
+
+
+def test_web_scraper_defaults_to_the_shared_client() -> None:
+    source = WebScraperSource(
+        base_url="https://example.com/",
+        registered_scrapers=[_scraper_info()],
+    )
+
+    assert source.client is http_client_provider.get_client()
+
+
+async def test_feed_cache_persists_entries_for_the_next_process(tmp_path) -> None:
+    cache_path = tmp_path / "feed-cache.json"
+    cache = FeedCache(cache_path)
+    cache.store("https://example.com/", FeedCacheEntry(etag='"v1"'))
+
+    await cache.persist()
+
+    restarted_cache = FeedCache(cache_path)
+    assert restarted_cache.get("https://example.com/") == FeedCacheEntry(etag='"v1"')
+    assert not cache_path.with_name("feed-cache.json.tmp").exists()
@@ -1,3 +1,6 @@
+import asyncio
+
+import httpx
 import pytest
 from unittest.mock import MagicMock
 from domain.news.value_objects import RSSInformation
@@ -8,6 +11,13 @@ from feedparser import FeedParserDict
 pytestmark = pytest.mark.anyio
 
 
+def _feed_client(handler=None) -> httpx.AsyncClient:
+    async def default_handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"<rss></rss>")
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler or default_handler))
+
+
 async def test_rss_source_check_for_news(monkeypatch):
     # Mock feedparser.parse
     mock_feed = FeedParserDict()
@@ -31,7 +41,9 @@ async def test_rss_source_check_for_news(monkeypatch):
 
     # Initialize RSSNewsSource
     source = RSSNewsSource(
-        base_url="http://example.com", registered_rss_feeds=[rss_info]
+        base_url="http://example.com",
+        registered_rss_feeds=[rss_info],
+        client=_feed_client(),
     )
 
     # Run check_for_news
@@ -63,7 +75,9 @@ async def test_rss_source_deduplication(monkeypatch):
 
     rss_info = RSSInformation(rssFeed="http://example.com/feed")
     source = RSSNewsSource(
-        base_url="http://example.com", registered_rss_feeds=[rss_info]
+        base_url="http://example.com",
+        registered_rss_feeds=[rss_info],
+        client=_feed_client(),
     )
 
     news_items = await source.check_for_news()
@@ -73,6 +87,160 @@ async def test_rss_source_deduplication(monkeypatch):
     assert news_items[0].url == "http://example.com/1"
 
 
+async def test_rss_source_sends_validators_and_reuses_items_on_304(monkeypatch):
+    fresh_feed = FeedParserDict(status=200)
+    fresh_feed.entries = [  # type: ignore
+        FeedParserDict(title="Test Title 1", link="http://example.com/1"),
+    ]
+
+    mock_parse = MagicMock(return_value=fresh_feed)
+    monkeypatch.setattr(
+        "infrastructure.sources.rss_source.feedparser.parse", mock_parse
+    )
+
+    received_headers: list[httpx.Headers] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        received_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+
+        return httpx.Response(200, content=b"<rss></rss>", headers={"ETag": '"v1"'})
+
+    rss_info = RSSInformation(rssFeed="http://example.com/feed")
+    source = RSSNewsSource(
+        base_url="http://example.com",
+        registered_rss_feeds=[rss_info],
+        client=_feed_client(handler),
+    )
+
+    first = await source.check_for_news()
+    second = await source.check_for_news()
+
+    assert "If-None-Match" not in received_headers[0]
+    assert received_headers[1]["If-None-Match"] == '"v1"'
+    assert mock_parse.call_count == 1
+    assert mock_parse.call_args.args[0] == b"<rss></rss>"
+    assert second == first
+    assert second[0].url == "http://example.com/1"
+
+
+async def test_rss_source_fetches_feeds_concurrently_with_timeout(monkeypatch):
+    def fake_parse(content: bytes, **_kwargs):
+        feed = FeedParserDict()
+        feed.entries = [  # type: ignore
+            FeedParserDict(title=content.decode(), link=f"http://{content.decode()}/1")
+        ]
+        return feed
+
+    monkeypatch.setattr(
+        "infrastructure.sources.rss_source.feedparser.parse", fake_parse
+    )
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            if request.url.host == "slow.example.com":
+                await asyncio.sleep(5)
+            else:
+                await asyncio.sleep(0.05)
+        finally:
+            in_flight -= 1
+
+        return httpx.Response(200, content=request.url.host.encode())
+
+    source = RSSNewsSource(
+        base_url="http://example.com",
+        registered_rss_feeds=[
+            RSSInformation(rssFeed="http://a.example.com/feed"),
+            RSSInformation(rssFeed="http://b.example.com/feed"),
+            RSSInformation(rssFeed="http://slow.example.com/feed"),
+        ],
+        client=_feed_client(handler),
+        feed_timeout_seconds=0.2,
+    )
+
+    news_items = await source.check_for_news()
+
+    assert max_in_flight == 3
+    assert sorted(item.url for item in news_items) == [
+        "http://a.example.com/1",
+        "http://b.example.com/1",
+    ]
+
+
+def _rss_bytes(count: int) -> bytes:
+    items = "".join(
+        f"<item><title>Title {i}</title><link>http://example.com/{i}</link></item>"
+        for i in range(count)
+    )
+    return f"<rss><channel>{items}</channel></rss>".encode()
+
+
+async def test_rss_source_streaming_stops_at_known_entries(monkeypatch):
+    monkeypatch.setattr(
+        "infrastructure.sources.rss_source.config.rss_stream_known_run_length", 2
+    )
+    known = {f"http://example.com/{i}" for i in range(3, 200)}
+    filtered_batches: list[list[str]] = []
+
+    async def unknown_urls_filter(urls: list[str]) -> set[str]:
+        filtered_batches.append(urls)
+        return {url for url in urls if url not in known}
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_rss_bytes(200))
+
+    source = RSSNewsSource(
+        base_url="http://example.com",
+        registered_rss_feeds=[
+            RSSInformation(rssFeed="http://example.com/feed", streamingParse=True)
+        ],
+        client=_feed_client(handler),
+        unknown_urls_filter=unknown_urls_filter,
+    )
+
+    news_items = await source.check_for_news()
+
+    assert [item.url for item in news_items] == [
+        f"http://example.com/{i}" for i in range(6)
+    ]
+    assert len(filtered_batches) == 3
+
+
+async def test_rss_source_streaming_falls_back_to_feedparser(monkeypatch):
+    lenient_feed = FeedParserDict()
+    lenient_feed.entries = [  # type: ignore
+        FeedParserDict(title="Test Title 1", link="http://example.com/1"),
+    ]
+    mock_parse = MagicMock(return_value=lenient_feed)
+    monkeypatch.setattr(
+        "infrastructure.sources.rss_source.feedparser.parse", mock_parse
+    )
+    body = b"<rss><channel><item><title>&nbsp;</title></item></channel></rss>"
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body)
+
+    source = RSSNewsSource(
+        base_url="http://example.com",
+        registered_rss_feeds=[
+            RSSInformation(rssFeed="http://example.com/feed", streamingParse=True)
+        ],
+        client=_feed_client(handler),
+    )
+
+    news_items = await source.check_for_news()
+
+    assert mock_parse.call_args.args[0] == body
+    assert [item.url for item in news_items] == ["http://example.com/1"]
+
+
 async def test_bta_rss():
     loader = NewsLoader()
     _, rss_feeds = loader.load_scrapers_data()